@@ -0,0 +1,65 @@
+/**
+ * Tests for utils/json-file-cache.js
+ *
+ * Run with: node __tests__/utils/json-file-cache.test.js
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { readJsonCached, clearJsonCache } = require('../../utils/json-file-cache');
+
+let passed = 0;
+let failed = 0;
+
+function test(name, fn) {
+  try {
+    fn();
+    passed++;
+    console.log(`  ✅ ${name}`);
+  } catch (error) {
+    failed++;
+    console.log(`  ❌ ${name}`);
+    console.log(`     ${error.message}`);
+  }
+}
+
+function expect(value, expected) {
+  if (value !== expected) {
+    throw new Error(`Expected "${expected}" but got "${value}"`);
+  }
+}
+
+console.log('\n📦 Testing utils/json-file-cache.js\n');
+
+const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'json-cache-'));
+const file = path.join(dir, 'config.json');
+
+test('returns the same parsed object while the file is unchanged', () => {
+  fs.writeFileSync(file, JSON.stringify({ a: 1 }));
+  const first = readJsonCached(file);
+  expect(first.a, 1);
+  expect(readJsonCached(file), first);
+});
+
+test('reparses after the file changes', () => {
+  fs.writeFileSync(file, JSON.stringify({ a: 22 }));
+  const later = new Date(Date.now() + 5000);
+  fs.utimesSync(file, later, later);
+  expect(readJsonCached(file).a, 22);
+});
+
+test('clearJsonCache forces a fresh parse', () => {
+  const before = readJsonCached(file);
+  clearJsonCache(file);
+  const after = readJsonCached(file);
+  expect(after === before, false);
+  expect(after.a, 22);
+});
+
+fs.rmSync(dir, { recursive: true, force: true });
+
+console.log('\n' + '='.repeat(60));
+console.log(`📊 Test Results: ${passed} passed, ${failed} failed`);
+console.log('='.repeat(60) + '\n');
+process.exit(failed === 0 ? 0 : 1);
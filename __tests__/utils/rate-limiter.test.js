@@ -0,0 +1,100 @@
+/**
+ * Tests for utils/rate-limiter.js
+ *
+ * Run with: node __tests__/utils/rate-limiter.test.js
+ */
+
+const { RateLimiter } = require('../../utils/rate-limiter');
+
+// Simple async test framework
+class TestRunner {
+  constructor() {
+    this.passed = 0;
+    this.failed = 0;
+    this.errors = [];
+  }
+
+  async test(name, fn) {
+    try {
+      await fn();
+      this.passed++;
+      console.log(`  ✅ ${name}`);
+    } catch (error) {
+      this.failed++;
+      this.errors.push({ test: name, error: error.message });
+      console.log(`  ❌ ${name}`);
+      console.log(`     ${error.message}`);
+    }
+  }
+
+  expect(value) {
+    return {
+      toBe(expected) {
+        if (value !== expected) {
+          throw new Error(`Expected "${expected}" but got "${value}"`);
+        }
+      },
+      toBeLessThan(expected) {
+        if (value >= expected) {
+          throw new Error(`Expected ${value} to be less than ${expected}`);
+        }
+      },
+      toBeGreaterThanOrEqual(expected) {
+        if (value < expected) {
+          throw new Error(`Expected ${value} to be >= ${expected}`);
+        }
+      },
+    };
+  }
+
+  printResults() {
+    console.log('\n' + '='.repeat(60));
+    console.log(`📊 Test Results: ${this.passed} passed, ${this.failed} failed`);
+    if (this.failed === 0) {
+      console.log('🎉 All tests passed!');
+    }
+    console.log('='.repeat(60) + '\n');
+    return this.failed === 0;
+  }
+}
+
+(async () => {
+  const runner = new TestRunner();
+
+  console.log('\n📦 Testing utils/rate-limiter.js\n');
+
+  await runner.test('allows a burst up to maxRate without waiting', async () => {
+    const limiter = new RateLimiter(3, 1000);
+    const start = Date.now();
+    await Promise.all([limiter.acquire(), limiter.acquire(), limiter.acquire()]);
+    runner.expect(Date.now() - start).toBeLessThan(50);
+    runner.expect(limiter.available()).toBe(0);
+  });
+
+  await runner.test('delays callers once the window is full', async () => {
+    const limiter = new RateLimiter(1, 100);
+    const start = Date.now();
+    await limiter.acquire();
+    await limiter.acquire();
+    runner.expect(Date.now() - start).toBeGreaterThanOrEqual(95);
+  });
+
+  await runner.test('serves concurrent waiters in FIFO order', async () => {
+    const limiter = new RateLimiter(1, 30);
+    const order = [];
+    await Promise.all([1, 2, 3].map((n) => limiter.acquire().then(() => order.push(n))));
+    runner.expect(order.join(',')).toBe('1,2,3');
+  });
+
+  await runner.test('frees slots after the window elapses', async () => {
+    const limiter = new RateLimiter(2, 50);
+    await limiter.acquire();
+    await limiter.acquire();
+    runner.expect(limiter.available()).toBe(0);
+    await new Promise((resolve) => setTimeout(resolve, 60));
+    runner.expect(limiter.available()).toBe(2);
+  });
+
+  const success = runner.printResults();
+  process.exit(success ? 0 : 1);
+})();
@@ -26,7 +26,7 @@
  * @var {Object} pendingVerifications - Map of messageId -> verification data
  * @var {Object} pendingClosures - Map of messageId -> closure confirmation data
  * @var {Object} confirmationMessages - Map of threadId -> confirmation message IDs
- * @var {Number} lastSheetCall - Timestamp of last Google Sheets API call (rate limiting)
+ * @var {RateLimiter} sheetLimiter - Sliding-window limiter for Google Sheets API calls
  *
  * MAIN EXPORTED FUNCTIONS:
  * ------------------------
@@ -55,7 +55,9 @@
  */
 
 const { EmbedBuilder } = require("discord.js");
+const { performance } = require('perf_hooks');
 const { SheetAPI } = require('./utils/sheet-api');
+const { RateLimiter } = require('./utils/rate-limiter');
 const bossRotation = require('./boss-rotation.js');
 const { getBossImageAttachment, getBossImageAttachmentURL } = require('./utils/boss-images');
 const { addGuildFooter } = require('./utils/embed-branding');
@@ -91,7 +93,19 @@ let activeColumns = {};         // Boss|timestamp to threadId mapping for dedupl
 let pendingVerifications = {};  // Message IDs awaiting admin verification
 let pendingClosures = {};       // Message IDs awaiting closure confirmation
 let confirmationMessages = {};  // Thread IDs to confirmation message IDs
-let lastSheetCall = 0;          // Timestamp of last Google Sheets API call
+
+/**
+ * Extracts the member name from bot "**Name** verified by Admin" replies.
+ * Compiled once at module load; used per message during state recovery.
+ */
+const VERIFIED_BY_RE = /\*\*(.+?)\*\* verified by/;
+
+/**
+ * Maximum threads scanned concurrently during state recovery.
+ * Each scan fetches message history and members, so keep this low to stay
+ * well inside Discord's global rate limit on restarts with many open spawns.
+ */
+const RECOVERY_CONCURRENCY = 5;
 
 /**
  * Timing constants for rate limiting and retry logic
@@ -107,6 +121,12 @@ const TIMING = {
   THREAD_AGE_CHECK_INTERVAL: 90000,   // Check thread age every 90 seconds (optimized from 60s)
 };
 
+/**
+ * Rate limiter for Google Sheets API calls (one call per MIN_SHEET_DELAY window).
+ * Callers under budget go straight through; concurrent callers queue in FIFO order.
+ */
+const sheetLimiter = new RateLimiter(1, TIMING.MIN_SHEET_DELAY);
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // MODULE INITIALIZATION
 // ═══════════════════════════════════════════════════════════════════════════════
@@ -135,6 +155,18 @@ function initialize(cfg, bossPointsData, isAdmin, cache = null, intelligence = n
   console.log("✅ Attendance module initialized");
 }
 
+/**
+ * Releases the module's Google Sheets connection pool.
+ * Called from the bot's shutdown handlers so keep-alive sockets close cleanly.
+ *
+ * @returns {Promise<void>}
+ */
+async function shutdown() {
+  if (sheetAPI) {
+    await sheetAPI.close();
+  }
+}
+
 /**
  * Wrapper function for boss name matching using the module's boss points data.
  * Performs fuzzy matching to handle variations in boss name input.
@@ -150,20 +182,201 @@ function findBossMatch(input) {
   return findBossMatchUtil(input, bossPoints);
 }
 
+/**
+ * Gets the point value for a spawn.
+ * Points are resolved once when the spawn is created or recovered and kept on
+ * spawnInfo; spawns restored from older saved state are filled in on first use.
+ *
+ * @param {Object} spawnInfo - Spawn data with a boss name
+ * @returns {number} Points awarded for the spawn (0 if the boss is unknown)
+ */
+function getSpawnPoints(spawnInfo) {
+  if (spawnInfo.points === undefined) {
+    spawnInfo.points = bossPoints[spawnInfo.boss]?.points ?? 0;
+  }
+  return spawnInfo.points;
+}
+
+// ═══════════════════════════════════════════════════════════════════════════════
+// VERIFIED MEMBER LOOKUP
+// ═══════════════════════════════════════════════════════════════════════════════
+
+/**
+ * Normalized-name index per spawn: spawnInfo -> { members, count, names }.
+ * Kept in a WeakMap (not on spawnInfo) so it is never serialized with state
+ * and is dropped automatically when the spawn is deleted. The index is rebuilt
+ * whenever spawnInfo.members is replaced or changes length outside these helpers.
+ */
+const memberIndex = new WeakMap();
+
+/**
+ * Returns the normalized-username Set for a spawn, rebuilding it if stale.
+ *
+ * @param {Object} spawnInfo - Spawn data with a members array
+ * @returns {Set<string>} Normalized usernames of verified members
+ */
+function getMemberIndex(spawnInfo) {
+  let entry = memberIndex.get(spawnInfo);
+  if (!entry || entry.members !== spawnInfo.members || entry.count !== spawnInfo.members.length) {
+    entry = {
+      members: spawnInfo.members,
+      count: spawnInfo.members.length,
+      names: new Set(spawnInfo.members.map(normalizeUsername)),
+    };
+    memberIndex.set(spawnInfo, entry);
+  }
+  return entry.names;
+}
+
+/**
+ * Checks whether a username is already verified for a spawn in O(1).
+ * Uses the same normalization as normalizeUsername().
+ *
+ * @param {Object} spawnInfo - Spawn data with a members array
+ * @param {string} username - Username to check
+ * @param {string} [key] - Precomputed normalizeUsername(username), e.g. pending.authorKey
+ * @returns {boolean} True if the member is already verified
+ *
+ * @example
+ * if (isMemberVerified(spawnInfo, "PlayerName")) {
+ *   await message.reply("You already checked in for this spawn.");
+ * }
+ */
+function isMemberVerified(spawnInfo, username, key = normalizeUsername(username)) {
+  return getMemberIndex(spawnInfo).has(key);
+}
+
+/**
+ * Adds a verified member to a spawn unless already present.
+ * Keeps spawnInfo.members (ordered, persisted) and the lookup index in sync.
+ *
+ * @param {Object} spawnInfo - Spawn data with a members array
+ * @param {string} username - Username to add
+ * @param {string} [key] - Precomputed normalizeUsername(username), e.g. pending.authorKey
+ * @returns {boolean} True if added, false if it was a duplicate
+ */
+function addVerifiedMember(spawnInfo, username, key = normalizeUsername(username)) {
+  const names = getMemberIndex(spawnInfo);
+  if (names.has(key)) return false;
+
+  spawnInfo.members.push(username);
+  names.add(key);
+  memberIndex.get(spawnInfo).count = spawnInfo.members.length;
+  return true;
+}
+
+// ═══════════════════════════════════════════════════════════════════════════════
+// PENDING VERIFICATION INDEX
+// ═══════════════════════════════════════════════════════════════════════════════
+
+/**
+ * Secondary index over pendingVerifications: threadId -> Set of message IDs.
+ * Lets thread-scoped lookups (spawn close, bulk verify) skip a full scan.
+ * Rebuilt whenever pendingVerifications is replaced (state load, setters).
+ * Each entry also carries authorKey (normalized author) so verification paths
+ * never re-normalize the name on the hot reaction/button path.
+ */
+let pendingByThread = new Map();
+let indexedVerifications = null; // pendingVerifications object the index was built for
+
+/**
+ * Returns the thread index, rebuilding it if pendingVerifications was replaced.
+ *
+ * @returns {Map<string, Set<string>>} threadId -> pending message IDs
+ */
+function getPendingIndex() {
+  if (indexedVerifications !== pendingVerifications) {
+    pendingByThread = new Map();
+    for (const [msgId, entry] of Object.entries(pendingVerifications)) {
+      if (entry.authorKey === undefined) entry.authorKey = normalizeUsername(entry.author);
+      if (!pendingByThread.has(entry.threadId)) pendingByThread.set(entry.threadId, new Set());
+      pendingByThread.get(entry.threadId).add(msgId);
+    }
+    indexedVerifications = pendingVerifications;
+  }
+  return pendingByThread;
+}
+
+/**
+ * Stores a pending verification and indexes it by thread.
+ * Fills in entry.authorKey if the caller has not already normalized the author.
+ *
+ * @param {string} msgId - Check-in message ID
+ * @param {Object} entry - Verification data (must include threadId and author)
+ */
+function addPendingVerification(msgId, entry) {
+  const index = getPendingIndex();
+  if (entry.authorKey === undefined) entry.authorKey = normalizeUsername(entry.author);
+  const existing = pendingVerifications[msgId];
+  if (existing && existing.threadId !== entry.threadId) removePendingVerification(msgId);
+
+  pendingVerifications[msgId] = entry;
+  if (!index.has(entry.threadId)) index.set(entry.threadId, new Set());
+  index.get(entry.threadId).add(msgId);
+}
+
+/**
+ * Removes a pending verification and its thread index entry.
+ *
+ * @param {string} msgId - Check-in message ID
+ * @returns {boolean} True if an entry was removed
+ */
+function removePendingVerification(msgId) {
+  const entry = pendingVerifications[msgId];
+  if (!entry) return false;
+
+  const index = getPendingIndex();
+  delete pendingVerifications[msgId];
+  const ids = index.get(entry.threadId);
+  if (ids) {
+    ids.delete(msgId);
+    if (ids.size === 0) index.delete(entry.threadId);
+  }
+  return true;
+}
+
+/**
+ * Gets all pending verifications for a thread without scanning every entry.
+ *
+ * @param {string} threadId - Spawn thread ID
+ * @returns {Array<[string, Object]>} [msgId, verification] pairs
+ *
+ * @example
+ * for (const [msgId, pending] of getPendingInThread(thread.id)) {
+ *   addVerifiedMember(spawnInfo, pending.author, pending.authorKey);
+ * }
+ */
+function getPendingInThread(threadId) {
+  const ids = getPendingIndex().get(threadId);
+  if (!ids) return [];
+
+  const result = [];
+  for (const msgId of ids) {
+    const entry = pendingVerifications[msgId];
+    // Drop IDs deleted directly from pendingVerifications
+    if (entry && entry.threadId === threadId) result.push([msgId, entry]);
+    else ids.delete(msgId);
+  }
+  if (ids.size === 0) pendingByThread.delete(threadId);
+  return result;
+}
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // GOOGLE SHEETS INTEGRATION
 // ═══════════════════════════════════════════════════════════════════════════════
 
 /**
  * Posts data to Google Sheets via webhook with rate limiting and retry logic.
- * Implements automatic rate limiting (MIN_SHEET_DELAY) and handles 429 errors with exponential backoff.
+ * Calls are gated by a sliding-window rate limiter (one per MIN_SHEET_DELAY) and 429 errors
+ * are handled with exponential backoff by SheetAPI.
  *
  * @param {Object} payload - Data payload to send to Google Sheets
  * @param {string} payload.action - Action type (e.g., "checkColumn", "addMember", "createColumn")
  * @param {number} [retryCount=0] - Current retry attempt number (internal use for recursion)
- * @returns {Promise<Object>} Response object containing ok, status, and text/error
+ * @returns {Promise<Object>} Response object containing ok, status, data and text/error
  * @returns {boolean} return.ok - Whether the request succeeded
  * @returns {number} return.status - HTTP status code
+ * @returns {Object} return.data - Parsed response from Google Sheets
  * @returns {string} return.text - Response text from Google Sheets
  *
  * @example
@@ -176,36 +389,89 @@ function findBossMatch(input) {
  */
 async function postToSheet(payload, retryCount = 0) {
   try {
-    // Rate limiting: ensure minimum delay between API calls
-    const now = Date.now();
-    const timeSinceLastCall = now - lastSheetCall;
-    if (timeSinceLastCall < TIMING.MIN_SHEET_DELAY) {
-      const waitTime = TIMING.MIN_SHEET_DELAY - timeSinceLastCall;
-      await new Promise((resolve) => setTimeout(resolve, waitTime));
-    }
-
-    lastSheetCall = Date.now();
+    // Rate limiting: wait only if the MIN_SHEET_DELAY window is already used
+    await sheetLimiter.acquire();
 
     // Make the API call using SheetAPI (handles retries automatically)
     const { action, ...data } = payload;
     const result = await sheetAPI.call(action, data);
 
-    return { ok: true, status: 200, text: JSON.stringify(result) };
+    // text is only read on error paths; serialize it on demand rather than per call
+    return {
+      ok: true,
+      status: 200,
+      data: result,
+      get text() {
+        return JSON.stringify(result);
+      },
+    };
   } catch (err) {
     console.error("❌ Webhook error:", err);
     return { ok: false, err: err.toString() };
   }
 }
 
+/**
+ * Submits a spawn's full member list to Google Sheets in a single webhook call.
+ * All close paths go through here so a close is always one POST, never one per member.
+ * A successful submit also marks the column as existing in the column check cache.
+ *
+ * @param {Object} spawnInfo - Spawn data (boss, date, time, timestamp, members)
+ * @param {boolean} [overwrite=false] - Replace an existing column instead of creating one
+ * @returns {Promise<Object>} postToSheet response ({ ok, status, text } or { ok, err })
+ *
+ * @example
+ * const resp = await submitSpawnAttendance(spawnInfo);
+ * if (!resp.ok) console.error(`Submit failed: ${resp.err}`);
+ */
+async function submitSpawnAttendance(spawnInfo, overwrite = false) {
+  const resp = await postToSheet({
+    action: overwrite ? "overwriteAttendance" : "submitAttendance",
+    boss: spawnInfo.boss,
+    date: spawnInfo.date,
+    time: spawnInfo.time,
+    timestamp: spawnInfo.timestamp,
+    members: spawnInfo.members,
+  });
+
+  if (resp.ok) {
+    const cacheKey = `${spawnInfo.boss.toUpperCase()}|${normalizeTimestamp(spawnInfo.timestamp)}`;
+    columnCheckCache.set(cacheKey, { exists: true, cachedAt: performance.now() });
+  }
+  return resp;
+}
+
 // Column check cache: Reduces redundant Google Sheets API calls during attendance window
-// Cache format: Map<"boss|timestamp", {exists: boolean, cachedAt: timestamp}>
+// Cache format: Map<"boss|timestamp", {exists: boolean, cachedAt: monotonic ms (performance.now())}>
+// Positive answers are stable, so they live longer; negative answers flip as soon as
+// attendance is submitted, so they only short-circuit bursts of repeat checks.
 const columnCheckCache = new Map();
-const COLUMN_CHECK_CACHE_TTL = 5 * 60 * 1000; // 5 minutes
+const COLUMN_CHECK_CACHE_TTL = 5 * 60 * 1000;   // 5 minutes (column exists)
+const COLUMN_CHECK_NEGATIVE_TTL = 30 * 1000;    // 30 seconds (column missing)
+const COLUMN_CHECK_CACHE_PRUNE_SIZE = 128;      // Sweep expired entries once the map grows past this
+
+/**
+ * Removes expired entries from the column check cache.
+ * Only called once the cache grows past COLUMN_CHECK_CACHE_PRUNE_SIZE, so the
+ * sweep cost is amortized across many lookups.
+ *
+ * @param {number} now - Current monotonic time in milliseconds (performance.now())
+ * @returns {void}
+ */
+function pruneColumnCheckCache(now) {
+  for (const [key, entry] of columnCheckCache) {
+    const ttl = entry.exists ? COLUMN_CHECK_CACHE_TTL : COLUMN_CHECK_NEGATIVE_TTL;
+    if (now - entry.cachedAt >= ttl) {
+      columnCheckCache.delete(key);
+    }
+  }
+}
 
 /**
  * Checks if a column already exists for a specific boss spawn to prevent duplicates.
  * First checks local cache (activeColumns), then short-term API result cache,
  * then queries Google Sheets if needed. Uses normalized timestamps to handle format variations.
+ * Failed or unparseable webhook responses are never cached.
  *
  * @param {string} boss - Boss name to check
  * @param {string} timestamp - Spawn timestamp in "MM/DD/YY HH:MM" format
@@ -226,10 +492,16 @@ async function checkColumnExists(boss, timestamp) {
     return true;
   }
 
+  const now = performance.now();
+  if (columnCheckCache.size > COLUMN_CHECK_CACHE_PRUNE_SIZE) {
+    pruneColumnCheckCache(now);
+  }
+
   // Check short-term API result cache (reduces duplicate API calls)
-  if (columnCheckCache.has(cacheKey)) {
-    const cached = columnCheckCache.get(cacheKey);
-    if (Date.now() - cached.cachedAt < COLUMN_CHECK_CACHE_TTL) {
+  const cached = columnCheckCache.get(cacheKey);
+  if (cached) {
+    const ttl = cached.exists ? COLUMN_CHECK_CACHE_TTL : COLUMN_CHECK_NEGATIVE_TTL;
+    if (now - cached.cachedAt < ttl) {
       return cached.exists;
     }
     // Expired cache entry
@@ -238,19 +510,11 @@ async function checkColumnExists(boss, timestamp) {
 
   // Query Google Sheets if not found in any cache
   const resp = await postToSheet({ action: "checkColumn", boss, timestamp });
-  let exists = false;
+  if (!resp.ok || !resp.data) return false;
 
-  if (resp.ok) {
-    try {
-      const data = JSON.parse(resp.text);
-      exists = data.exists === true;
-    } catch (e) {
-      exists = false;
-    }
-  }
-
-  // Cache the result for 5 minutes
-  columnCheckCache.set(cacheKey, { exists, cachedAt: Date.now() });
+  // Use the already-parsed response instead of re-parsing resp.text
+  const exists = resp.data.exists === true;
+  columnCheckCache.set(cacheKey, { exists, cachedAt: performance.now() });
 
   return exists;
 }
@@ -352,6 +616,12 @@ async function cleanupAllThreadReactions(thread) {
 // THREAD CREATION AND MANAGEMENT
 // ═══════════════════════════════════════════════════════════════════════════════
 
+/**
+ * In-flight spawn creations: "BOSS|normalized timestamp" -> promise of the
+ * last queued creation for that key. Entries are removed once the queue drains.
+ */
+const spawnCreationLocks = new Map();
+
 /**
  * Creates attendance and confirmation threads for a new boss spawn.
  *
@@ -392,6 +662,46 @@ async function createSpawnThreads(
   fullTimestamp,
   triggerSource,
   noAutoClose = false  // NEW: Optional flag to disable autoclose for maintenance threads
+) {
+  // Serialize creation per boss+timestamp so racing triggers (e.g. two spawn
+  // announcements) collapse into one column check and one pair of threads
+  const lockKey = `${bossName.toUpperCase()}|${normalizeTimestamp(fullTimestamp)}`;
+  const previous = spawnCreationLocks.get(lockKey) || Promise.resolve();
+
+  const run = previous.then(() => {
+    if (activeColumns[lockKey]) {
+      console.log(`⚠️ BLOCKED DUPLICATE: ${bossName} at ${fullTimestamp} was just created`);
+      return { success: false, error: 'Column already exists (duplicate spawn)' };
+    }
+    return createSpawnThreadsUnlocked(
+      client, bossName, dateStr, timeStr, fullTimestamp, triggerSource, noAutoClose
+    );
+  });
+  const tail = run.catch(() => {});
+  spawnCreationLocks.set(lockKey, tail);
+
+  try {
+    return await run;
+  } finally {
+    if (spawnCreationLocks.get(lockKey) === tail) spawnCreationLocks.delete(lockKey);
+  }
+}
+
+/**
+ * Performs the actual spawn thread creation for createSpawnThreads().
+ * Must only be called while holding the spawn lock for this boss+timestamp.
+ *
+ * @private
+ * @see createSpawnThreads for parameters and return value
+ */
+async function createSpawnThreadsUnlocked(
+  client,
+  bossName,
+  dateStr,
+  timeStr,
+  fullTimestamp,
+  triggerSource,
+  noAutoClose
 ) {
   // Validate boss exists in bossPoints
   if (!bossPoints[bossName]) {
@@ -504,6 +814,7 @@ async function createSpawnThreads(
     date: dateStr,
     time: timeStr,
     timestamp: fullTimestamp,
+    points: bossPoints[bossName].points,
     members: [],
     confirmThreadId: confirmThread ? confirmThread.id : null,
     closed: false,
@@ -537,7 +848,7 @@ async function createSpawnThreads(
       },
       {
         name: "📊 Points",
-        value: `${bossPoints[bossName].points} points`,
+        value: `${activeSpawns[attThread.id].points} points`,
         inline: true,
       },
       { name: "🕐 Time", value: timeStr, inline: true },
@@ -619,6 +930,19 @@ async function createSpawnThreads(
 // This ensures the bot can recover from crashes without losing attendance data.
 // ═══════════════════════════════════════════════════════════════════════════════
 
+/**
+ * Checks whether a message carries both legacy verification reactions (✅ and ❌).
+ * Messages with fewer than two reactions are rejected without any emoji lookup,
+ * which covers nearly every message seen during recovery.
+ *
+ * @param {Message} msg - Discord message to inspect
+ * @returns {boolean} True if both ✅ and ❌ reactions are present
+ */
+function hasVerifyReactions(msg) {
+  const reactions = msg.reactions.cache;
+  return reactions.size >= 2 && reactions.has("✅") && reactions.has("❌");
+}
+
 /**
  * SWEEP 1 HELPER: Scans a single thread for pending verifications and closures.
  *
@@ -654,16 +978,34 @@ async function scanThreadForPendingReactions(thread, client, bossName, parsed) {
   const messages = await thread.messages.fetch({ limit: 50 }).catch(() => null);
   if (!messages) return { members: [], pending: [], confirmations: [] };
 
+  const botId = client.user.id;
   const members = [];
   const pending = [];
   const confirmations = [];
+  const checkIns = [];
+
+  // Message IDs the bot has replied to, indexed in a single pass so each
+  // check-in is resolved with O(1) lookups instead of rescanning all messages
+  const botRepliedTo = new Set();  // Reply has buttons or a verification notice
+  const verifiedReplyTo = new Set(); // Reply is a verification notice
 
   for (const [msgId, msg] of messages) {
     // Process bot messages for verification history and closure prompts
-    if (msg.author.id === client.user.id) {
+    if (msg.author.id === botId) {
+      const repliedToId = msg.reference?.messageId;
+      const mentionsVerified = msg.content.includes("verified");
+      if (repliedToId) {
+        if (mentionsVerified) {
+          botRepliedTo.add(repliedToId);
+          verifiedReplyTo.add(repliedToId);
+        } else if (msg.components?.length > 0) {
+          botRepliedTo.add(repliedToId);
+        }
+      }
+
       // Extract already-verified members from bot confirmation messages
-      if (msg.content.includes("verified by")) {
-        const match = msg.content.match(/\*\*(.+?)\*\* verified by/);
+      if (mentionsVerified && msg.content.includes("verified by")) {
+        const match = VERIFIED_BY_RE.exec(msg.content);
         if (match) members.push(match[1]);
       }
 
@@ -674,7 +1016,7 @@ async function scanThreadForPendingReactions(thread, client, bossName, parsed) {
 
       if (isCloseConfirmation) {
         // Check for either reactions (old) or buttons (new)
-        const hasReactions = msg.reactions.cache.has("✅") && msg.reactions.cache.has("❌");
+        const hasReactions = hasVerifyReactions(msg);
         const hasButtons = msg.components && msg.components.length > 0;
 
         if (hasReactions || hasButtons) {
@@ -687,62 +1029,94 @@ async function scanThreadForPendingReactions(thread, client, bossName, parsed) {
       continue;
     }
 
-    // Process member check-in messages
+    // Collect member check-in messages; resolved after the index is complete
     const content = msg.content.trim().toLowerCase();
     const keyword = content.split(/\s+/)[0];
 
     // Check if message is a valid check-in keyword
     if (["present", "here", "join", "checkin", "check-in"].includes(keyword)) {
-      // Get member display name (nickname or username)
-      const author = await thread.guild.members.fetch(msg.author.id).catch(() => null);
-      const username = author ? (author.nickname || msg.author.username) : msg.author.username;
-
-      // Look for bot reply with buttons (new system) or verification confirmation
-      const hasBotReply = messages.some(
-        (m) =>
-          m.reference?.messageId === msgId &&
-          m.author.id === client.user.id &&
-          (m.components?.length > 0 || m.content.includes("verified"))
-      );
+      checkIns.push(msg);
+    }
+  }
 
-      // Look for verification confirmation message
-      const hasVerificationReply = messages.some(
-        (m) =>
-          m.reference?.messageId === msgId &&
-          m.author.id === client.user.id &&
-          m.content.includes("verified")
-      );
+  for (const msg of checkIns) {
+    // Already verified - nothing pending
+    if (verifiedReplyTo.has(msg.id)) continue;
 
-      // If has bot reply but not verified, add to pending queue
-      if (hasBotReply && !hasVerificationReply) {
-        pending.push({
-          messageId: msgId,
-          author: username,
-          authorId: msg.author.id,
-          timestamp: msg.createdTimestamp
-        });
-      }
-      // Legacy support: Check for old reaction-based system
-      else if (!hasBotReply) {
-        const hasCheckmark = msg.reactions.cache.has("✅");
-        const hasX = msg.reactions.cache.has("❌");
-
-        // Only process if it has reactions (legacy messages)
-        if (hasCheckmark && hasX && !hasVerificationReply) {
-          pending.push({
-            messageId: msgId,
-            author: username,
-            authorId: msg.author.id,
-            timestamp: msg.createdTimestamp
-          });
-        }
-      }
-    }
+    // Bot reply with buttons (new system) means pending; otherwise fall back to
+    // legacy reaction-based messages, which are pending only with both reactions
+    const isPending = botRepliedTo.has(msg.id) || hasVerifyReactions(msg);
+    if (!isPending) continue;
+
+    // Get member display name (nickname or username)
+    const author = await thread.guild.members.fetch(msg.author.id).catch(() => null);
+    const username = author ? (author.nickname || msg.author.username) : msg.author.username;
+
+    pending.push({
+      messageId: msg.id,
+      author: username,
+      authorId: msg.author.id,
+      timestamp: msg.createdTimestamp
+    });
   }
 
   return { members, pending, confirmations };
 }
 
+/**
+ * Scans a single attendance thread during SWEEP 1 recovery.
+ * Does not touch module state; recoverStateFromThreads merges the results.
+ *
+ * @param {ThreadChannel} thread - Attendance thread to scan
+ * @param {Client} client - Discord.js client instance
+ * @param {Map<string, string>} adminThreadIdsByName - Confirmation thread IDs keyed by name
+ * @returns {Promise<Object|null>} { threadId, spawnInfo, scanResult }, or null if skipped
+ */
+async function recoverThread(thread, client, adminThreadIdsByName) {
+  const parsed = parseThreadName(thread.name);
+  if (!parsed) {
+    console.log(`⚠️ Could not parse thread name: ${thread.name}`);
+    return null;
+  }
+
+  const bossName = findBossMatch(parsed.boss);
+  if (!bossName || thread.archived) {
+    console.log(`⚠️ Unknown boss or archived: ${parsed.boss}`);
+    return null;
+  }
+
+  console.log(`\n📋 Processing: ${thread.name} (ID: ${thread.id})`);
+
+  // Find corresponding confirmation thread
+  const confirmThreadId = adminThreadIdsByName.get(`✅ ${thread.name}`) || null;
+  if (confirmThreadId) {
+    console.log(`  ├─ 🔗 Found confirmation thread: ${confirmThreadId}`);
+  }
+
+  // Deep scan thread for all pending items
+  const scanResult = await scanThreadForPendingReactions(thread, client, bossName, parsed);
+
+  console.log(`  ├─ 👥 Verified members: ${scanResult.members.length}`);
+  console.log(`  ├─ ⏳ Pending verifications: ${scanResult.pending.length}`);
+  console.log(`  ├─ 🔒 Pending closures: ${scanResult.confirmations.length}`);
+
+  return {
+    threadId: thread.id,
+    spawnInfo: {
+      boss: bossName,
+      date: parsed.date,
+      time: parsed.time,
+      timestamp: parsed.timestamp,
+      points: bossPoints[bossName].points,
+      members: scanResult.members,
+      confirmThreadId: confirmThreadId,
+      closed: false,
+      createdAt: thread.createdTimestamp || Date.now(), // Use actual creation time for auto-close
+    },
+    scanResult,
+  };
+}
+
 /**
  * SWEEP 1: Recovers bot state by scanning all active Discord threads.
  *
@@ -751,7 +1125,7 @@ async function scanThreadForPendingReactions(thread, client, bossName, parsed) {
  * 2. Parses thread names to extract boss and timestamp information
  * 3. Scans each thread for verified members and pending verifications
  * 4. Rebuilds activeSpawns, activeColumns, pendingVerifications, and pendingClosures
- * 5. Processes threads in parallel for performance optimization
+ * 5. Processes threads in parallel (bounded by RECOVERY_CONCURRENCY)
  *
  * RECOVERY PROCESS:
  * - Scans thread messages to find check-in messages
@@ -797,95 +1171,71 @@ async function recoverStateFromThreads(client) {
 
     const adminThreads = await adminLogs.threads.fetchActive().catch(() => null);
 
+    // Index confirmation threads by name once (O(1) lookup per attendance thread)
+    const adminThreadIdsByName = new Map();
+    if (adminThreads) {
+      for (const [id, adminThread] of adminThreads.threads) {
+        if (!adminThreadIdsByName.has(adminThread.name)) {
+          adminThreadIdsByName.set(adminThread.name, id);
+        }
+      }
+    }
+
     let recoveredCount = 0;
     let pendingCount = 0;
     let reactionsAddedCount = 0;
     let confirmationsCount = 0;
 
-    const threadProcessingPromises = [];
+    // Scan threads concurrently, at most RECOVERY_CONCURRENCY at a time
+    const threads = [...attThreads.threads.values()];
+    const results = new Array(threads.length).fill(null);
+    let nextIndex = 0;
 
-    for (const [threadId, thread] of attThreads.threads) {
-      // Process threads in parallel as requested
-      const promise = (async () => {
-        const parsed = parseThreadName(thread.name);
-        if (!parsed) {
-          console.log(`⚠️ Could not parse thread name: ${thread.name}`);
-          return;
-        }
+    const worker = async () => {
+      while (nextIndex < threads.length) {
+        const i = nextIndex++;
+        results[i] = await recoverThread(threads[i], client, adminThreadIdsByName);
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(RECOVERY_CONCURRENCY, threads.length) }, worker)
+    );
 
-        const bossName = findBossMatch(parsed.boss);
-        if (!bossName || thread.archived) {
-          console.log(`⚠️ Unknown boss or archived: ${parsed.boss}`);
-          return;
-        }
+    // Merge scan results into state in thread order
+    for (const result of results) {
+      if (!result) continue;
+      const { threadId, spawnInfo, scanResult } = result;
 
-        console.log(`\n📋 Processing: ${thread.name} (ID: ${threadId})`);
+      activeSpawns[threadId] = spawnInfo;
 
-        // Find corresponding confirmation thread
-        let confirmThreadId = null;
-        if (adminThreads) {
-          for (const [id, adminThread] of adminThreads.threads) {
-            if (adminThread.name === `✅ ${thread.name}`) {
-              confirmThreadId = id;
-              console.log(`  ├─ 🔗 Found confirmation thread: ${id}`);
-              break;
-            }
-          }
-        }
-
-        // Deep scan thread for all pending items
-        const scanResult = await scanThreadForPendingReactions(thread, client, bossName, parsed);
-
-        console.log(`  ├─ 👥 Verified members: ${scanResult.members.length}`);
-        console.log(`  ├─ ⏳ Pending verifications: ${scanResult.pending.length}`);
-        console.log(`  ├─ 🔒 Pending closures: ${scanResult.confirmations.length}`);
-
-        // Store spawn info
-        activeSpawns[threadId] = {
-          boss: bossName,
-          date: parsed.date,
-          time: parsed.time,
-          timestamp: parsed.timestamp,
-          members: scanResult.members,
-          confirmThreadId: confirmThreadId,
-          closed: false,
-          createdAt: thread.createdTimestamp || Date.now(), // Use actual creation time for auto-close
-        };
+      // Use normalized key for O(1) lookup consistency
+      const normalizedRecoveryKey = `${spawnInfo.boss.toUpperCase()}|${normalizeTimestamp(spawnInfo.timestamp)}`;
+      activeColumns[normalizedRecoveryKey] = threadId;
 
-        // Use normalized key for O(1) lookup consistency
-        const normalizedRecoveryKey = `${bossName.toUpperCase()}|${normalizeTimestamp(parsed.timestamp)}`;
-        activeColumns[normalizedRecoveryKey] = threadId;
-
-        // Store pending verifications
-        scanResult.pending.forEach(p => {
-          pendingVerifications[p.messageId] = {
-            author: p.author,
-            authorId: p.authorId,
-            threadId: thread.id,
-            timestamp: p.timestamp,
-          };
-          pendingCount++;
-        });
-
-        // Store pending closures
-        scanResult.confirmations.forEach(c => {
-          pendingClosures[c.messageId] = {
-            threadId: thread.id,
-            timestamp: c.timestamp,
-            type: "close",
-          };
-          confirmationsCount++;
+      // Store pending verifications
+      scanResult.pending.forEach(p => {
+        addPendingVerification(p.messageId, {
+          author: p.author,
+          authorId: p.authorId,
+          threadId,
+          timestamp: p.timestamp,
         });
+        pendingCount++;
+      });
 
-        recoveredCount++;
-      })();
+      // Store pending closures
+      scanResult.confirmations.forEach(c => {
+        pendingClosures[c.messageId] = {
+          threadId,
+          timestamp: c.timestamp,
+          type: "close",
+        };
+        confirmationsCount++;
+      });
 
-      threadProcessingPromises.push(promise);
+      recoveredCount++;
     }
 
-    // Wait for all threads to be processed in parallel
-    await Promise.all(threadProcessingPromises);
-
     console.log("\n✅ SWEEP 1 COMPLETE");
     console.log(`   ├─ Spawns recovered: ${recoveredCount}`);
     console.log(`   ├─ Pending verifications: ${pendingCount}`);
@@ -1245,7 +1595,7 @@ function cleanupStaleEntries() {
   Object.keys(pendingVerifications).forEach(msgId => {
     const entry = pendingVerifications[msgId];
     if (entry.timestamp && (now - entry.timestamp > STALE_ENTRY_AGE)) {
-      delete pendingVerifications[msgId];
+      removePendingVerification(msgId);
       cleaned++;
     }
   });
@@ -1275,7 +1625,7 @@ function cleanupStaleEntries() {
       return aTime - bTime;
     });
     const toRemove = sortedKeys.slice(0, sortedKeys.length - MAX_PENDING_VERIFICATIONS);
-    toRemove.forEach(key => delete pendingVerifications[key]);
+    toRemove.forEach(key => removePendingVerification(key));
     cleaned += toRemove.length;
   }
 
@@ -1399,28 +1749,21 @@ async function checkAndAutoCloseThreads(client) {
         }
 
         // AUTO-VERIFY all pending check-ins for this thread
-        const pendingInThread = Object.entries(pendingVerifications).filter(
-          ([msgId, p]) => p.threadId === threadId
-        );
+        const pendingInThread = getPendingInThread(threadId);
 
         if (pendingInThread.length > 0) {
           console.log(`   ✅ Auto-verifying ${pendingInThread.length} pending member(s)`);
 
           for (const [msgId, pending] of pendingInThread) {
-            // Check for duplicates before adding (normalized username comparison)
-            const isDuplicate = spawnInfo.members.some(
-              (m) => normalizeUsername(m) === normalizeUsername(pending.author)
-            );
-
-            if (!isDuplicate) {
-              spawnInfo.members.push(pending.author);
+            // Add unless duplicate (normalized username comparison)
+            if (addVerifiedMember(spawnInfo, pending.author, pending.authorKey)) {
               console.log(`      ├─ ✅ ${pending.author}`);
             } else {
               console.log(`      ├─ ⚠️ ${pending.author} (duplicate, skipped)`);
             }
 
             // Remove from pending
-            delete pendingVerifications[msgId];
+            removePendingVerification(msgId);
           }
         }
 
@@ -1555,16 +1898,7 @@ async function checkAndAutoCloseThreads(client) {
             }
 
             // Submit to Google Sheets
-            const payload = {
-              action: "submitAttendance",
-              boss: spawnInfo.boss,
-              date: spawnInfo.date,
-              time: spawnInfo.time,
-              timestamp: spawnInfo.timestamp,
-              members: spawnInfo.members,
-            };
-
-            const resp = await postToSheet(payload);
+            const resp = await submitSpawnAttendance(spawnInfo);
 
             if (resp.ok) {
             console.log(`   ✅ Submitted ${spawnInfo.members.length} members to Google Sheets`);
@@ -1769,6 +2103,7 @@ async function createThreadForBoss(discordClient, bossName, spawnTime) {
 module.exports = {
   // Core initialization
   initialize,
+  shutdown,
 
   // Utility functions from common module (re-exported for convenience)
   getCurrentTimestamp,
@@ -1777,8 +2112,21 @@ module.exports = {
   findBossMatch,
   parseThreadName,
 
+  // Spawn data
+  getSpawnPoints,
+
+  // Verified member lookup
+  isMemberVerified,
+  addVerifiedMember,
+
+  // Pending verification index
+  addPendingVerification,
+  removePendingVerification,
+  getPendingInThread,
+
   // Google Sheets integration
   postToSheet,
+  submitSpawnAttendance,
   checkColumnExists,
 
   // Reaction management
@@ -110,6 +110,7 @@
 
 const { EmbedBuilder } = require("discord.js");
 const { Timeout } = require("timers");
+const { performance } = require("perf_hooks");
 const errorHandler = require('./utils/error-handler');
 const { PointsCache } = require('./utils/points-cache');
 const { SheetAPI } = require('./utils/sheet-api');
@@ -146,12 +147,6 @@ let intelligenceEngine = null;
  */
 let attendanceCache = {};
 
-/**
- * Current session boss name (legacy, kept for backwards compatibility).
- * @type {string|null}
- */
-let currentSessionBoss = null;
-
 /**
  * Sets the postToSheet function reference for Google Sheets integration.
  * Must be called during bot initialization before starting auctions.
@@ -188,7 +183,7 @@ function getPostToSheet() {
  * @property {number} currentItemIndex - Index of current item in sessionItems array
  * @property {Object.<string, NodeJS.Timeout>} timers - Active timers for countdown/end
  * @property {boolean} paused - Whether the auction is paused
- * @property {number|null} pausedTime - Timestamp when auction was paused
+ * @property {number|null} pausedTime - Monotonic time (performance.now()) when auction was paused
  */
 let auctionState = {
   active: false,
@@ -255,6 +250,14 @@ let sessionTimestamp = null;
  */
 let sessionStartDateTime = null;
 
+/**
+ * In-flight background sheet writes from itemEnd (result logs, learning updates).
+ * itemEnd does not wait on them (the next item starts while the sheet write
+ * runs); finalizeSession and handleMoveToDistribution flush them first.
+ * @type {Set<Promise<void>>}
+ */
+const pendingSheetWrites = new Set();
+
 // ═══════════════════════════════════════════════════════════════════════════
 // SECTION 2: CONSTANTS & CONFIGURATION
 // ═══════════════════════════════════════════════════════════════════════════
@@ -311,6 +314,18 @@ const TIMEOUTS = {
   PREVIEW_DELAY: 30000, // 30 seconds - item preview delay
 };
 
+/**
+ * Session descriptor attached to every auctioned item. bidding.js only checks
+ * that one is present (attendance removed, everyone bids in the open session),
+ * so all items share this frozen instance instead of allocating their own.
+ * @constant {Object}
+ */
+const OPEN_SESSION = Object.freeze({
+  bossName: "Open",
+  bossKey: "open",
+  attendees: Object.freeze([]), // Not used anymore since attendance is removed
+});
+
 // ═══════════════════════════════════════════════════════════════════════════
 // SECTION 3: UTILITY FUNCTIONS
 // ═══════════════════════════════════════════════════════════════════════════
@@ -337,6 +352,43 @@ function createDisabledRow(btn1, btn2) {
   return new ActionRowBuilder().addComponents(disabledBtn1, disabledBtn2);
 }
 
+/**
+ * Packs lines into embed field values under Discord's 1024-character cap.
+ * Lines are never split; anything past `maxFields` is summarised as
+ * "... and X more items" in the last field so the embed stays under 6000 chars.
+ *
+ * @param {string[]} lines - Pre-formatted lines to pack
+ * @param {number} [maxFields=4] - Maximum number of field values to return
+ * @returns {string[]} Field values (empty if there are no lines)
+ */
+function chunkFieldLines(lines, maxFields = 4) {
+  const FIELD_LIMIT = 1000; // Leave room for the "... and X more" note
+  const chunks = [];
+  let current = "";
+  let used = 0;
+
+  for (const line of lines) {
+    const next = current ? `${current}\n${line}` : line;
+    if (next.length <= FIELD_LIMIT) {
+      current = next;
+      used++;
+      continue;
+    }
+    if (current) {
+      if (chunks.length + 1 >= maxFields) break;
+      chunks.push(current);
+    }
+    current = line.slice(0, FIELD_LIMIT);
+    used++;
+  }
+
+  if (current) chunks.push(current);
+  if (used < lines.length) {
+    chunks[chunks.length - 1] += `\n\n*... and ${lines.length - used} more items*`;
+  }
+  return chunks;
+}
+
 /**
  * Initializes the auctioneering module with required dependencies.
  * Must be called during bot startup before any auctions can run.
@@ -358,6 +410,20 @@ function initialize(config, isAdminFunc, biddingModuleRef, cache = null, intelli
   }
 }
 
+/**
+ * Releases the module's Google Sheets connection pool.
+ * Every auctioneering sheet call goes through the one SheetAPI created in
+ * initialize(), so the keep-alive connection is reused for the whole bot
+ * lifetime; this closes it from the bot's shutdown handlers.
+ *
+ * @returns {Promise<void>}
+ */
+async function shutdown() {
+  if (sheetAPI) {
+    await sheetAPI.close();
+  }
+}
+
 /**
  * Clears all active timers from the auction state
  * Optimization: Consolidates timer clearing logic
@@ -431,7 +497,14 @@ async function fetchSheetItems(url, retries = 3, allowCache = true) {
   for (let attempt = 1; attempt <= retries; attempt++) {
     try {
       const data = await sheetAPI.call('getBiddingItems');
-      const items = data.items || [];
+      // A missing items array means the webhook's response format changed;
+      // fail loudly (and fall back to the cache) rather than auction 0 items
+      if (!Array.isArray(data.items)) {
+        throw new Error(
+          `Unexpected getBiddingItems response: ${JSON.stringify(data).slice(0, 200)}`
+        );
+      }
+      const items = data.items;
 
       console.log(
         `${EMOJI.SUCCESS} Fetched ${items.length} items from Google Sheets`
@@ -493,6 +566,29 @@ async function fetchSheetItems(url, retries = 3, allowCache = true) {
   return []; // Return empty array instead of null
 }
 
+/**
+ * Reads the points map out of an already-parsed getBiddingPoints response.
+ *
+ * Accepts the legacy `points` map or the `members` array, at the top level or
+ * nested under `data`. Blank usernames are skipped and non-numeric points
+ * become 0.
+ *
+ * @param {Object} pointsData - Parsed response from sheetAPI.call('getBiddingPoints')
+ * @returns {Object} Map of username -> points left (empty if none)
+ */
+function pointsMapFromResponse(pointsData) {
+  const points = pointsData.points || pointsData.data?.points || {};
+  if (Object.keys(points).length > 0) return points;
+
+  const members = pointsData.members || pointsData.data?.members || [];
+  const pointsMap = {};
+  for (const member of members) {
+    const name = member?.username?.trim();
+    if (name) pointsMap[name] = Number(member?.pointsLeft) || 0;
+  }
+  return pointsMap;
+}
+
 /**
  * Logs auction results to Google Sheets for permanent record keeping.
  *
@@ -538,11 +634,68 @@ async function logAuctionResult(
   }
 }
 
+/**
+ * Runs a sheet write off the auction critical path, tracked until it settles.
+ * The task must handle its own errors; a rejection is only logged here.
+ *
+ * @param {Function} task - Async function performing the write
+ * @param {string} label - Context for the fallback error log
+ */
+function runSheetWriteInBackground(task, label) {
+  const write = Promise.resolve()
+    .then(task)
+    .catch((err) => errorHandler.silentError(err, label))
+    .finally(() => pendingSheetWrites.delete(write));
+  pendingSheetWrites.add(write);
+}
+
+/**
+ * Waits for all in-flight background sheet writes to settle.
+ * Must run before anything that reads the logged winners back from the sheet
+ * (session submit, moving auctioned items to ForDistribution).
+ *
+ * @returns {Promise<void>}
+ */
+async function flushSheetWrites() {
+  if (pendingSheetWrites.size === 0) return;
+  console.log(`${EMOJI.CLOCK} Waiting for ${pendingSheetWrites.size} background sheet write(s)...`);
+  await Promise.allSettled([...pendingSheetWrites]);
+}
+
+/**
+ * Reduces a queued/sold session item to the plain fields worth persisting.
+ * Live items also carry the Discord thread, bid history and bidding-session
+ * links, none of which belong in the saved state.
+ *
+ * @param {Object} item - Entry from auctionState.sessionItems
+ * @returns {Object} Compact, JSON-safe record
+ */
+function toSessionRecord(item) {
+  return {
+    item: item.item,
+    startPrice: item.startPrice,
+    duration: item.duration,
+    quantity: item.quantity,
+    batchNumber: item.batchNumber,
+    batchTotal: item.batchTotal,
+    source: item.source,
+    sheetIndex: item.sheetIndex,
+    bossName: item.bossName,
+    status: item.status,
+    winner: item.winner,
+    winnerId: item.winnerId,
+    amount: item.amount,
+    timestamp: item.timestamp,
+    auctionStartTime: item.auctionStartTime,
+    auctionEndTime: item.auctionEndTime,
+  };
+}
+
 /**
  * Saves the current auction state to Google Sheets for crash recovery.
  *
  * FEATURES:
- * - Circular reference protection (skips timers and circular objects)
+ * - Session items are saved as compact records (no threads, timers or bid history)
  * - Cleans item data to only include serializable fields
  * - Auto-save triggers on important state changes
  * - Enables session recovery after bot restart
@@ -552,20 +705,6 @@ async function logAuctionResult(
  */
 async function saveAuctionState(url) {
   try {
-    // 🔒 Prevent circular reference errors
-    const safeStringify = (obj) => {
-      const seen = new WeakSet();
-      return JSON.stringify(obj, (key, value) => {
-        // Skip timers and circular references
-        if (key === "timers" || key === "currentSession") return undefined;
-        if (typeof value === "object" && value !== null) {
-          if (seen.has(value)) return undefined;
-          seen.add(value);
-        }
-        return value;
-      });
-    };
-
     // 🧩 Clean item (avoid timers and circular data)
     const cleanItem =
       auctionState.currentItem && typeof auctionState.currentItem === "object"
@@ -587,7 +726,7 @@ async function saveAuctionState(url) {
       auctionState: {
         active: auctionState.active,
         currentItem: cleanItem,
-        sessionItems: auctionState.sessionItems,
+        sessionItems: (auctionState.sessionItems || []).map(toSessionRecord),
         currentItemIndex: auctionState.currentItemIndex,
         paused: auctionState.paused,
       },
@@ -684,28 +823,20 @@ async function startAuctioneering(client, config, channel) {
     return;
   }
 
+  // Points and items are independent reads; start the item fetch now so both
+  // round trips overlap (fetchSheetItems never rejects - it falls back to cache)
+  const sheetItemsPromise = fetchSheetItems(config.sheet_webhook_url);
+
   // Load points cache
   try {
     const pointsData = await sheetAPI.call('getBiddingPoints');
-    // Get members array from response (could be top-level or nested)
-    const members = pointsData.members || pointsData.data?.members || [];
-    // Get points map from response (legacy field for backward compatibility)
-    const points = pointsData.points || pointsData.data?.points || {};
+    const pointsMap = pointsMapFromResponse(pointsData);
 
-    if (members.length === 0 && Object.keys(points).length === 0) {
+    if (Object.keys(pointsMap).length === 0) {
       await channel.send(`❌ No points data received`);
       return;
     }
 
-    // Convert members array to points map if needed
-    // Guard against blank usernames and NaN values
-    const pointsMap = Object.keys(points).length > 0 ? points : members.reduce((acc, member) => {
-      const name = member?.username?.trim();
-      if (!name) return acc;
-      acc[name] = Number(member?.pointsLeft) || 0;
-      return acc;
-    }, {});
-
     // Store in bidding module's cache with PointsCache for O(1) lookups
     const biddingState = biddingModule.getBiddingState();
     biddingState.cp = new PointsCache(pointsMap);
@@ -719,8 +850,8 @@ async function startAuctioneering(client, config, channel) {
     return;
   }
 
-  // Fetch sheet items with fallback cache
-  const sheetItems = await fetchSheetItems(config.sheet_webhook_url);
+  // Sheet items (with fallback cache), fetched alongside the points above
+  const sheetItems = await sheetItemsPromise;
 
   // Check if we got items (never null due to fallback, but could be empty)
   if (sheetItems.length === 0) {
@@ -741,18 +872,15 @@ async function startAuctioneering(client, config, channel) {
   }
 
   // 🔧 FIX: Filter out items that already have winners (past auctions)
+  // (one summary line is logged below rather than a line per skipped row;
+  // a sheet with a long sold history made queue building log-bound)
   const availableItems = sheetItems.filter((item) => {
     const winner = item.winner;
-    const hasWinner =
-      winner !== null &&
-      winner !== undefined &&
-      winner !== "" &&
-      winner.toString().trim() !== "";
-
-    if (hasWinner) {
-      console.log(`⭐ Skipping "${item.item}" - already has winner: ${winner}`);
-    }
-    return !hasWinner;
+    return (
+      winner === null ||
+      winner === undefined ||
+      winner.toString().trim() === ""
+    );
   });
 
   if (availableItems.length === 0) {
@@ -772,21 +900,26 @@ async function startAuctioneering(client, config, channel) {
     } already have winners)`
   );
 
+  // Each unit of quantity becomes its own auction, so size checks count units
+  // rather than sheet rows (one row with a huge quantity is just as costly)
+  const quantities = availableItems.map((item) => parseInt(item.quantity) || 1);
+  const totalUnits = quantities.reduce((sum, qty) => sum + qty, 0);
+
   // Warn about large datasets (potential performance/memory issues)
   const LARGE_DATASET_WARNING = 1000;
   const CRITICAL_DATASET_SIZE = 5000;
-  if (availableItems.length >= CRITICAL_DATASET_SIZE) {
-    console.error(`${EMOJI.ERROR} CRITICAL: ${availableItems.length} items exceeds safe limit (${CRITICAL_DATASET_SIZE})!`);
+  if (totalUnits >= CRITICAL_DATASET_SIZE) {
+    console.error(`${EMOJI.ERROR} CRITICAL: ${totalUnits} items exceeds safe limit (${CRITICAL_DATASET_SIZE})!`);
     await channel.send(
-      `${EMOJI.ERROR} **Too many items!** (${availableItems.length})\n` +
+      `${EMOJI.ERROR} **Too many items!** (${totalUnits})\n` +
       `The bot can safely handle up to ${CRITICAL_DATASET_SIZE} items.\n` +
       `Please auction items in batches or archive completed items.`
     );
     return;
-  } else if (availableItems.length >= LARGE_DATASET_WARNING) {
-    console.warn(`${EMOJI.WARNING} Large dataset: ${availableItems.length} items (may impact performance)`);
+  } else if (totalUnits >= LARGE_DATASET_WARNING) {
+    console.warn(`${EMOJI.WARNING} Large dataset: ${totalUnits} items (may impact performance)`);
     await channel.send(
-      `${EMOJI.WARNING} **Large auction session** (${availableItems.length} items)\n` +
+      `${EMOJI.WARNING} **Large auction session** (${totalUnits} items)\n` +
       `Consider splitting into multiple sessions for better performance.`
     );
   }
@@ -794,17 +927,56 @@ async function startAuctioneering(client, config, channel) {
   // 🎯 SIMPLIFIED: Treat all items as ONE session (no boss grouping)
   const allItems = [];
 
-  availableItems.forEach((item) => {
-    const qty = parseInt(item.quantity) || 1;
+  availableItems.forEach((item, row) => {
+    const qty = quantities[row];
+    const batched = qty > 1;
+    // Fields shared by every unit of this row, merged once per sheet row;
+    // each unit below only copies the template and adds its batch label
+    const template = {
+      ...item,
+      quantity: 1,
+      batchNumber: null,
+      batchTotal: batched ? qty : null,
+      displayName: item.item,
+      source: "GoogleSheet",
+      bossName: (item.boss || "").split(" ")[0] || "Unknown", // Extract just boss name
+      // Runtime fields filled in by auctionNextItem/itemEnd (and the bid paths in
+      // bidding.js), declared up front so every queued item keeps one object shape
+      // and nothing is added mid-auction (undefined is dropped from saved state)
+      status: undefined,
+      currentSession: undefined,
+      thread: undefined,
+      threadId: undefined,
+      curBid: undefined,
+      curWin: undefined,
+      curWinKey: undefined,
+      curWinId: undefined,
+      bids: undefined,
+      bidCounts: undefined,
+      extCnt: undefined,
+      startedAt: undefined,
+      startedMono: undefined,
+      endTime: undefined,
+      remainingTime: undefined,
+      go1: undefined,
+      go2: undefined,
+      auctionStartTime: undefined,
+      auctionEndTime: undefined,
+      timestamp: undefined,
+      winner: undefined,
+      winnerId: undefined,
+      amount: undefined,
+    };
+    if (!batched) {
+      allItems.push(template);
+      return;
+    }
     for (let q = 0; q < qty; q++) {
-      allItems.push({
-        ...item,
-        quantity: 1,
-        batchNumber: qty > 1 ? q + 1 : null,
-        batchTotal: qty > 1 ? qty : null,
-        source: "GoogleSheet",
-        bossName: (item.boss || "").split(" ")[0] || "Unknown", // Extract just boss name
-      });
+      const unit = { ...template };
+      unit.batchNumber = q + 1;
+      // Announcement label, built once here instead of in every embed
+      unit.displayName = `${item.item} [${q + 1}/${qty}]`;
+      allItems.push(unit);
     }
   });
 
@@ -823,7 +995,7 @@ async function startAuctioneering(client, config, channel) {
   const previewList = allItems
     .slice(0, 10)
     .map((item, i) => {
-      return `${i + 1}. **${item.item}** - ${item.startPrice}pts • ${
+      return `${i + 1}. **${item.displayName}** - ${item.startPrice}pts • ${
         item.duration
       }m${item.bossName !== "Unknown" ? ` (${item.bossName})` : ""}`;
     })
@@ -1095,7 +1267,7 @@ async function auctionNextItem(client, config, channel) {
   const previewEmbed = new EmbedBuilder()
     .setColor(COLORS.AUCTION)
     .setTitle(`${EMOJI.CLOCK} NEXT ITEM COMING UP`)
-    .setDescription(`**${item.item}**`)
+    .setDescription(`**${item.displayName}**`)
     .addFields(
       {
         name: `${EMOJI.BID} Starting Bid`,
@@ -1137,6 +1309,16 @@ async function auctionNextItem(client, config, channel) {
   // Wait 30 seconds before starting
   await new Promise((resolve) => setTimeout(resolve, TIMEOUTS.PREVIEW_DELAY));
 
+  // The session may have been stopped or the queue changed during the preview;
+  // don't let this continuation start an item nobody is driving any more
+  if (
+    !auctionState.active ||
+    auctionState.sessionItems?.[auctionState.currentItemIndex] !== item
+  ) {
+    console.log(`${EMOJI.STOP} Preview for ${item.item} abandoned - session stopped or queue changed`);
+    return;
+  }
+
   // ==========================================
   // START THE ACTUAL AUCTION
   // ==========================================
@@ -1144,7 +1326,7 @@ async function auctionNextItem(client, config, channel) {
   auctionState.currentItem.status = "active";
   auctionState.currentItem.bids = [];
 
-  const threadName = `${item.item} | ${item.startPrice || 0}pts${
+  const threadName = `${item.displayName} | ${item.startPrice || 0}pts${
     item.bossName !== "Unknown" ? ` | ${item.bossName}` : ""
   }`;
 
@@ -1173,7 +1355,7 @@ async function auctionNextItem(client, config, channel) {
             .setColor(COLORS.AUCTION)
             .setTitle(`${EMOJI.AUCTION} New Auction Started`)
             .setDescription(
-              `**Item:** ${item.item}\n**Start Price:** ${
+              `**Item:** ${item.displayName}\n**Start Price:** ${
                 item.startPrice || 0
               } pts\n**Duration:** ${item.duration || 2} min`
             )
@@ -1209,7 +1391,7 @@ async function auctionNextItem(client, config, channel) {
             .setColor(COLORS.AUCTION)
             .setTitle(`${EMOJI.AUCTION} New Auction Started`)
             .setDescription(
-              `**Item:** ${item.item}\n**Start Price:** ${
+              `**Item:** ${item.displayName}\n**Start Price:** ${
                 item.startPrice || 0
               } pts\n**Duration:** ${
                 item.duration || 2
@@ -1253,8 +1435,9 @@ async function auctionNextItem(client, config, channel) {
       if (cfg?.sheet_webhook_url) {
         await saveAuctionState(cfg.sheet_webhook_url);
       }
-    } catch (_) {
-      // ignore; best-effort
+    } catch (saveErr) {
+      // Best-effort, but don't hide why it failed
+      errorHandler.silentError(saveErr, 'save auction state after thread failure');
     }
 
     try {
@@ -1275,23 +1458,23 @@ async function auctionNextItem(client, config, channel) {
   // Initialize item auction state
   item.curBid = item.startPrice || 0;
   item.curWin = null;
+  item.curWinKey = null; // Locked-points key for curWin, set by bidding.js (see lockKey())
   item.curWinId = null;
   item.bids = [];
+  item.bidCounts = {}; // userId -> bids placed, kept in step with item.bids by bidding.js
   item.extCnt = 0; // Extension counter
 
   const duration = (item.duration || 2) * 60 * 1000;
-  item.endTime = Date.now() + duration;
+  item.startedAt = Date.now();
+  item.startedMono = performance.now(); // Monotonic anchor for itemTimeLeft
+  item.endTime = item.startedAt + duration;
 
   // Store thread reference for later use
   item.thread = auctionThread;
   item.threadId = auctionThread.id;
 
-  // Set dummy session for bidding.js compatibility (attendance removed)
-  item.currentSession = {
-    bossName: item.bossName || "Open",
-    bossKey: "open",
-    attendees: [], // Not used anymore since attendance is removed
-  };
+  // Shared open session for bidding.js compatibility (attendance removed)
+  item.currentSession = OPEN_SESSION;
 
   // ✅ Start bidding in this thread - send announcement
   try {
@@ -1300,7 +1483,7 @@ async function auctionNextItem(client, config, channel) {
       embeds: [
         new EmbedBuilder()
           .setColor(COLORS.AUCTION)
-          .setTitle(`${EMOJI.AUCTION} Auction Started: ${item.item}`)
+          .setTitle(`${EMOJI.AUCTION} Auction Started: ${item.displayName}`)
           .setDescription(
             `**Boss:** ${item.bossName !== "Unknown" ? item.bossName : "OPEN"}\n` +
               `**Starting Price:** ${item.startPrice || 0} pts\n` +
@@ -1333,6 +1516,25 @@ async function auctionNextItem(client, config, channel) {
 // SECTION 7: TIMER MANAGEMENT
 // ═══════════════════════════════════════════════════════════════════════════
 
+/**
+ * Milliseconds left on an item, measured on the monotonic clock.
+ *
+ * endTime stays a wall-clock value for Discord's <t:> timestamps, but "now"
+ * is the item's wall-clock start plus monotonic time elapsed since then, so
+ * a system clock step cannot shorten or stretch a running auction. Items
+ * without a monotonic anchor (restored from a saved state) use Date.now().
+ *
+ * @param {Object} item - Current auction item
+ * @returns {number} Remaining time in milliseconds (never negative)
+ */
+function itemTimeLeft(item) {
+  const now =
+    item.startedMono !== undefined
+      ? item.startedAt + (performance.now() - item.startedMono)
+      : Date.now();
+  return Math.max(0, item.endTime - now);
+}
+
 /**
  * Schedules countdown timers for the current auction item.
  *
@@ -1343,7 +1545,7 @@ async function auctionNextItem(client, config, channel) {
  * - itemEnd: Auction completion and winner announcement
  *
  * FEATURES:
- * - Prevents duplicate announcements (checks go1/go2/go3 flags)
+ * - Prevents duplicate announcements (checks go1/go2 flags)
  * - Adjusts for pause duration when resumed
  * - Accounts for time extensions from late bids
  *
@@ -1359,135 +1561,85 @@ function scheduleItemTimers(client, config, channel) {
   }
 
   const item = auctionState.currentItem;
-  const t = Math.max(0, item.endTime - Date.now());
-
-  if (t > 60000 && !item.go1) {
-    auctionState.timers.go1 = setTimeout(
-      async () => await itemGo1(client, config, channel),
-      t - 60000
-    );
-  }
-  if (t > 30000 && !item.go2) {
-    auctionState.timers.go2 = setTimeout(
-      async () => await itemGo2(client, config, channel),
-      t - 30000
-    );
-  }
-  if (t > 10000) {
-    auctionState.timers.go3 = setTimeout(
-      async () => await itemGo3(client, config, channel),
-      t - 10000
-    );
+  const t = itemTimeLeft(item);
+
+  // Drop any handles still registered for this item so a repeated schedule
+  // can never leave an orphaned countdown or second itemEnd behind
+  safelyClearItemTimers();
+
+  // This also runs on resume/extend, so flagged calls are skipped once they
+  // have fired for this item
+  for (const call of COUNTDOWN_CALLS) {
+    if (t > call.lead && !(call.flag && item[call.flag])) {
+      auctionState.timers[call.key] = setTimeout(
+        () => announceCountdown(channel, call).catch((err) =>
+          errorHandler.silentError(err, `auction countdown ${call.key}`)
+        ),
+        t - call.lead
+      );
+    }
   }
   auctionState.timers.itemEnd = setTimeout(
-    async () => await itemEnd(client, config, channel),
+    () => itemEnd(client, config, channel).catch((err) =>
+      console.error(`${EMOJI.ERROR} Failed to end auction item:`, err)
+    ),
     t
   );
 }
 
 /**
- * Announces 60 seconds remaining in the auction.
- * Called automatically by timer system.
- *
- * @param {Discord.Client} client - Discord bot client
- * @param {Object} config - Bot configuration
- * @param {Discord.ThreadChannel} channel - Auction thread channel
- * @returns {Promise<void>}
+ * Countdown announcements, in firing order. `key` names the timer, `lead` is
+ * how long before the end it fires, and `flag` (if set) is the item field that
+ * marks it as announced so resume/extend don't repeat it. The final call has
+ * no flag and repeats whenever the end moves. Only the end time and current
+ * bid change per item.
+ * @constant {Array.<{key: string, lead: number, flag: ?string, title: string, color: number}>}
  */
-async function itemGo1(client, config, channel) {
-  if (
-    !auctionState.active ||
-    !auctionState.currentItem ||
-    auctionState.currentItem.go1
-  )
-    return;
-  auctionState.currentItem.go1 = true;
-
-  const item = auctionState.currentItem;
-  const endTimestamp = Math.floor(item.endTime / 1000);
-
-  await channel.send({
-    embeds: [
-      new EmbedBuilder()
-        .setColor(COLORS.WARNING)
-        .setTitle(`${EMOJI.WARNING} GOING ONCE!`)
-        .setDescription(`Auction ends <t:${endTimestamp}:R>`)
-        .addFields({
-          name: `${EMOJI.BID} Current`,
-          value: item.curWin
-            ? `${item.curBid}pts by ${item.curWin}`
-            : `${item.startPrice}pts (no bids)`,
-        }),
-    ],
-  });
-}
+const COUNTDOWN_CALLS = [
+  { key: "go1", lead: 60000, flag: "go1", title: `${EMOJI.WARNING} GOING ONCE!`, color: COLORS.WARNING },
+  { key: "go2", lead: 30000, flag: "go2", title: `${EMOJI.WARNING} GOING TWICE!`, color: COLORS.WARNING },
+  { key: "go3", lead: 10000, flag: null, title: `${EMOJI.WARNING} FINAL CALL!`, color: COLORS.ERROR },
+];
 
 /**
- * Announces 30 seconds remaining in the auction.
- * Called automatically by timer system.
+ * Builds a countdown announcement embed for the current item.
+ * Built from one data literal rather than a chain of setters, since these
+ * fire several times per item.
  *
- * @param {Discord.Client} client - Discord bot client
- * @param {Object} config - Bot configuration
- * @param {Discord.ThreadChannel} channel - Auction thread channel
- * @returns {Promise<void>}
+ * @param {Object} item - Current auction item
+ * @param {{title: string, color: number}} call - Entry from COUNTDOWN_CALLS
+ * @returns {EmbedBuilder} Embed ready to send
  */
-async function itemGo2(client, config, channel) {
-  if (
-    !auctionState.active ||
-    !auctionState.currentItem ||
-    auctionState.currentItem.go2
-  )
-    return;
-  auctionState.currentItem.go2 = true;
-
-  const item = auctionState.currentItem;
-  const endTimestamp = Math.floor(item.endTime / 1000);
-
-  await channel.send({
-    embeds: [
-      new EmbedBuilder()
-        .setColor(COLORS.WARNING)
-        .setTitle(`${EMOJI.WARNING} GOING TWICE!`)
-        .setDescription(`Auction ends <t:${endTimestamp}:R>`)
-        .addFields({
-          name: `${EMOJI.BID} Current`,
-          value: item.curWin
-            ? `${item.curBid}pts by ${item.curWin}`
-            : `${item.startPrice}pts (no bids)`,
-        }),
+function buildCountdownEmbed(item, call) {
+  return new EmbedBuilder({
+    color: call.color,
+    title: call.title,
+    description: `Auction ends <t:${Math.floor(item.endTime / 1000)}:R>`,
+    fields: [
+      {
+        name: `${EMOJI.BID} Current`,
+        value: item.curWin
+          ? `${item.curBid}pts by ${item.curWin}`
+          : `${item.startPrice}pts (no bids)`,
+      },
     ],
   });
 }
 
 /**
- * Announces 10 seconds remaining in the auction (final countdown).
- * Called automatically by timer system.
+ * Posts one countdown announcement (going once/twice/final call) for the
+ * current item. Called automatically by the timer system.
  *
- * @param {Discord.Client} client - Discord bot client
- * @param {Object} config - Bot configuration
  * @param {Discord.ThreadChannel} channel - Auction thread channel
+ * @param {Object} call - Entry from COUNTDOWN_CALLS
  * @returns {Promise<void>}
  */
-async function itemGo3(client, config, channel) {
-  if (!auctionState.active || !auctionState.currentItem) return;
-
+async function announceCountdown(channel, call) {
   const item = auctionState.currentItem;
-  const endTimestamp = Math.floor(item.endTime / 1000);
+  if (!auctionState.active || !item || (call.flag && item[call.flag])) return;
+  if (call.flag) item[call.flag] = true;
 
-  await channel.send({
-    embeds: [
-      new EmbedBuilder()
-        .setColor(COLORS.ERROR)
-        .setTitle(`${EMOJI.WARNING} FINAL CALL!`)
-        .setDescription(`Auction ends <t:${endTimestamp}:R>`)
-        .addFields({
-          name: `${EMOJI.BID} Current`,
-          value: item.curWin
-            ? `${item.curBid}pts by ${item.curWin}`
-            : `${item.startPrice}pts (no bids)`,
-        }),
-    ],
-  });
+  await channel.send({ embeds: [buildCountdownEmbed(item, call)] });
 }
 
 /**
@@ -1509,6 +1661,82 @@ function safelyCleanupTimers(...timerKeys) {
 // SECTION 8: ITEM COMPLETION & RESULTS
 // ═══════════════════════════════════════════════════════════════════════════
 
+/**
+ * Locks and archives an ended item's thread.
+ *
+ * Runs after itemEnd has moved on, so the lock, the short pause between the
+ * two Discord calls and the archive no longer delay the next item's preview.
+ * Bids in the thread are already refused because the item is marked ended.
+ *
+ * @param {Discord.ThreadChannel} channel - Auction thread of the ended item
+ * @param {string} itemName - Item name for log messages
+ * @returns {Promise<void>}
+ */
+async function closeItemThread(channel, itemName) {
+  try {
+    // Check if channel is a thread (type 11 or 12 = public/private thread)
+    if (channel && (channel.type === 11 || channel.type === 12)) {
+      // Refetch thread to ensure it still exists
+      const refreshedThread = await channel.fetch().catch(() => null);
+      if (!refreshedThread) {
+        console.warn(
+          `⚠️ Thread ${channel.id} no longer exists, skipping lock/archive`
+        );
+      } else {
+        // Lock the thread first to prevent new messages
+        if (typeof refreshedThread.setLocked === "function") {
+          await refreshedThread
+            .setLocked(true, "Auction ended")
+            .catch((err) => {
+              console.warn(
+                `⚠️ Failed to lock thread ${refreshedThread.id}:`,
+                err.message
+              );
+            });
+          console.log(`🔒 Locked thread for ${itemName}`);
+        }
+
+        // Small delay to avoid race conditions with Discord API
+        await new Promise((resolve) => setTimeout(resolve, 500));
+
+        // Then archive it to hide from active list
+        if (typeof refreshedThread.setArchived === "function") {
+          await refreshedThread
+            .setArchived(true, "Auction ended")
+            .catch((err) => {
+              console.warn(
+                `⚠️ Failed to archive thread ${refreshedThread.id}:`,
+                err.message
+              );
+            });
+          console.log(`📦 Archived thread for ${itemName}`);
+        }
+      }
+    }
+  } catch (err) {
+    console.warn(`⚠️ Error locking/archiving thread:`, err.message);
+  }
+}
+
+/**
+ * Drops queued "New High Bid!" announcements for an item's thread and waits
+ * for any in flight (see bidding.js settleHighBidAnnouncements), so none
+ * lands after the item's result or once the thread is locked.
+ *
+ * @param {Object|null} item - Item whose thread to settle
+ * @returns {Promise<void>}
+ */
+async function settleBidAnnouncements(item) {
+  if (
+    item &&
+    item.threadId &&
+    biddingModule &&
+    typeof biddingModule.settleHighBidAnnouncements === "function"
+  ) {
+    await biddingModule.settleHighBidAnnouncements(item.threadId);
+  }
+}
+
 /**
  * Ends the current auction item and processes the winner.
  *
@@ -1516,8 +1744,8 @@ function safelyCleanupTimers(...timerKeys) {
  * 1. Validates auction state and prevents duplicate calls
  * 2. Marks item as ended
  * 3. Announces winner in thread (or "No bids" if none)
- * 4. Logs results to Google Sheets
- * 5. Locks and archives the auction thread
+ * 4. Logs results to Google Sheets (in the background)
+ * 5. Locks and archives the auction thread (in the background)
  * 6. Updates session items with winner/amount
  * 7. Moves to next item or finalizes session
  *
@@ -1548,54 +1776,51 @@ async function itemEnd(client, config, channel) {
 
   // 🧹 Clear timers to avoid duplicates - safe cleanup
   safelyCleanupTimers("itemEnd", "go1", "go2", "go3");
+  await settleBidAnnouncements(item);
 
   const timestamp = getTimestamp();
   const totalBids = item.bids ? item.bids.length : 0;
-  const bidCount = item.curWin
-    ? item.bids.filter((b) => normalizeUsername(b.user) === normalizeUsername(item.curWin)).length
-    : 0;
+  let bidCount = 0;
+  if (item.curWin && item.bidCounts) {
+    bidCount = item.bidCounts[item.curWinId] || 0;
+  } else if (item.curWin) {
+    // No running tally (item predates bidCounts): count by user id, which every
+    // bid record carries, instead of normalizing both names for each bid
+    for (const b of item.bids || []) {
+      if (b.userId === item.curWinId) bidCount++;
+    }
+  }
 
   // 🕐 Record end time
-  const auctionEndTime = getCurrentTimestamp();
-  const endTimeStr = `${auctionEndTime.date} ${auctionEndTime.time}`;
+  const endTimeStr = getCurrentTimestamp().full;
   item.auctionEndTime = endTimeStr;
 
   if (item.curWin) {
     // ✅ ITEM SOLD
     await channel.send({
       embeds: [
-        new EmbedBuilder()
-          .setColor(COLORS.AUCTION)
-          .setTitle(`${EMOJI.AUCTION} SOLD!`)
-          .setDescription(`**${item.item}** sold!`)
-          .addFields(
-            {
-              name: `${EMOJI.FIRE} Winner`,
-              value: `<@${item.curWinId}>`,
-              inline: true,
-            },
-            {
-              name: `${EMOJI.BID} Price`,
-              value: `${item.curBid} pts`,
-              inline: true,
-            },
-            {
-              name: `${EMOJI.INFO} Source`,
-              value: "📊 Google Sheet",
-              inline: true,
-            }
-          )
-          .setFooter({ text: `${timestamp}` })
-          .setTimestamp(),
+        new EmbedBuilder({
+          color: COLORS.AUCTION,
+          title: `${EMOJI.AUCTION} SOLD!`,
+          description: `**${item.displayName}** sold!`,
+          fields: [
+            { name: `${EMOJI.FIRE} Winner`, value: `<@${item.curWinId}>`, inline: true },
+            { name: `${EMOJI.BID} Price`, value: `${item.curBid} pts`, inline: true },
+            { name: `${EMOJI.INFO} Source`, value: "📊 Google Sheet", inline: true },
+          ],
+          footer: { text: `${timestamp}` },
+          timestamp: new Date().toISOString(),
+        }),
       ],
     });
 
-    // 🧾 Log result to sheet
-    try {
-      if (!postToSheetFunc) {
-        console.error(`${EMOJI.ERROR} postToSheet not initialized.`);
-      } else {
-        await getPostToSheet()({
+    // 🧾 Log result to sheet without blocking the next item
+    // (the sheet queue is FIFO, so logs still land in item order)
+    if (!postToSheetFunc) {
+      console.error(`${EMOJI.ERROR} postToSheet not initialized.`);
+    } else {
+      runSheetWriteInBackground(async () => {
+        const resp = await getPostToSheet()({
           action: "logAuctionResult",
           itemIndex: item.source === "GoogleSheet" ? item.sheetIndex : -1,
           winner: item.curWin,
@@ -1608,47 +1833,51 @@ async function itemEnd(client, config, channel) {
           auctionStartTime: item.auctionStartTime,
           auctionEndTime: endTimeStr,
         });
-      }
-    } catch (err) {
-      console.error(`${EMOJI.ERROR} Failed to log auction result:`, err);
+        if (resp && resp.ok === false) {
+          console.error(`${EMOJI.ERROR} Failed to log auction result for ${item.item}:`, resp.err);
+        }
+      }, `log auction result for ${item.item}`);
     }
 
     // 🧠 AUTO-UPDATE LEARNING SYSTEM (Bot learns from auction result)
-    try {
-      if (intelligenceEngine && intelligenceEngine.learningSystem) {
-        const updated = await intelligenceEngine.learningSystem.updatePredictionAccuracy(
-          'price_prediction',
-          item.item,
-          item.curBid
-        );
-
-        if (updated) {
-          console.log(`🧠 [LEARNING] Auto-updated prediction accuracy for "${item.item}" (actual: ${item.curBid}pts)`);
+    // Runs in the background with the result log so the next item isn't held up
+    runSheetWriteInBackground(async () => {
+      try {
+        if (intelligenceEngine && intelligenceEngine.learningSystem) {
+          const updated = await intelligenceEngine.learningSystem.updatePredictionAccuracy(
+            'price_prediction',
+            item.item,
+            item.curBid
+          );
 
-          // Optional: Send notification to admin logs
-          try {
-            const adminChannel = await discordCache?.getChannel('admin_logs_channel_id');
-            if (adminChannel) {
-              await adminChannel.send(
-                `🧠 **Bot Learning Update**\n` +
-                `✅ Updated prediction accuracy for **${item.item}**\n` +
-                `Actual sale price: ${item.curBid}pts\n` +
-                `Bot is getting smarter! Check \`!learningmetrics\` to see accuracy.`
-              );
+          if (updated) {
+            console.log(`🧠 [LEARNING] Auto-updated prediction accuracy for "${item.item}" (actual: ${item.curBid}pts)`);
+
+            // Optional: Send notification to admin logs
+            try {
+              const adminChannel = await discordCache?.getChannel('admin_logs_channel_id');
+              if (adminChannel) {
+                await adminChannel.send(
+                  `🧠 **Bot Learning Update**\n` +
+                  `✅ Updated prediction accuracy for **${item.item}**\n` +
+                  `Actual sale price: ${item.curBid}pts\n` +
+                  `Bot is getting smarter! Check \`!learningmetrics\` to see accuracy.`
+                );
+              }
+            } catch (notifyErr) {
+              // Silent fail on notification (not critical)
+              console.log(`[LEARNING] Could not send admin notification: ${notifyErr.message}`);
             }
-          } catch (notifyErr) {
-            // Silent fail on notification (not critical)
-            console.log(`[LEARNING] Could not send admin notification: ${notifyErr.message}`);
+          } else {
+            // No matching prediction found (item wasn't predicted, or already updated)
+            console.log(`[LEARNING] No pending prediction found for "${item.item}" (may not have been predicted)`);
           }
-        } else {
-          // No matching prediction found (item wasn't predicted, or already updated)
-          console.log(`[LEARNING] No pending prediction found for "${item.item}" (may not have been predicted)`);
         }
+      } catch (learnErr) {
+        console.error(`${EMOJI.ERROR} Failed to update learning system:`, learnErr);
+        // Continue auction even if learning fails (non-critical)
       }
-    } catch (learnErr) {
-      console.error(`${EMOJI.ERROR} Failed to update learning system:`, learnErr);
-      // Continue auction even if learning fails (non-critical)
-    }
+    }, `learning update for ${item.item}`);
 
     // 🧩 Update item in queue array with winner info (don't push, or it loops forever!)
     // The item is already in sessionItems at currentItemIndex, just add winner fields
@@ -1664,64 +1893,31 @@ async function itemEnd(client, config, channel) {
     // ⚠️ NO WINNER
     await channel.send({
       embeds: [
-        new EmbedBuilder()
-          .setColor(COLORS.INFO)
-          .setTitle(`${EMOJI.ERROR} NO BIDS`)
-          .setDescription(
-            `**${item.item}** had no bids (will not be recorded).`
-          )
-          .addFields({
-            name: `${EMOJI.INFO} Note`,
-            value: "Item remains in BiddingItems sheet for future auctions.",
-            inline: false,
-          }),
+        new EmbedBuilder({
+          color: COLORS.INFO,
+          title: `${EMOJI.ERROR} NO BIDS`,
+          description: `**${item.displayName}** had no bids (will not be recorded).`,
+          fields: [
+            {
+              name: `${EMOJI.INFO} Note`,
+              value: "Item remains in BiddingItems sheet for future auctions.",
+              inline: false,
+            },
+          ],
+        }),
       ],
     });
   }
 
-  // 🔒 Lock and archive the thread after the auction ends
-  try {
-    // Check if channel is a thread (type 11 or 12 = public/private thread)
-    if (channel && (channel.type === 11 || channel.type === 12)) {
-      // Refetch thread to ensure it still exists
-      const refreshedThread = await channel.fetch().catch(() => null);
-      if (!refreshedThread) {
-        console.warn(
-          `⚠️ Thread ${channel.id} no longer exists, skipping lock/archive`
-        );
-      } else {
-        // Lock the thread first to prevent new messages
-        if (typeof refreshedThread.setLocked === "function") {
-          await refreshedThread
-            .setLocked(true, "Auction ended")
-            .catch((err) => {
-              console.warn(
-                `⚠️ Failed to lock thread ${refreshedThread.id}:`,
-                err.message
-              );
-            });
-          console.log(`🔒 Locked thread for ${item.item}`);
-        }
+  // 🔒 Lock and archive the thread after the auction ends, in the background
+  // (closeItemThread handles its own errors)
+  closeItemThread(channel, item.item);
 
-        // Small delay to avoid race conditions with Discord API
-        await new Promise((resolve) => setTimeout(resolve, 500));
-
-        // Then archive it to hide from active list
-        if (typeof refreshedThread.setArchived === "function") {
-          await refreshedThread
-            .setArchived(true, "Auction ended")
-            .catch((err) => {
-              console.warn(
-                `⚠️ Failed to archive thread ${refreshedThread.id}:`,
-                err.message
-              );
-            });
-          console.log(`📦 Archived thread for ${item.item}`);
-        }
-      }
-    }
-  } catch (err) {
-    console.warn(`⚠️ Error locking/archiving thread:`, err.message);
+  // The session may have been ended or finalized while this item was being
+  // announced; advancing now would start an item after "session complete"
+  if (!auctionState.active || auctionState.currentItem !== item) {
+    console.log(`${EMOJI.STOP} Session ended during item close - not advancing`);
+    return;
   }
 
   // ✅ Move to next item
@@ -1743,7 +1939,11 @@ async function itemEnd(client, config, channel) {
   if (auctionState.currentItemIndex < auctionState.sessionItems.length) {
     // ➡️ Next item
     console.log(`⏭️ Moving to next item...`);
-    await auctionNextItem(client, config, biddingChannel);
+    // Hand off without awaiting so this item's call (timer callback or
+    // admin stop) returns now instead of pending through the next preview
+    auctionNextItem(client, config, biddingChannel).catch((err) =>
+      console.error(`${EMOJI.ERROR} Failed to start next item:`, err)
+    );
   } else {
     // ✅ ALL DONE
     console.log(`🎉 All items completed. Finalizing session.`);
@@ -1800,38 +2000,40 @@ async function finalizeSession(client, config, channel) {
     biddingModule.stopCacheAutoRefresh();
   }
 
-  // Get only items that were sold (have winners)
-  const soldItems = auctionState.sessionItems.filter((s) => s.winner);
-
-  const summary = soldItems
-    .map((s, i) => `${i + 1}. **${s.item}** 📊: ${s.winner} - ${s.amount}pts`)
-    .join("\n");
-
-  // Truncate summary if it exceeds Discord's 1024 character limit for embed fields
-  let truncatedSummary = summary || "No sales";
-  if (truncatedSummary.length > 1024) {
-    // Find a good truncation point (end of a line) within the limit
-    const maxLength = 1000; // Leave room for "... and X more"
-    const truncateAt = truncatedSummary.lastIndexOf('\n', maxLength);
-    const cutPoint = truncateAt > 0 ? truncateAt : maxLength;
-    const remainingItems = soldItems.length - truncatedSummary.substring(0, cutPoint).split('\n').length;
-    truncatedSummary = truncatedSummary.substring(0, cutPoint) + `\n\n*... and ${remainingItems} more items*`;
+  // Get only items that were sold (have winners), totalling revenue and
+  // formatting their summary lines in the same pass
+  const soldItems = [];
+  const summaryLines = [];
+  let totalRevenue = 0;
+  for (const s of auctionState.sessionItems) {
+    if (!s.winner) continue;
+    soldItems.push(s);
+    summaryLines.push(`${soldItems.length}. **${s.displayName}** 📊: ${s.winner} - ${s.amount}pts`);
+    totalRevenue += s.amount;
   }
 
+  // Split the summary across as many fields as Discord's 1024-char limit requires
+  const summaryChunks = chunkFieldLines(summaryLines);
+
   const mainEmbed = new EmbedBuilder()
     .setColor(COLORS.SUCCESS)
     .setTitle(`${EMOJI.SUCCESS} Auctioneering Session Complete!`)
     .setDescription(`**${soldItems.length}** item(s) sold`)
-    .addFields({
-      name: `${EMOJI.LIST} Summary`,
-      value: truncatedSummary,
-      inline: false,
-    })
+    .addFields(
+      (summaryChunks.length > 0 ? summaryChunks : ["No sales"]).map((value, i) => ({
+        name: i === 0 ? `${EMOJI.LIST} Summary` : `${EMOJI.LIST} Summary (cont.)`,
+        value,
+        inline: false,
+      }))
+    )
     .setFooter({ text: "Processing results and submitting to sheets..." })
     .setTimestamp();
 
   await channel.send({ embeds: [mainEmbed] });
 
+  // Per-item result logs must reach the sheet before results are tallied and moved
+  await flushSheetWrites();
+
   // STEP 1: Build combined results for tally
   const combinedResults = await buildCombinedResults(config);
 
@@ -1859,10 +2061,14 @@ async function finalizeSession(client, config, channel) {
 
       console.log(`${EMOJI.SUCCESS} Session results submitted successfully`);
 
-      // Display tally summary in bidding channel
-      const winnersWithSpending = combinedResults.filter(
-        (r) => r.totalSpent > 0
-      );
+      // Display tally summary in bidding channel (spenders and total in one pass)
+      const winnersWithSpending = [];
+      let totalSpent = 0;
+      for (const r of combinedResults) {
+        if (r.totalSpent <= 0) continue;
+        winnersWithSpending.push(r);
+        totalSpent += r.totalSpent;
+      }
       if (winnersWithSpending.length > 0) {
         const tallyEmbed = new EmbedBuilder()
           .setColor(COLORS.SUCCESS)
@@ -1873,12 +2079,7 @@ async function finalizeSession(client, config, channel) {
               .map((r, i) => `${i + 1}. **${r.member}** - ${r.totalSpent} pts`)
               .join("\n")}`
           )
-          .setFooter({
-            text: `Total: ${winnersWithSpending.reduce(
-              (sum, r) => sum + r.totalSpent,
-              0
-            )} pts spent`,
-          })
+          .setFooter({ text: `Total: ${totalSpent} pts spent` })
           .setTimestamp();
 
         await channel.send({ embeds: [tallyEmbed] });
@@ -1979,16 +2180,6 @@ async function finalizeSession(client, config, channel) {
 
   if (adminLogs) {
     const itemsWithWinners = soldItems.length;
-    const totalRevenue = soldItems.reduce((sum, s) => sum + s.amount, 0);
-
-    // Ensure summary is properly formatted and within Discord's limits
-    let summaryValue = summary || "No sales recorded";
-    if (summaryValue.length > 1024) {
-      summaryValue = summaryValue.substring(0, 1020) + "...";
-    }
-    if (!summaryValue || summaryValue.trim().length === 0) {
-      summaryValue = "No sales recorded";
-    }
 
     const adminEmbed = new EmbedBuilder()
       .setColor(COLORS.SUCCESS)
@@ -2008,11 +2199,11 @@ async function finalizeSession(client, config, channel) {
           value: `**Total:** ${totalRevenue}pts`,
           inline: true,
         },
-        {
-          name: `📋 Results`,
-          value: summaryValue,
+        ...(summaryChunks.length > 0 ? summaryChunks : ["No sales recorded"]).map((value, i) => ({
+          name: i === 0 ? `📋 Results` : `📋 Results (cont.)`,
+          value,
           inline: false,
-        }
+        }))
       );
     } catch (err) {
       console.error(`${EMOJI.ERROR} Error adding fields to embed:`, err);
@@ -2075,8 +2266,9 @@ async function finalizeSession(client, config, channel) {
  * Builds combined results for all members showing total spending.
  *
  * PROCESS:
- * 1. Fetches fresh points from Google Sheets
- * 2. Aggregates spending from all session items
+ * 1. Aggregates spending from all session items
+ * 2. Fetches fresh points from Google Sheets (skipped when nothing sold
+ *    and the bidding module already holds the member list)
  * 3. Normalizes usernames for matching
  * 4. Creates result entry for every member (including 0 spenders)
  *
@@ -2090,60 +2282,67 @@ async function finalizeSession(client, config, channel) {
 async function buildCombinedResults(config) {
   console.log(`${EMOJI.CHART} Building combined results for ${auctionState.sessionItems?.length || 0} session items...`);
 
-  // Fetch fresh points from sheet
-  let allPoints = {};
-  try {
-    const data = await sheetAPI.call('getBiddingPoints');
-    allPoints = data.points || {};
-    console.log(`${EMOJI.SUCCESS} Fetched points for ${Object.keys(allPoints).length} members`);
-  } catch (err) {
-    console.error(`${EMOJI.ERROR} Failed to fetch bidding points:`, err);
-    return [];
-  }
-
   // Validate sessionItems exists
   if (!auctionState.sessionItems || !Array.isArray(auctionState.sessionItems)) {
     console.error(`${EMOJI.ERROR} Invalid sessionItems array in auctionState`);
     return [];
   }
 
-  // Use PointsCache for efficient operations
-  const pointsCache = new PointsCache(allPoints);
-  const allMembers = pointsCache.getAllUsernames();
-
   // Combine all winners from session (only items with winners)
   const winners = {};
   let skippedItems = 0;
   let processedItems = 0;
 
-  auctionState.sessionItems.forEach((item, index) => {
-    // Skip items without winners (unsold items)
+  for (const item of auctionState.sessionItems) {
+    // Skip items without winners (unsold items); counted in the summary log below
     if (!item.winner || !item.amount) {
       skippedItems++;
-      console.log(`${EMOJI.WARNING} Skipping item ${index + 1} "${item.item}" - no winner or amount`);
-      return;
+      continue;
     }
 
     const normalizedWinner = normalizeUsername(item.winner);
     winners[normalizedWinner] = (winners[normalizedWinner] || 0) + item.amount;
     processedItems++;
-  });
+  }
 
   console.log(`${EMOJI.SUCCESS} Processed ${processedItems} items with winners, skipped ${skippedItems} unsold items`);
 
-  // Build results for ALL members (including 0s for clean logs)
+  // Nothing sold: every member gets 0, so the member list from the bidding
+  // module's session points cache is enough and the sheet round trip is skipped
+  if (processedItems === 0) {
+    const cachedPoints = biddingModule?.getBiddingState?.().cp;
+    if (cachedPoints && cachedPoints.size() > 0) {
+      const results = cachedPoints.getAllUsernames().map((m) => ({ member: m, totalSpent: 0 }));
+      console.log(`${EMOJI.CHART} Built results: 0 winners out of ${results.length} members (cached member list)`);
+      return results;
+    }
+  }
+
+  // Fetch fresh points from sheet so every winner has a member row
+  let allPoints = {};
+  try {
+    const data = await sheetAPI.call('getBiddingPoints');
+    allPoints = pointsMapFromResponse(data);
+    console.log(`${EMOJI.SUCCESS} Fetched points for ${Object.keys(allPoints).length} members`);
+  } catch (err) {
+    console.error(`${EMOJI.ERROR} Failed to fetch bidding points:`, err);
+    return [];
+  }
+
+  // Only the member names are needed here, so skip building a PointsCache
+  const allMembers = Object.keys(allPoints);
+
+  // Build results for ALL members (including 0s for clean logs).
+  // Member names are only normalized when there is a winner to match against.
+  let winnerCount = 0;
   const results = allMembers.map((m) => {
-    const normalizedMember = normalizeUsername(m);
-    return {
-      member: m,
-      totalSpent: winners[normalizedMember] || 0,
-    };
+    const totalSpent = processedItems > 0 ? winners[normalizeUsername(m)] || 0 : 0;
+    if (totalSpent > 0) winnerCount++;
+    return { member: m, totalSpent };
   });
 
   console.log(
-    `${EMOJI.CHART} Built results: ${
-      results.filter((r) => r.totalSpent > 0).length
-    } winners out of ${results.length} members`
+    `${EMOJI.CHART} Built results: ${winnerCount} winners out of ${results.length} members`
   );
 
   return results;
@@ -2173,11 +2372,11 @@ async function buildCombinedResults(config) {
 function pauseSession() {
   if (!auctionState.active || auctionState.paused) return false;
   auctionState.paused = true;
-  auctionState.pausedTime = Date.now();
+  auctionState.pausedTime = performance.now(); // Monotonic, so clock adjustments can't skew the pause length
 
   // Store remaining time for accurate display during pause
   if (auctionState.currentItem) {
-    auctionState.currentItem.remainingTime = Math.max(0, auctionState.currentItem.endTime - Date.now());
+    auctionState.currentItem.remainingTime = itemTimeLeft(auctionState.currentItem);
   }
 
   clearAllAuctionTimers();
@@ -2214,12 +2413,13 @@ function resumeSession(client, config, channel) {
   if (!auctionState.active || !auctionState.paused) return false;
   auctionState.paused = false;
 
-  const pausedDuration = Date.now() - auctionState.pausedTime;
-  auctionState.currentItem.endTime += pausedDuration;
-
-  // Clean up remainingTime field after resume
+  // Paused during a preview there is no running item to shift yet
   if (auctionState.currentItem) {
-    delete auctionState.currentItem.remainingTime;
+    const pausedDuration = performance.now() - auctionState.pausedTime;
+    auctionState.currentItem.endTime += pausedDuration;
+
+    // Clear remainingTime after resume (assigned rather than deleted to keep the item's shape)
+    auctionState.currentItem.remainingTime = undefined;
   }
 
   scheduleItemTimers(client, config, channel);
@@ -2481,17 +2681,17 @@ function getAuctionState() {
  * @returns {Promise<void>}
  */
 async function handleQueueList(message, biddingState) {
-  const auctQueue = auctionState.sessions || [];
   const biddingQueue = biddingState.q || [];
 
   // Active auction - show current session items
   if (auctionState.active && auctionState.sessionItems && auctionState.sessionItems.length > 0) {
     const currentIndex = auctionState.currentItemIndex || 0;
-    const remainingItems = auctionState.sessionItems.slice(currentIndex);
     const completedCount = currentIndex;
     const totalCount = auctionState.sessionItems.length;
+    // Count what's left instead of copying the rest of the queue; only 20 lines are shown
+    const remainingCount = Math.max(0, totalCount - currentIndex);
 
-    if (remainingItems.length === 0) {
+    if (remainingCount === 0) {
       return await message.reply(
         `${EMOJI.SUCCESS} **All items in current session completed!**\n` +
         `${completedCount}/${totalCount} items auctioned.\n\n` +
@@ -2500,15 +2700,15 @@ async function handleQueueList(message, biddingState) {
     }
 
     let queueText = "";
-    remainingItems.slice(0, 20).forEach((item, idx) => {
+    auctionState.sessionItems.slice(currentIndex, currentIndex + 20).forEach((item, idx) => {
       const position = currentIndex + idx + 1;
       const qty = item.quantity > 1 ? ` x${item.quantity}` : "";
       const status = idx === 0 && auctionState.currentItem ? " **(ACTIVE NOW)**" : "";
-      queueText += `${position}. ${item.item}${qty} - ${item.startPrice}pts • ${item.duration}m${status}\n`;
+      queueText += `${position}. ${item.displayName}${qty} - ${item.startPrice}pts • ${item.duration}m${status}\n`;
     });
 
-    if (remainingItems.length > 20) {
-      queueText += `\n*...and ${remainingItems.length - 20} more items*\n`;
+    if (remainingCount > 20) {
+      queueText += `\n*...and ${remainingCount - 20} more items*\n`;
     }
 
     const embed = new EmbedBuilder()
@@ -2516,10 +2716,10 @@ async function handleQueueList(message, biddingState) {
       .setTitle(`${EMOJI.LIST} Current Session Queue`)
       .setDescription(
         `**Progress:** ${completedCount}/${totalCount} items completed\n` +
-        `**Remaining:** ${remainingItems.length} items\n\n` +
+        `**Remaining:** ${remainingCount} items\n\n` +
         queueText
       )
-      .setFooter({ text: `Session active • ${remainingItems.length} items remaining` })
+      .setFooter({ text: `Session active • ${remainingCount} items remaining` })
       .setTimestamp();
 
     return await message.reply({ embeds: [embed] });
@@ -2848,7 +3048,7 @@ async function handleBidStatus(message, config) {
       ? `${EMOJI.PAUSE} PAUSED (${fmtTime(
           auctionState.currentItem.remainingTime || 0
         )})`
-      : fmtTime(Math.max(0, auctionState.currentItem.endTime - Date.now()));
+      : fmtTime(itemTimeLeft(auctionState.currentItem));
 
     statEmbed.addFields(
       {
@@ -2871,46 +3071,15 @@ async function handleBidStatus(message, config) {
     });
   }
 
-  // Show remaining items in active sessions
-  if (
-    auctionState.active &&
-    auctionState.sessions &&
-    auctionState.sessions.length > 0
-  ) {
-    const remainingItems = [];
-    for (
-      let i = auctionState.currentSessionIndex;
-      i < auctionState.sessions.length;
-      i++
-    ) {
-      const session = auctionState.sessions[i];
-      const startIdx =
-        i === auctionState.currentSessionIndex
-          ? auctionState.currentItemIndex + 1
-          : 0;
-      for (
-        let j = startIdx;
-        j < session.items.length && remainingItems.length < 5;
-        j++
-      ) {
-        const item = session.items[j];
-        remainingItems.push(
-          `${remainingItems.length + 1}. ${item.item}${
-            item.quantity > 1 ? ` x${item.quantity}` : ""
-          }`
-        );
-      }
-      if (remainingItems.length >= 5) break;
-    }
+  // Show remaining items, derived from the session queue and current index
+  if (auctionState.active && auctionState.sessionItems) {
+    const nextIndex = auctionState.currentItemIndex + 1;
+    const totalRemaining = Math.max(0, auctionState.sessionItems.length - nextIndex);
+    const remainingItems = auctionState.sessionItems
+      .slice(nextIndex, nextIndex + 5)
+      .map((item, i) => `${i + 1}. ${item.displayName}`);
 
     if (remainingItems.length > 0) {
-      const totalRemaining = auctionState.sessions
-        .slice(auctionState.currentSessionIndex)
-        .reduce((sum, s, idx) => {
-          const startIdx = idx === 0 ? auctionState.currentItemIndex + 1 : 0;
-          return sum + (s.items.length - startIdx);
-        }, 0);
-
       statEmbed.addFields({
         name: `${EMOJI.LIST} Remaining Items`,
         value:
@@ -2995,11 +3164,12 @@ async function handleCancelItem(message) {
       // Unlock points for current bidder
       const biddingState = biddingModule.getBiddingState();
       if (auctionState.currentItem && auctionState.currentItem.curWin) {
-        const amt = biddingState.lp[auctionState.currentItem.curWin] || 0;
-        biddingState.lp[auctionState.currentItem.curWin] = 0;
+        // bidding.js owns the locked-points key format (see its lockKey())
+        delete biddingState.lp[biddingModule.lockKey(auctionState.currentItem)];
         biddingModule.saveBiddingState();
       }
 
+      await settleBidAnnouncements(auctionState.currentItem);
       const itemName = auctionState.currentItem
         ? auctionState.currentItem.item
         : "Unknown Item";
@@ -3054,9 +3224,11 @@ async function handleCancelItem(message) {
       const parentChannel = thread.parent || message.channel;
       auctionState.currentItem = null;
       auctionState.currentItemIndex++;
-      auctionState.timers.nextItem = setTimeout(async () => {
-        await auctionNextItem(message.client, cfg, parentChannel);
-      }, 20000);
+      auctionState.timers.nextItem = setTimeout(() => {
+        auctionNextItem(message.client, cfg, parentChannel).catch((err) =>
+          console.error(`${EMOJI.ERROR} Failed to start next item:`, err)
+        );
+      }, ITEM_WAIT);
 
       const successEmbed = new EmbedBuilder()
         .setColor(0x00ff00)
@@ -3166,11 +3338,12 @@ async function handleSkipItem(message) {
       // Unlock points for current bidder
       const biddingState = biddingModule.getBiddingState();
       if (auctionState.currentItem && auctionState.currentItem.curWin) {
-        const amt = biddingState.lp[auctionState.currentItem.curWin] || 0;
-        biddingState.lp[auctionState.currentItem.curWin] = 0;
+        // bidding.js owns the locked-points key format (see its lockKey())
+        delete biddingState.lp[biddingModule.lockKey(auctionState.currentItem)];
         biddingModule.saveBiddingState();
       }
 
+      await settleBidAnnouncements(auctionState.currentItem);
       const itemName = auctionState.currentItem
         ? auctionState.currentItem.item
         : "Unknown Item";
@@ -3223,9 +3396,11 @@ async function handleSkipItem(message) {
       const parentChannel = thread.parent || message.channel;
       auctionState.currentItem = null;
       auctionState.currentItemIndex++;
-      auctionState.timers.nextItem = setTimeout(async () => {
-        await auctionNextItem(message.client, cfg, parentChannel);
-      }, 20000);
+      auctionState.timers.nextItem = setTimeout(() => {
+        auctionNextItem(message.client, cfg, parentChannel).catch((err) =>
+          console.error(`${EMOJI.ERROR} Failed to start next item:`, err)
+        );
+      }, ITEM_WAIT);
 
       const successEmbed = new EmbedBuilder()
         .setColor(0x00ff00)
@@ -3427,6 +3602,7 @@ async function endAuctionSession(client, config, channel) {
     auctionState.currentItem.status === "active"
   ) {
     auctionState.currentItem.status = "cancelled";
+    await settleBidAnnouncements(auctionState.currentItem);
 
     // Try to notify in the current item thread if possible
     try {
@@ -3501,6 +3677,9 @@ async function handleMoveToDistribution(message, config, client) {
       ],
     });
 
+    // Make sure every logged winner is on the sheet before scanning it
+    await flushSheetWrites();
+
     // Call the Google Sheets function with retry logic
     const maxRetries = 3;
     let moveSuccess = false;
@@ -3703,17 +3882,9 @@ async function startSession2(client, config) {
 
     try {
       const pointsData = await sheetAPI.call('getBiddingPoints');
-      const members = pointsData.members || pointsData.data?.members || [];
-      const points = pointsData.points || pointsData.data?.points || {};
-
-      if (members.length > 0 || Object.keys(points).length > 0) {
-        const pointsMap = Object.keys(points).length > 0 ? points : members.reduce((acc, member) => {
-          const name = member?.username?.trim();
-          if (!name) return acc;
-          acc[name] = Number(member?.pointsLeft) || 0;
-          return acc;
-        }, {});
+      const pointsMap = pointsMapFromResponse(pointsData);
 
+      if (Object.keys(pointsMap).length > 0) {
         // Update bidding module's cache
         const biddingState = biddingModule.getBiddingState();
         biddingState.cp = new PointsCache(pointsMap);
@@ -4093,6 +4264,7 @@ function resetSessionState() {
 
 module.exports = {
   initialize,
+  shutdown,
   itemEnd,
   startAuctioneering,
   auctionNextItem, // Used internally by startAuctioneering and itemEnd
@@ -4107,6 +4279,7 @@ module.exports = {
   extendCurrentItem,
   updateCurrentItemState,
   rescheduleItemTimers, // Reschedule timers after bid extension
+  itemTimeLeft, // Monotonic remaining time, used by bidding.js for extensions
   safelyClearItemTimers, // Clear item timers immediately (prevents race condition)
   handleQueueList,
   handleMyPoints,
@@ -4117,5 +4290,4 @@ module.exports = {
   handleMoveToDistribution,
   scheduleWeeklySaturdayAuction, // Weekly Saturday 12:00 PM GMT+8 auction scheduler
   resetSessionState, // Reset sessionFinalized flag and clear Session 2 timers
-  // getCurrentSessionBoss: () => currentSessionBoss - REMOVED: Not used anywhere
 };
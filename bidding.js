@@ -73,7 +73,8 @@
  * 3. RATE LIMITING:
  *    - 3-second cooldown between bids per user
  *    - Prevents spam and accidental duplicate submissions
- *    - Timestamp-based tracking in st.lb
+ *    - Monotonic (performance.now) timestamps in st.lb, so clock steps
+ *      cannot lift or extend a cooldown
  *
  * 4. TIME EXTENSION LOGIC:
  *    - Bids in final 60 seconds extend auction by 1 minute
@@ -178,6 +179,7 @@
 
 const { EmbedBuilder, ButtonBuilder, ActionRowBuilder, ButtonStyle, ComponentType } = require("discord.js");
 const fs = require("fs");
+const { performance } = require("perf_hooks");
 const { normalizeUsername, formatDuration } = require("./modules/bidding/utilities");
 const errorHandler = require('./utils/error-handler');
 const { PointsCache } = require('./utils/points-cache');
@@ -248,6 +250,13 @@ const ME = 60;
  */
 const CACHE_REFRESH_INTERVAL = 30 * 60 * 1000;
 
+/**
+ * How long a loaded points cache is reused before reads refetch it (60 seconds)
+ * Lets bursts of lookups share one webhook call; writes clear the cache outright
+ * @constant {number}
+ */
+const POINTS_CACHE_TTL = 60 * 1000;
+
 /**
  * Preview time before auction starts in milliseconds (30 seconds)
  * Gives users time to prepare before bidding begins
@@ -409,10 +418,16 @@ let st = {
 
   /**
    * @type {Object.<string, number>} Last bid timestamp per user for rate limiting
-   * Key: user ID, Value: timestamp
+   * Key: user ID, Value: monotonic timestamp (performance.now())
    */
   lb: {},
 
+  /**
+   * @type {Object.<string, number>} Last admin-log time per user for bid rejections
+   * Key: `${userId}_bid_rejection`, Value: timestamp
+   */
+  lastBidRejectionLog: {},
+
   /** @type {boolean} Pause state for bid confirmation handling */
   pause: false,
 
@@ -436,23 +451,60 @@ let isAdmFunc = null;
 // HELPER FUNCTIONS - Role & Permission Checks
 // ═══════════════════════════════════════════════════════════════════════════
 
+/** ELYSIUM role ID, resolved from the guild on first check */
+let elysiumRoleId = null;
+
 /**
  * Checks if member has ELYSIUM role required for bidding
+ * Looks the role up by name once, then tests membership by ID (a single
+ * Collection lookup) instead of scanning the member's roles per bid. The
+ * cached ID is re-resolved if that role no longer exists in the guild
+ * (deleted and recreated) or has been renamed.
  *
  * @param {GuildMember} m - Discord guild member object
  * @returns {boolean} True if member has ELYSIUM role
  */
-const hasRole = (m) => m.roles.cache.some((r) => r.name === "ELYSIUM");
+const hasRole = (m) => {
+  const cached = elysiumRoleId && m.guild?.roles.cache.get(elysiumRoleId);
+  if (!cached || cached.name !== "ELYSIUM") {
+    const role = m.guild?.roles.cache.find((r) => r.name === "ELYSIUM");
+    if (!role) return m.roles.cache.some((r) => r.name === "ELYSIUM");
+    elysiumRoleId = role.id;
+  }
+  return m.roles.cache.has(elysiumRoleId);
+};
+
+/** Admin role IDs per configured admin_roles array, resolved from the guild on first check */
+const adminRoleIds = new WeakMap();
 
 /**
  * Checks if member has admin privileges based on configured admin roles
+ * Like hasRole, the configured names are resolved to role IDs and cached, so
+ * an admin is confirmed with a few Collection lookups. The cache is dropped
+ * when a cached role is gone or renamed. A miss falls back to the name scan,
+ * which stays authoritative, so roles created or renamed since the IDs were
+ * cached are still honoured (and re-cached).
  *
  * @param {GuildMember} m - Discord guild member object
  * @param {Object} c - Bot configuration with admin_roles array
  * @returns {boolean} True if member has any admin role
  */
-const isAdm = (m, c) =>
-  m.roles.cache.some((r) => c.admin_roles.includes(r.name));
+const isAdm = (m, c) => {
+  const guildRoles = m.guild?.roles.cache;
+  let ids = adminRoleIds.get(c.admin_roles);
+  if (ids && !(guildRoles && ids.every((id) => c.admin_roles.includes(guildRoles.get(id)?.name)))) {
+    ids = null;
+  }
+  if (ids && ids.some((id) => m.roles.cache.has(id))) return true;
+
+  const isAdmin = m.roles.cache.some((r) => c.admin_roles.includes(r.name));
+  if (guildRoles && (!ids || isAdmin)) {
+    const roles = guildRoles.filter((r) => c.admin_roles.includes(r.name));
+    if (roles.size > 0) adminRoleIds.set(c.admin_roles, [...roles.keys()]);
+    else adminRoleIds.delete(c.admin_roles);
+  }
+  return isAdmin;
+};
 
 // ═══════════════════════════════════════════════════════════════════════════
 // HELPER FUNCTIONS - Time & Duration Formatting
@@ -502,6 +554,17 @@ const { formatUptime: fmtTime } = require('./utils/common');
 // BUTTON UTILITIES
 // ═══════════════════════════════════════════════════════════════════════════
 
+/**
+ * Builds the shared custom-ID suffix for one confirmation dialog's buttons.
+ * Read once per dialog so every button in it carries the same timestamp.
+ *
+ * @param {string} userId - ID of the user the dialog belongs to
+ * @returns {string} Suffix in the form `<userId>_<timestamp>`
+ */
+function buttonIdSuffix(userId) {
+  return `${userId}_${Date.now()}`;
+}
+
 /**
  * Creates a disabled button row from two buttons.
  * Uses fresh ButtonBuilder instances to avoid mutation issues with ButtonBuilder.from().
@@ -526,6 +589,18 @@ function createDisabledRow(btn1, btn2) {
   return new ActionRowBuilder().addComponents(disabledBtn1, disabledBtn2);
 }
 
+/**
+ * Embed data shown when a confirmation dialog times out. Identical for every
+ * dialog, so it is built once; callers copy it with `new EmbedBuilder(...)`
+ * and stamp the time.
+ * @constant {Object}
+ */
+const CONFIRMATION_EXPIRED_EMBED = Object.freeze({
+  color: COLORS.ERROR,
+  title: `${EMOJI.ERROR} Timed Out`,
+  description: "Confirmation expired",
+});
+
 // ═══════════════════════════════════════════════════════════════════════════
 // POINTS LOCKING SYSTEM - Race Condition Prevention
 // ═══════════════════════════════════════════════════════════════════════════
@@ -536,14 +611,27 @@ function createDisabledRow(btn1, btn2) {
  * CRITICAL: This function prevents users from bidding more points than they have
  * across multiple simultaneous auctions by subtracting locked points from total.
  *
- * @param {string} u - Username (will be normalized)
+ * @param {string} key - Normalized username (see normalizeUsername)
  * @param {number} tot - Total points the user has
  * @returns {number} Available points (never negative)
  * @example
  * // User has 1000 total points, 300 locked in another auction
- * avail("Username", 1000) // Returns 700
+ * avail("username", 1000) // Returns 700
+ */
+const avail = (key, tot) => Math.max(0, tot - (st.lp[key] || 0));
+
+/**
+ * Returns the st.lp key holding an item's current leader's locked points
+ *
+ * Uses the key stored when the bid was taken (curWinKey), falling back to
+ * this module's normalizeUsername for items that predate it. Other modules
+ * must use this rather than their own normalizer, which may key differently.
+ *
+ * @param {Object} item - Auction item (st.a or the auctioneering currentItem)
+ * @returns {string|null} Locked-points key, or null if nobody is leading
  */
-const avail = (u, tot) => Math.max(0, tot - (st.lp[normalizeUsername(u)] || 0));
+const lockKey = (item) =>
+  item && item.curWin ? item.curWinKey ?? normalizeUsername(item.curWin) : null;
 
 /**
  * Locks points for a user (atomic operation with persistence)
@@ -557,11 +645,13 @@ const avail = (u, tot) => Math.max(0, tot - (st.lp[normalizeUsername(u)] || 0));
  * - Called when user places a bid
  * - Called when user increases their existing bid (only lock difference)
  *
- * @param {string} u - Username (will be normalized)
+ * Bid paths normalize the bidder once and pass the key, rather than every
+ * helper re-normalizing the display name.
+ *
+ * @param {string} key - Normalized username (see normalizeUsername)
  * @param {number} amt - Amount of points to lock
  */
-const lock = (u, amt) => {
-  const key = normalizeUsername(u);
+const lock = (key, amt) => {
   st.lp[key] = (st.lp[key] || 0) + amt;
   save();
 };
@@ -579,11 +669,10 @@ const lock = (u, amt) => {
  * - Called when auction is cancelled or skipped
  * - Called after session finalization
  *
- * @param {string} u - Username (will be normalized)
+ * @param {string} key - Normalized username (see normalizeUsername)
  * @param {number} amt - Amount of points to unlock
  */
-const unlock = (u, amt) => {
-  const key = normalizeUsername(u);
+const unlock = (key, amt) => {
   st.lp[key] = Math.max(0, (st.lp[key] || 0) - amt);
   if (st.lp[key] === 0) delete st.lp[key];
   save();
@@ -626,7 +715,7 @@ const SHEET_SYNC_INTERVAL = 5 * 60 * 1000;
  */
 async function save(forceSync = false) {
   try {
-    const { th, pauseTimer, cacheRefreshTimer, ...s } = st;
+    const { th, pauseTimer, cacheRefreshTimer, cp, ...s } = st;
 
     // Clean up circular references from pending confirmations
     const cleanState = {
@@ -637,13 +726,16 @@ async function save(forceSync = false) {
           return [key, cleanVal];
         })
       ),
-      // Convert PointsCache instance to plain object for JSON serialization
-      cp: s.cp && s.cp.toObject ? s.cp.toObject() : s.cp,
     };
 
     // Always save to local file for quick access (works even on ephemeral Koyeb FS)
     try {
-      fs.writeFileSync(SF, JSON.stringify(cleanState, null, 2));
+      // Compact JSON: this runs on every lock/unlock, and indentation roughly
+      // doubles the size of the embedded points cache. The cache only changes
+      // on reload, so its serialized form is reused rather than re-stringified.
+      const cpJson = cp && cp.toJSONString ? cp.toJSONString() : JSON.stringify(cp ?? null);
+      const stateJson = JSON.stringify(cleanState);
+      fs.writeFileSync(SF, `${stateJson.slice(0, -1)},"cp":${cpJson}}`);
     } catch (fileErr) {
       // On Koyeb, file system might be read-only or restricted
       console.warn(
@@ -789,6 +881,23 @@ function initializeBidding(config, isAdminFunc, auctioneeringRef, cache = null)
   startCleanupSchedule();
 }
 
+/**
+ * Releases the module's Google Sheets connection pool and drops queued bid
+ * announcements. Called from the bot's shutdown handlers so keep-alive sockets
+ * close cleanly.
+ *
+ * @returns {Promise<void>}
+ */
+async function shutdown() {
+  // Drop queued bid announcements so their timers don't fire mid-shutdown
+  for (const channelId of [...bidAnnouncers.keys()]) {
+    settleHighBidAnnouncements(channelId);
+  }
+  if (sheetAPI) {
+    await sheetAPI.close();
+  }
+}
+
 /**
  * Returns color value (passthrough for future color customization)
  *
@@ -813,6 +922,20 @@ function clearAllTimers() {
   return count;
 }
 
+/**
+ * Clears the current auction's countdown and end timers
+ * Used by pause, reschedule and auction end so none of them fire late
+ */
+function clearAuctionTimers() {
+  // Bug #15 fix: Delete timer keys after clearing to prevent orphaned references
+  [...ANNOUNCEMENTS.map((call) => call.key), "auctionEnd"].forEach((k) => {
+    if (st.th[k]) {
+      clearTimeout(st.th[k]);
+      delete st.th[k];
+    }
+  });
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // GOOGLE SHEETS API - Points & State Management
 // ═══════════════════════════════════════════════════════════════════════════
@@ -919,7 +1042,7 @@ async function loadCache(url) {
   st.ct = Date.now();
   save();
   console.log(
-    `✅ Cache: ${Date.now() - t0}ms - ${Object.keys(p).length} members`
+    `✅ Cache: ${Date.now() - t0}ms - ${st.cp.size()} members`
   );
 
   // Start auto-refresh timer if auction is active
@@ -930,6 +1053,15 @@ async function loadCache(url) {
   return true;
 }
 
+/**
+ * Checks whether the points cache was loaded within POINTS_CACHE_TTL
+ *
+ * @returns {boolean} True if st.cp can be used without refetching
+ */
+function isCacheFresh() {
+  return !!st.cp && !!st.ct && Date.now() - st.ct < POINTS_CACHE_TTL;
+}
+
 /**
  * Starts automatic cache refresh interval (30 minutes)
  *
@@ -1040,12 +1172,8 @@ async function logBidRejection(client, config, details) {
     // Debounce: Only log every 30 seconds per user to avoid spam
     const now = Date.now();
     const key = `${details.userId}_bid_rejection`;
-    if (st.lastBidRejectionLog && st.lastBidRejectionLog[key]) {
-      const timeSinceLastLog = now - st.lastBidRejectionLog[key];
-      if (timeSinceLastLog < 30000) return; // Skip if logged recently
-    }
-
-    if (!st.lastBidRejectionLog) st.lastBidRejectionLog = {};
+    const lastLog = st.lastBidRejectionLog[key];
+    if (lastLog && now - lastLog < 30000) return; // Skip if logged recently
     st.lastBidRejectionLog[key] = now;
 
     // Send to admin logs asynchronously (don't block bid processing)
@@ -1129,14 +1257,9 @@ function pauseAuction() {
   if (st.pause || !st.a || st.a.status !== "active") return false;
   st.pause = true;
   st.a.pausedAt = Date.now();
-  st.a.remainingTime = st.a.endTime - Date.now();
+  st.a.remainingTime = st.a.endTime - st.a.pausedAt;
 
-  ["goingOnce", "goingTwice", "finalCall", "auctionEnd"].forEach((k) => {
-    if (st.th[k]) {
-      clearTimeout(st.th[k]);
-      delete st.th[k];
-    }
-  });
+  clearAuctionTimers();
 
   console.log(`${EMOJI.PAUSE} PAUSED: ${st.a.remainingTime}ms remaining`);
   save();
@@ -1159,7 +1282,7 @@ function pauseAuction() {
  *
  * CRITICAL:
  * - Only works if auction is paused and active
- * - Cleans up pause metadata (pausedAt, remainingTime)
+ * - Clears pause metadata (pausedAt, remainingTime)
  * - Reschedules timers with new endTime
  *
  * USAGE:
@@ -1177,8 +1300,8 @@ function resumeAuction(cli, cfg) {
   const wasUnder60 = st.a.remainingTime < 60000;
   if (wasUnder60) {
     st.a.endTime = Date.now() + 60000;
-    st.a.goingOnceAnnounced = false;
-    st.a.goingTwiceAnnounced = false;
+    st.a.go1 = false;
+    st.a.go2 = false;
     console.log(
       `${EMOJI.PLAY} RESUME: Extended to 60s (was ${Math.floor(
         st.a.remainingTime / 1000
@@ -1189,8 +1312,8 @@ function resumeAuction(cli, cfg) {
     console.log(`${EMOJI.PLAY} RESUME: ${st.a.remainingTime}ms remaining`);
   }
 
-  delete st.a.pausedAt;
-  delete st.a.remainingTime;
+  st.a.pausedAt = null;
+  st.a.remainingTime = null;
 
   schedTimers(cli, cfg);
   save();
@@ -1222,11 +1345,14 @@ async function startNext(cli, cfg) {
     reason: `Auction: ${d.item}`,
   });
 
+  // Every field the auction ever carries is declared here (pause fields as
+  // null) so the object keeps one shape instead of growing and shrinking
   st.a = {
     ...d,
     threadId: th.id,
     curBid: d.startPrice,
     curWin: null,
+    curWinKey: null,
     curWinId: null,
     bids: [],
     winners: [], // For batch auctions
@@ -1235,6 +1361,8 @@ async function startNext(cli, cfg) {
     status: "preview",
     go1: false,
     go2: false,
+    pausedAt: null,
+    remainingTime: null,
   };
 
   const previewEmbed = new EmbedBuilder()
@@ -1275,7 +1403,9 @@ async function startNext(cli, cfg) {
   });
 
   st.th.aStart = setTimeout(
-    async () => await activate(cli, cfg, th),
+    () => activate(cli, cfg, th).catch((err) =>
+      console.error(`${EMOJI.ERROR} Failed to start auction:`, err)
+    ),
     PREVIEW_TIME
   );
   save();
@@ -1317,32 +1447,44 @@ async function activate(cli, cfg, th) {
 function schedTimers(cli, cfg) {
   const a = st.a,
     t = a.endTime - Date.now();
-  // Bug #15 fix: Delete timer keys after clearing to prevent orphaned references
-  ["goingOnce", "goingTwice", "finalCall", "auctionEnd"].forEach((k) => {
-    if (st.th[k]) {
-      clearTimeout(st.th[k]);
-      delete st.th[k];
-    }
-  });
-  if (t > TIMEOUTS.GOING_ONCE && !a.go1)
-    st.th.goingOnce = setTimeout(
-      async () => await ann1(cli, cfg),
-      t - TIMEOUTS.GOING_ONCE
-    );
-  if (t > TIMEOUTS.GOING_TWICE && !a.go2)
-    st.th.goingTwice = setTimeout(
-      async () => await ann2(cli, cfg),
-      t - TIMEOUTS.GOING_TWICE
-    );
-  if (t > TIMEOUTS.FINAL_CALL)
-    st.th.finalCall = setTimeout(
-      async () => await ann3(cli, cfg),
-      t - TIMEOUTS.FINAL_CALL
-    );
-  st.th.auctionEnd = setTimeout(async () => await endAuc(cli, cfg), t);
+  clearAuctionTimers();
+  for (const call of ANNOUNCEMENTS) {
+    if (t > call.lead && !(call.flag && a[call.flag]))
+      st.th[call.key] = setTimeout(
+        () => announce(cli, call).catch((err) =>
+          errorHandler.silentError(err, `bidding announcement ${call.key}`)
+        ),
+        t - call.lead
+      );
+  }
+  st.th.auctionEnd = setTimeout(
+    () => endAuc(cli, cfg).catch((err) =>
+      console.error(`${EMOJI.ERROR} Failed to end auction:`, err)
+    ),
+    t
+  );
 }
 
-async function ann1(cli, cfg) {
+/**
+ * Countdown announcements, in firing order. `key` names the timer in st.th,
+ * `lead` is how long before the end it fires, and `flag` (if set) is the
+ * auction field that marks it as sent so a resume doesn't repeat it.
+ * @constant {Array.<{key: string, lead: number, flag: ?string, title: string, color: number}>}
+ */
+const ANNOUNCEMENTS = [
+  { key: "goingOnce", lead: TIMEOUTS.GOING_ONCE, flag: "go1", title: `${EMOJI.WARNING} GOING ONCE!`, color: COLORS.WARNING },
+  { key: "goingTwice", lead: TIMEOUTS.GOING_TWICE, flag: "go2", title: `${EMOJI.WARNING} GOING TWICE!`, color: COLORS.WARNING },
+  { key: "finalCall", lead: TIMEOUTS.FINAL_CALL, flag: null, title: `${EMOJI.WARNING} FINAL CALL!`, color: COLORS.ERROR },
+];
+
+/**
+ * Posts a countdown announcement to the auction thread.
+ *
+ * @param {Client} cli - Discord client
+ * @param {Object} call - Entry from ANNOUNCEMENTS
+ * @returns {Promise<void>}
+ */
+async function announce(cli, call) {
   const a = st.a;
   if (!a || a.status !== "active" || st.pause) return;
 
@@ -1353,97 +1495,100 @@ async function ann1(cli, cfg) {
     return;
   }
 
-  const endTimestamp = Math.floor(a.endTime / 1000);
-
+  // Built from one data literal rather than a chain of setters; only the end
+  // time and current bid vary between calls
   await th.send({
     content: "@everyone",
     embeds: [
-      new EmbedBuilder()
-        .setColor(COLORS.WARNING)
-        .setTitle(`${EMOJI.WARNING} GOING ONCE!`)
-        .setDescription(`Auction ends <t:${endTimestamp}:R>`)
-        .addFields({
-          name: `${EMOJI.BID} Current`,
-          value: a.curWin
-            ? `${a.curBid}pts by ${a.curWin}`
-            : `${a.startPrice}pts (no bids)`,
-          inline: false,
-        }),
+      new EmbedBuilder({
+        color: getColor(call.color),
+        title: call.title,
+        description: `Auction ends <t:${Math.floor(a.endTime / 1000)}:R>`,
+        fields: [
+          {
+            name: `${EMOJI.BID} Current`,
+            value: a.curWin
+              ? `${a.curBid}pts by ${a.curWin}`
+              : `${a.startPrice}pts (no bids)`,
+          },
+        ],
+      }),
     ],
   });
-  a.go1 = true;
+  if (call.flag) a[call.flag] = true;
   save();
 }
 
-async function ann2(cli, cfg) {
-  const a = st.a;
-  if (!a || a.status !== "active" || st.pause) return;
-
-  // Bug #26 fix: Check thread existence before sending
-  const th = await cli.channels.fetch(a.threadId).catch(() => null);
-  if (!th) {
-    console.error(`${EMOJI.ERROR} Thread ${a.threadId} no longer exists, skipping announcement`);
-    return;
-  }
-
-  const endTimestamp = Math.floor(a.endTime / 1000);
+/** Bug #24 fix: Limit history to prevent unbounded growth (keep last 1000 entries) */
+const MAX_HISTORY_SIZE = 1000;
 
-  await th.send({
-    content: "@everyone",
-    embeds: [
-      new EmbedBuilder()
-        .setColor(getColor(COLORS.WARNING))
-        .setTitle(`${EMOJI.WARNING} GOING TWICE!`)
-        .setDescription(`Auction ends <t:${endTimestamp}:R>`)
-        .addFields({
-          name: `${EMOJI.BID} Current`,
-          value: a.curWin
-            ? `${a.curBid}pts by ${a.curWin}`
-            : `${a.startPrice}pts (no bids)`,
-          inline: false,
-        }),
-    ],
+/**
+ * Appends a sale to the session history, trimming the oldest entries past
+ * MAX_HISTORY_SIZE. Every entry is built here so they all share one shape.
+ *
+ * @param {string} item - Item name
+ * @param {string} winner - Winner's display name
+ * @param {string} winnerId - Winner's Discord user ID
+ * @param {number} amount - Winning bid
+ * @param {number} timestamp - Sale time (epoch ms)
+ */
+function addHistory(item, winner, winnerId, amount, timestamp) {
+  st.h.push({
+    item,
+    winner,
+    winnerKey: normalizeUsername(winner),
+    winnerId,
+    amount,
+    timestamp,
   });
-  a.go2 = true;
-  save();
-}
-
-async function ann3(cli, cfg) {
-  const a = st.a;
-  if (!a || a.status !== "active" || st.pause) return;
 
-  // Bug #26 fix: Check thread existence before sending
-  const th = await cli.channels.fetch(a.threadId).catch(() => null);
-  if (!th) {
-    console.error(`${EMOJI.ERROR} Thread ${a.threadId} no longer exists, skipping announcement`);
-    return;
+  if (st.h.length > MAX_HISTORY_SIZE) {
+    const removed = st.h.length - MAX_HISTORY_SIZE;
+    st.h.splice(0, removed);
+    console.log(`🧹 Trimmed auction history: removed ${removed} oldest entries, kept ${MAX_HISTORY_SIZE}`);
   }
+}
 
-  const endTimestamp = Math.floor(a.endTime / 1000);
-
-  await th.send({
-    content: "@everyone",
-    embeds: [
-      new EmbedBuilder()
-        .setColor(getColor(COLORS.ERROR))
-        .setTitle(`${EMOJI.WARNING} FINAL CALL!`)
-        .setDescription(`Auction ends <t:${endTimestamp}:R>`)
-        .addFields({
-          name: `${EMOJI.BID} Current`,
-          value: a.curWin
-            ? `${a.curBid}pts by ${a.curWin}`
-            : `${a.startPrice}pts (no bids)`,
-          inline: false,
-        }),
-    ],
+/**
+ * Picks the top `n` bids of a batch auction, one per user (their highest).
+ * Same result as sorting every bid by amount and de-duplicating, but keeps
+ * only an `n`-long ranking, so the full bid list is neither sorted nor mutated.
+ * Ties rank by bid order, as the stable sort did.
+ *
+ * @param {Array<Object>} bids - Bids in the order they were placed
+ * @param {number} n - Number of winners (auction quantity)
+ * @returns {Array<Object>} Winning bids, highest first
+ */
+function topUniqueBids(bids, n) {
+  // userKey -> index of that user's highest (earliest on ties) bid
+  const best = new Map();
+  bids.forEach((b, i) => {
+    const key = normalizeUsername(b.user);
+    const cur = best.get(key);
+    if (cur === undefined || b.amount > bids[cur].amount) best.set(key, i);
   });
-  save();
+
+  const top = [];
+  for (const i of best.values()) {
+    let j = top.length;
+    while (
+      j > 0 &&
+      (bids[top[j - 1]].amount < bids[i].amount ||
+        (bids[top[j - 1]].amount === bids[i].amount && top[j - 1] > i))
+    ) j--;
+    if (j < n) {
+      top.splice(j, 0, i);
+      if (top.length > n) top.pop();
+    }
+  }
+  return top.map((i) => bids[i]);
 }
 
 async function endAuc(cli, cfg) {
   const a = st.a;
   if (!a) return;
   a.status = "ended";
+  clearAuctionTimers();
 
   // Bug #26 fix: Check thread existence before sending
   const th = await cli.channels.fetch(a.threadId).catch(() => null);
@@ -1459,18 +1604,7 @@ async function endAuc(cli, cfg) {
   if (isBatch && a.bids.length > 0) {
     // Batch auction - determine winners
     // Bug #22 fix: Ensure each user can only win once (take their highest bid only)
-    const seenUsers = new Set();
-    const uniqueBids = a.bids
-      .sort((x, y) => y.amount - x.amount)
-      .filter((b) => {
-        const userKey = normalizeUsername(b.user);
-        if (seenUsers.has(userKey)) {
-          return false; // Skip duplicate user
-        }
-        seenUsers.add(userKey);
-        return true;
-      })
-      .slice(0, a.quantity);
+    const uniqueBids = topUniqueBids(a.bids, a.quantity);
 
     a.winners = uniqueBids.map((b) => ({
       username: b.user,
@@ -1499,23 +1633,10 @@ async function endAuc(cli, cfg) {
     });
 
     // Add to history
+    const soldAt = Date.now();
     a.winners.forEach((w) => {
-      st.h.push({
-        item: a.item,
-        winner: w.username,
-        winnerId: w.userId,
-        amount: w.amount,
-        timestamp: Date.now(),
-      });
+      addHistory(a.item, w.username, w.userId, w.amount, soldAt);
     });
-
-    // Bug #24 fix: Limit history to prevent unbounded growth (keep last 1000 entries)
-    const MAX_HISTORY_SIZE = 1000;
-    if (st.h.length > MAX_HISTORY_SIZE) {
-      const removed = st.h.length - MAX_HISTORY_SIZE;
-      st.h = st.h.slice(-MAX_HISTORY_SIZE);
-      console.log(`🧹 Trimmed auction history: removed ${removed} oldest entries, kept ${MAX_HISTORY_SIZE}`);
-    }
   } else if (a.curWin) {
     // Single item auction
     await th.send({
@@ -1540,21 +1661,7 @@ async function endAuc(cli, cfg) {
           .setTimestamp(),
       ],
     });
-    st.h.push({
-      item: a.item,
-      winner: a.curWin,
-      winnerId: a.curWinId,
-      amount: a.curBid,
-      timestamp: Date.now(),
-    });
-
-    // Bug #24 fix: Limit history to prevent unbounded growth (keep last 1000 entries)
-    const MAX_HISTORY_SIZE = 1000;
-    if (st.h.length > MAX_HISTORY_SIZE) {
-      const removed = st.h.length - MAX_HISTORY_SIZE;
-      st.h = st.h.slice(-MAX_HISTORY_SIZE);
-      console.log(`🧹 Trimmed auction history: removed ${removed} oldest entries, kept ${MAX_HISTORY_SIZE}`);
-    }
+    addHistory(a.item, a.curWin, a.curWinId, a.curBid, Date.now());
   } else {
     // No bids
     await th.send({
@@ -1592,16 +1699,46 @@ async function endAuc(cli, cfg) {
       `${EMOJI.CLOCK} Next in 20s...\n${EMOJI.LIST} **${n.item}** - ${n.startPrice}pts`
     );
     st.th.next = setTimeout(
-      async () => await startNext(cli, cfg),
+      () => startNext(cli, cfg).catch((err) =>
+        console.error(`${EMOJI.ERROR} Failed to start next auction:`, err)
+      ),
       TIMEOUTS.NEXT_ITEM_DELAY
     );
   } else {
-    setTimeout(async () => await finalize(cli, cfg), TIMEOUTS.FINALIZE_DELAY);
+    st.th.finalize = setTimeout(
+      () => finalize(cli, cfg).catch((err) =>
+        console.error(`${EMOJI.ERROR} Failed to finalize session:`, err)
+      ),
+      TIMEOUTS.FINALIZE_DELAY
+    );
   }
 }
 
 // loadPointsCacheForAuction removed - unused function
 
+/**
+ * Builds the per-member spending rows submitted to the sheet.
+ * History entries carry a pre-normalized `winnerKey` (entries restored from
+ * older saved state fall back to normalizing `winner`).
+ *
+ * @param {Array<Object>} items - Completed auctions from session history
+ * @returns {{winners: Map<string, number>, res: Array<{member: string, totalSpent: number}>}}
+ */
+function sessionSpendResults(items) {
+  const winners = new Map();
+  for (const item of items) {
+    const key = item.winnerKey ?? normalizeUsername(item.winner);
+    winners.set(key, (winners.get(key) || 0) + item.amount);
+  }
+
+  const allMembers = st.cp ? st.cp.getAllUsernames() : [];
+  const res = allMembers.map((m) => ({
+    member: m,
+    totalSpent: winners.get(normalizeUsername(m)) || 0,
+  }));
+  return { winners, res };
+}
+
 async function submitSessionTally(config, sessionItems) {
   if (!st.cp || sessionItems.length === 0) {
     console.log(`⚠️ No items to tally`);
@@ -1610,21 +1747,7 @@ async function submitSessionTally(config, sessionItems) {
 
   if (!st.sd) st.sd = ts();
 
-  const allMembers = st.cp.getAllUsernames();
-  const winners = {};
-
-  sessionItems.forEach((item) => {
-    const normalizedWinner = normalizeUsername(item.winner);
-    winners[normalizedWinner] = (winners[normalizedWinner] || 0) + item.amount;
-  });
-
-  const res = allMembers.map((m) => {
-    const normalizedMember = normalizeUsername(m);
-    return {
-      member: m,
-      totalSpent: winners[normalizedMember] || 0,
-    };
-  });
+  const { res } = sessionSpendResults(sessionItems);
 
   const sub = await submitRes(config.sheet_webhook_url, res, st.sd);
 
@@ -1699,24 +1822,10 @@ async function finalize(cli, cfg) {
 
   if (!st.sd) st.sd = ts();
 
-  const allMembers = st.cp ? st.cp.getAllUsernames() : [];
-
-  const winners = {};
-  st.h.forEach((a) => {
-    const normalizedWinner = normalizeUsername(a.winner);
-    winners[normalizedWinner] = (winners[normalizedWinner] || 0) + a.amount;
-  });
-
-  const res = allMembers.map((m) => {
-    const normalizedMember = normalizeUsername(m);
-    return {
-      member: m,
-      totalSpent: winners[normalizedMember] || 0,
-    };
-  });
+  const { winners, res } = sessionSpendResults(st.h);
 
   console.log(`${EMOJI.CHART} FINALIZE DEBUG:`);
-  console.log("Winners (normalized):", winners);
+  console.log("Winners (normalized):", Object.fromEntries(winners));
   console.log(
     "Non-zero results:",
     res.filter((r) => r.totalSpent > 0)
@@ -1787,6 +1896,275 @@ function isFinalizingSession() {
   return finalizationInProgress;
 }
 
+// ═══════════════════════════════════════════════════════════════════════════
+// BID PROCESSING - Shared Validation
+// ═══════════════════════════════════════════════════════════════════════════
+
+/**
+ * Runs the checks every bid goes through, in either mode
+ *
+ * Role, rate limit, amount parsing, minimum bid, cache and points checks used
+ * to be duplicated in procBid and procBidAuctioneering. Any rejection is
+ * replied to (and points rejections logged to admins) before returning.
+ *
+ * @param {Message} msg - Discord message object
+ * @param {string} amt - Bid amount as string (will be parsed to integer)
+ * @param {Object} item - Item being bid on (st.a or the auctioneering currentItem)
+ * @param {Object} cfg - Bot configuration object
+ * @returns {Promise<Object>} `{ ok: false, msg }` when rejected, otherwise
+ *   `{ ok: true, u, uid, uKey, bid, tot, av, needed, isSelf, prevKey, now, mono }`
+ */
+async function precheckBid(msg, amt, item, cfg) {
+  const m = msg.member,
+    u = m.nickname || msg.author.username,
+    uid = msg.author.id;
+
+  if (!hasRole(m) && !isAdm(m, cfg)) {
+    await msg.reply(ERROR_MESSAGES.NO_ROLE);
+    return { ok: false, msg: "No role" };
+  }
+
+  // Wall clock for endTime/history, monotonic clock for the rate limit
+  const now = Date.now();
+  const mono = performance.now();
+  if (st.lb[uid] && mono - st.lb[uid] < RL) {
+    const wait = Math.ceil((RL - (mono - st.lb[uid])) / 1000);
+    await msg.reply(`${EMOJI.CLOCK} Wait ${wait}s (rate limit)`);
+    return { ok: false, msg: "Rate limited" };
+  }
+
+  const bid = parseInt(amt);
+  if (isNaN(bid) || bid <= 0 || !Number.isInteger(bid)) {
+    await msg.reply(ERROR_MESSAGES.INVALID_BID);
+    return { ok: false, msg: "Invalid" };
+  }
+
+  // Boundary check: Prevent unreasonably large bids
+  if (bid > 99999999) {
+    await msg.reply(
+      `${EMOJI.ERROR} Bid amount exceeds maximum allowed (99,999,999pts)`
+    );
+    return { ok: false, msg: "Too large" };
+  }
+
+  // Bid validation: First bid can match starting price, subsequent bids must exceed current bid
+  // This prevents race conditions while allowing the starting bid to be placed
+  const hasWinner = item.curWin !== null && item.curWin !== undefined;
+  if (hasWinner ? (bid <= item.curBid) : (bid < item.curBid)) {
+    const minBid = hasWinner ? item.curBid + 1 : item.curBid;
+    await msg.reply(`${EMOJI.ERROR} Must be >= ${minBid}pts (current: ${item.curBid}pts${hasWinner ? ', outbid required' : ', starting bid'})`);
+    return { ok: false, msg: "Too low" };
+  }
+
+  if (!st.cp) {
+    await msg.reply(`${EMOJI.ERROR} Cache not loaded!`);
+    return { ok: false, msg: "No cache" };
+  }
+
+  const tot = getPts(u);
+
+  if (tot === 0) {
+    await msg.reply(`${EMOJI.ERROR} No points`);
+    // Log to admin channel (critical: user has no points but trying to bid)
+    logBidRejection(msg.client, cfg, {
+      user: u,
+      userId: uid,
+      item: item.item,
+      bidAmount: bid,
+      reason: 'No points available',
+      totalPoints: tot
+    });
+    return { ok: false, msg: "No pts" };
+  }
+
+  // Normalize the bidder once; the locked-points and self-outbid checks share it
+  const uKey = normalizeUsername(u);
+
+  // Locked points span both modes (auctioneering uses st.lp from bidding.js)
+  const curLocked = st.lp[uKey] || 0;
+  const av = avail(uKey, tot);
+
+  // curWinKey is the leader's name normalized once when their bid was taken
+  const prevKey = hasWinner ? lockKey(item) : null;
+  const isSelf = prevKey !== null && prevKey === uKey;
+  const needed = isSelf ? Math.max(0, bid - item.curBid) : bid;
+
+  if (needed > av) {
+    await msg.reply(
+      `${EMOJI.ERROR} **Insufficient!**\n${EMOJI.BID} Total: ${tot}\n${EMOJI.LOCK} Locked: ${curLocked}\n${EMOJI.CHART} Available: ${av}\n${EMOJI.WARNING} Need: ${needed}`
+    );
+    // Log to admin channel (critical: insufficient points)
+    logBidRejection(msg.client, cfg, {
+      user: u,
+      userId: uid,
+      item: item.item,
+      bidAmount: bid,
+      reason: 'Insufficient points',
+      totalPoints: tot,
+      lockedPoints: curLocked,
+      availablePoints: av,
+      neededPoints: needed
+    });
+    return { ok: false, msg: "Insufficient" };
+  }
+
+  return { ok: true, u, uid, uKey, bid, tot, av, needed, isSelf, prevKey, now, mono };
+}
+
+// ═══════════════════════════════════════════════════════════════════════════
+// BID PROCESSING - Coalesced High-Bid Announcements
+// ═══════════════════════════════════════════════════════════════════════════
+
+/**
+ * Window (ms) in which consecutive high bids in one channel share a message
+ * @constant {number}
+ */
+const BID_ANNOUNCE_WINDOW = 500;
+
+/**
+ * Most recent bids listed when several are merged into one announcement
+ * @constant {number}
+ */
+const BID_ANNOUNCE_RECENT = 5;
+
+/**
+ * Pending announcements per channel ID:
+ * `{ channel, item, bids: Array<{user, amount}>, endTime, extCnt, extended, timer, tail }`
+ * An entry is removed once its last send settles with nothing new queued, or
+ * when the item ends (settleHighBidAnnouncements), so finished threads don't linger.
+ * @type {Map<string, Object>}
+ */
+const bidAnnouncers = new Map();
+
+/**
+ * Queues a "New High Bid" announcement for a channel
+ *
+ * During a bidding war every bid used to send its own embed (plus a second
+ * one when it extended the clock), which quickly hits Discord's per-channel
+ * rate limit. Bids on the same item within BID_ANNOUNCE_WINDOW are merged
+ * into one message showing the latest bid, the recent bidders and, if any of
+ * them extended the auction, the extension notice. Sends are chained per
+ * channel so announcements keep their order.
+ *
+ * @param {TextChannel} channel - Channel (auction thread) to announce in
+ * @param {Object} item - Current auction item (item, endTime, extCnt)
+ * @param {string} user - Bidder display name
+ * @param {number} amount - Bid amount
+ * @param {boolean} extended - Whether this bid extended the auction
+ */
+function queueHighBidAnnouncement(channel, item, user, amount, extended) {
+  let pending = bidAnnouncers.get(channel.id);
+  if (pending && pending.timer && pending.item !== item.item) {
+    // A different item: don't merge across items, send what we have first
+    clearTimeout(pending.timer);
+    flushHighBidAnnouncement(channel.id);
+  }
+  if (!pending) {
+    pending = { channel, item: null, bids: [], endTime: 0, extCnt: 0, extended: false, timer: null, tail: Promise.resolve() };
+    bidAnnouncers.set(channel.id, pending);
+  }
+
+  pending.item = item.item;
+  pending.bids.push({ user, amount });
+  pending.endTime = item.endTime;
+  pending.extCnt = item.extCnt;
+  pending.extended = pending.extended || extended;
+  if (!pending.timer) {
+    pending.timer = setTimeout(() => flushHighBidAnnouncement(channel.id), BID_ANNOUNCE_WINDOW);
+  }
+}
+
+/**
+ * Sends the merged announcement queued for a channel
+ *
+ * @param {string} channelId - Channel whose pending bids to announce
+ */
+function flushHighBidAnnouncement(channelId) {
+  const pending = bidAnnouncers.get(channelId);
+  if (!pending || pending.bids.length === 0) return;
+
+  const { channel, item, bids, endTime, extCnt, extended } = pending;
+  pending.bids = [];
+  pending.extended = false;
+  pending.timer = null;
+
+  const latest = bids[bids.length - 1];
+  const fields = [
+    { name: `${EMOJI.BID} Amount`, value: `${latest.amount}pts`, inline: true },
+    { name: "👤 Bidder", value: latest.user, inline: true },
+    {
+      name: "⏱️ Time",
+      value: `${Math.max(0, Math.ceil((endTime - Date.now()) / 1000))}s remaining`,
+      inline: true,
+    },
+  ];
+  if (bids.length > 1) {
+    fields.push({
+      name: `${EMOJI.CHART} Recent Bids`,
+      value: bids
+        .slice(-BID_ANNOUNCE_RECENT)
+        .reverse()
+        .map((b) => `${b.user} - ${b.amount}pts`)
+        .join("\n"),
+      inline: false,
+    });
+  }
+  const embeds = [
+    new EmbedBuilder({
+      color: COLORS.AUCTION,
+      title: `${EMOJI.FIRE} New High Bid!`,
+      description: `**${item}**`,
+      fields,
+    }),
+  ];
+
+  // Extension notice rides in the same message, after the bid
+  if (extended) {
+    embeds.push(
+      new EmbedBuilder({
+        color: 0xffa500,
+        title: `⏰ Time Extended!`,
+        description: `Bid placed in final minute - adding 1 more minute to the auction!`,
+        fields: [{ name: "⏱️ Ends", value: `<t:${Math.floor(endTime / 1000)}:R>`, inline: true }],
+        footer: { text: `Extension ${extCnt}/${ME}` },
+      })
+    );
+  }
+
+  // The bid is already recorded, so a failed announcement is only logged
+  pending.tail = pending.tail
+    .then(() => channel.send({ embeds }))
+    .catch((err) => errorHandler.silentError(err, 'bid announcement'))
+    .then(() => {
+      // Idle again: drop the entry (and its channel reference) until the next bid
+      if (pending.bids.length === 0 && !pending.timer && bidAnnouncers.get(channelId) === pending) {
+        bidAnnouncers.delete(channelId);
+      }
+    });
+}
+
+/**
+ * Discards announcements still waiting out their window in a channel and
+ * waits for any already being sent
+ *
+ * Called by auctioneering when an item ends, is cancelled or skipped, or the
+ * session is stopped, so a late "New High Bid!" can't land after the result
+ * in a thread that is being locked. The result message already shows the
+ * final bid, so nothing is lost by discarding.
+ *
+ * @param {string} channelId - Item thread ID
+ * @returns {Promise<void>} Resolves once no announcement is in flight
+ */
+function settleHighBidAnnouncements(channelId) {
+  const pending = bidAnnouncers.get(channelId);
+  if (!pending) return Promise.resolve();
+  clearTimeout(pending.timer);
+  pending.timer = null;
+  pending.bids = [];
+  bidAnnouncers.delete(channelId);
+  return pending.tail;
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // BID PROCESSING - Auctioneering Mode (Instant Bidding)
 // ═══════════════════════════════════════════════════════════════════════════
@@ -1838,7 +2216,8 @@ function isFinalizingSession() {
  * @param {Object} auctState - Auctioneering module state reference
  * @param {Object} auctRef - Auctioneering module reference (for callbacks)
  * @param {Object} config - Bot configuration object
- * @returns {Promise<Object>} { ok: boolean, msg?: string, instant?: true }
+ * @returns {Promise<Object>} { ok: boolean, msg?: string, instant?: true, needsReply?: true } -
+ *   `needsReply` marks a rejection the caller still has to reply to
  */
 async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
   const currentItem = auctState.currentItem;
@@ -1862,99 +2241,15 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
     return { ok: false, msg: "Ended" };
   }
 
-  const m = msg.member,
-    u = m.nickname || msg.author.username,
-    uid = msg.author.id;
-
-  if (!hasRole(m) && !isAdm(m, config)) {
-    await msg.reply(ERROR_MESSAGES.NO_ROLE);
-    return { ok: false, msg: "No role" };
-  }
-
   // CRITICAL: Block bids during session finalization
   if (finalizationInProgress) {
     await msg.reply(`${EMOJI.CLOCK} Session finalizing... please wait`);
     return { ok: false, msg: "Finalizing" };
   }
 
-  // Attendance check removed - all ELYSIUM members can now bid freely
-  const now = Date.now();
-  if (st.lb[uid] && now - st.lb[uid] < 3000) {
-    const wait = Math.ceil((3000 - (now - st.lb[uid])) / 1000);
-    await msg.reply(`${EMOJI.CLOCK} Wait ${wait}s (rate limit)`);
-    return { ok: false, msg: "Rate limited" };
-  }
-
-  const bid = parseInt(amt);
-  if (isNaN(bid) || bid <= 0 || !Number.isInteger(bid)) {
-    await msg.reply(ERROR_MESSAGES.INVALID_BID);
-    return { ok: false, msg: "Invalid" };
-  }
-
-  // Boundary check: Prevent unreasonably large bids
-  if (bid > 99999999) {
-    await msg.reply(
-      `${EMOJI.ERROR} Bid amount exceeds maximum allowed (99,999,999pts)`
-    );
-    return { ok: false, msg: "Too large" };
-  }
-
-  // Bid validation: First bid can match starting price, subsequent bids must exceed current bid
-  // This prevents race conditions while allowing the starting bid to be placed
-  const hasWinner = currentItem.curWin !== null && currentItem.curWin !== undefined;
-  if (hasWinner ? (bid <= currentItem.curBid) : (bid < currentItem.curBid)) {
-    const minBid = hasWinner ? currentItem.curBid + 1 : currentItem.curBid;
-    await msg.reply(`${EMOJI.ERROR} Must be >= ${minBid}pts (current: ${currentItem.curBid}pts${hasWinner ? ', outbid required' : ', starting bid'})`);
-    return { ok: false, msg: "Too low" };
-  }
-
-  if (!st.cp) {
-    await msg.reply(`${EMOJI.ERROR} Cache not loaded!`);
-    return { ok: false, msg: "No cache" };
-  }
-
-  const tot = getPts(u);
-
-  if (tot === 0) {
-    await msg.reply(`${EMOJI.ERROR} No points`);
-    // Log to admin channel (critical: user has no points but trying to bid)
-    logBidRejection(msg.client, config, {
-      user: u,
-      userId: uid,
-      item: currentItem.item,
-      bidAmount: bid,
-      reason: 'No points available',
-      totalPoints: tot
-    });
-    return { ok: false, msg: "No pts" };
-  }
-
-  // Calculate locked points ACROSS ALL SYSTEMS (auctioneering uses st.lp from bidding.js)
-  const curLocked = st.lp[normalizeUsername(u)] || 0;
-  const av = tot - curLocked;
-
-  const isSelf =
-    currentItem.curWin && normalizeUsername(currentItem.curWin) === normalizeUsername(u);
-  const needed = isSelf ? Math.max(0, bid - currentItem.curBid) : bid;
-
-  if (needed > av) {
-    await msg.reply(
-      `${EMOJI.ERROR} **Insufficient!**\n${EMOJI.BID} Total: ${tot}\n${EMOJI.LOCK} Locked: ${curLocked}\n${EMOJI.CHART} Available: ${av}\n${EMOJI.WARNING} Need: ${needed}`
-    );
-    // Log to admin channel (critical: insufficient points)
-    logBidRejection(msg.client, config, {
-      user: u,
-      userId: uid,
-      item: currentItem.item,
-      bidAmount: bid,
-      reason: 'Insufficient points',
-      totalPoints: tot,
-      lockedPoints: curLocked,
-      availablePoints: av,
-      neededPoints: needed
-    });
-    return { ok: false, msg: "Insufficient" };
-  }
+  const chk = await precheckBid(msg, amt, currentItem, config);
+  if (!chk.ok) return chk;
+  const { u, uid, uKey, bid, av, needed, isSelf, prevKey, now, mono } = chk;
 
   // ==========================================
   // INSTANT BIDDING - NO CONFIRMATIONS
@@ -1962,12 +2257,12 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
   // ==========================================
 
   // Update rate limit immediately to prevent rapid-fire bids
-  st.lb[uid] = now;
+  st.lb[uid] = mono;
 
   // Handle previous winner (unlock their points)
   if (currentItem.curWin && !isSelf) {
     try {
-      unlock(currentItem.curWin, currentItem.curBid);
+      unlock(prevKey, currentItem.curBid);
     } catch (err) {
       console.error(`❌ CRITICAL: Failed to unlock points for ${currentItem.curWin}:`, err);
       // Log to admin but continue - don't block new bid
@@ -1977,20 +2272,22 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
 
   // Lock the new bid
   try {
-    lock(u, needed);
+    lock(uKey, needed);
   } catch (err) {
     console.error(`❌ CRITICAL: Failed to lock points for ${u}:`, err);
     // If we can't lock points, we MUST restore previous state
     if (currentItem.curWin && !isSelf) {
       try {
-        lock(currentItem.curWin, currentItem.curBid); // Re-lock previous winner
+        lock(prevKey, currentItem.curBid); // Re-lock previous winner
       } catch (restoreErr) {
         console.error(`❌ FATAL: Failed to restore previous state:`, restoreErr);
       }
     }
+    // Not replied to here; `needsReply` has the !bid handler report it
     return {
-      status: "error",
+      ok: false,
       msg: "⚠️ Failed to process bid - system error. Please contact admin.",
+      needsReply: true,
     };
   }
 
@@ -2000,6 +2297,7 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
   // Update current item
   currentItem.curBid = bid;
   currentItem.curWin = u;
+  currentItem.curWinKey = uKey;
   currentItem.curWinId = uid;
 
   if (!currentItem.bids) currentItem.bids = [];
@@ -2009,10 +2307,19 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
     amount: bid,
     timestamp: now,
   });
+  if (currentItem.bidCounts) {
+    currentItem.bidCounts[uid] = (currentItem.bidCounts[uid] || 0) + 1;
+  }
 
   // CRITICAL: Check if bid is in last minute - extend time by 1 minute
   // MUST clear timers BEFORE checking to prevent race condition where timer fires during processing
-  const timeLeft = currentItem.endTime - Date.now();
+  // Measured on auctioneering's monotonic clock (itemTimeLeft), the same one
+  // its countdown timers use, so a wall-clock step can't make them disagree
+  const timeLeftOf = (item) =>
+    auctRef && typeof auctRef.itemTimeLeft === "function"
+      ? auctRef.itemTimeLeft(item)
+      : item.endTime - Date.now();
+  const timeLeft = timeLeftOf(currentItem);
   if (!currentItem.extCnt) currentItem.extCnt = 0;
 
   let timeExtended = false;
@@ -2022,9 +2329,11 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
         typeof auctRef.safelyClearItemTimers !== "function" ||
         typeof auctRef.rescheduleItemTimers !== "function") {
       console.error("❌ Cannot extend time - auctioneering module missing critical timer methods");
+      // Not replied to here; `needsReply` has the !bid handler report it
       return {
-        status: "error",
+        ok: false,
         msg: "⚠️ Time extension failed - system error. Please contact admin.",
+        needsReply: true,
       };
     }
 
@@ -2044,7 +2353,7 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
     );
     console.log(`📊 Old end time: ${new Date(oldEndTime).toLocaleTimeString()}`);
     console.log(`📊 New end time: ${new Date(currentItem.endTime).toLocaleTimeString()}`);
-    console.log(`📊 New time left: ${Math.ceil((currentItem.endTime - Date.now()) / 1000)}s`);
+    console.log(`📊 New time left: ${Math.ceil(timeLeftOf(currentItem) / 1000)}s`);
 
     // STEP 3: Reschedule timers with new endTime
     auctRef.rescheduleItemTimers(
@@ -2072,84 +2381,31 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
   // Save state
   save();
 
+  // Announce to channel, merged with any other bids in the next moment
+  queueHighBidAnnouncement(msg.channel, currentItem, u, bid, timeExtended);
+
   // Send immediate confirmation to bidder
+  // Built from one data literal rather than a chain of builder calls per bid
   await msg.reply({
     embeds: [
-      new EmbedBuilder()
-        .setColor(COLORS.SUCCESS)
-        .setTitle(`${EMOJI.SUCCESS} Bid Placed!`)
-        .setDescription(`You're now the highest bidder on **${currentItem.item}**`)
-        .addFields(
-          {
-            name: `${EMOJI.BID} Your Bid`,
-            value: `${bid}pts`,
-            inline: true,
-          },
-          {
-            name: `${EMOJI.CHART} Previous`,
-            value: `${prevBid}pts`,
-            inline: true,
-          },
-          {
-            name: `💳 Available`,
-            value: `${av - needed}pts`,
-            inline: true,
-          }
-        )
-        .setFooter({
+      new EmbedBuilder({
+        color: COLORS.SUCCESS,
+        title: `${EMOJI.SUCCESS} Bid Placed!`,
+        description: `You're now the highest bidder on **${currentItem.item}**`,
+        fields: [
+          { name: `${EMOJI.BID} Your Bid`, value: `${bid}pts`, inline: true },
+          { name: `${EMOJI.CHART} Previous`, value: `${prevBid}pts`, inline: true },
+          { name: `💳 Available`, value: `${av - needed}pts`, inline: true },
+        ],
+        footer: {
           text: isSelf
             ? `Self-overbid (+${needed}pts) • ${currentItem.extCnt}/${ME} extensions`
             : `Locked ${needed}pts • ${currentItem.extCnt}/${ME} extensions`,
-        }),
+        },
+      }),
     ],
   });
 
-  // Announce to channel
-  const announceEmbed = new EmbedBuilder()
-    .setColor(COLORS.AUCTION)
-    .setTitle(`${EMOJI.FIRE} New High Bid!`)
-    .setDescription(`**${currentItem.item}**`)
-    .addFields(
-      {
-        name: `${EMOJI.BID} Amount`,
-        value: `${bid}pts`,
-        inline: true,
-      },
-      {
-        name: "👤 Bidder",
-        value: u,
-        inline: true
-      },
-      {
-        name: "⏱️ Time",
-        value: `${Math.ceil((currentItem.endTime - Date.now()) / 1000)}s remaining`,
-        inline: true,
-      }
-    );
-
-  await msg.channel.send({ embeds: [announceEmbed] });
-
-  // Announce time extension if it happened
-  if (timeExtended) {
-    const endTimestamp = Math.floor(currentItem.endTime / 1000);
-    await msg.channel.send({
-      embeds: [
-        new EmbedBuilder()
-          .setColor(0xffa500)
-          .setTitle(`⏰ Time Extended!`)
-          .setDescription(
-            `Bid placed in final minute - adding 1 more minute to the auction!`
-          )
-          .addFields({
-            name: "⏱️ Ends",
-            value: `<t:${endTimestamp}:R>`,
-            inline: true,
-          })
-          .setFooter({ text: `Extension ${currentItem.extCnt}/${ME}` }),
-      ],
-    });
-  }
-
   return { ok: true, instant: true };
 }
 
@@ -2176,92 +2432,42 @@ async function procBidAuctioneering(msg, amt, auctState, auctRef, config) {
  * - No timeouts or last-minute bid issues
  * - Faster auction flow
  * - Prevents confirmation delays
- *
- * RATE LIMITING:
- * - 3-second cooldown between bids per user
- * - Prevents spam and accidental duplicates
- *
- * @param {Message} msg - Discord message object
- * @param {string} amt - Bid amount as string (will be parsed to integer)
- * @param {Object} cfg - Bot configuration object
- * @returns {Promise<Object>} { ok: boolean, msg?: string }
- */
-async function procBid(msg, amt, cfg) {
-  // CRITICAL FIX: Check if auctioneering is active first
-  if (auctioneering && typeof auctioneering.getAuctionState === "function") {
-    const auctState = auctioneering.getAuctionState();
-    if (auctState && auctState.active && auctState.currentItem) {
-      return await procBidAuctioneering(
-        msg,
-        amt,
-        auctState,
-        auctioneering,
-        cfg
-      );
-    }
-  }
-
-  const a = st.a;
-  if (!a) return { ok: false, msg: "No auction" };
-  if (a.status !== "active") return { ok: false, msg: "Not started" };
-  if (msg.channel.id !== a.threadId) return { ok: false, msg: "Wrong thread" };
-
-  const m = msg.member,
-    u = m.nickname || msg.author.username,
-    uid = msg.author.id;
-  if (!hasRole(m) && !isAdm(m, cfg)) {
-    await msg.reply(`${EMOJI.ERROR} Need ELYSIUM role`);
-    return { ok: false, msg: "No role" };
-  }
-
-  // Rate limit
-  const now = Date.now();
-  if (st.lb[uid] && now - st.lb[uid] < RL) {
-    const wait = Math.ceil((RL - (now - st.lb[uid])) / 1000);
-    await msg.reply(`${EMOJI.CLOCK} Wait ${wait}s (rate limit)`);
-    return { ok: false, msg: "Rate limited" };
-  }
-
-  const bid = parseInt(amt);
-  if (isNaN(bid) || bid <= 0 || !Number.isInteger(bid)) {
-    await msg.reply(`${EMOJI.ERROR} Invalid bid (integers only)`);
-    return { ok: false, msg: "Invalid" };
-  }
-
-  // Bid validation: First bid can match starting price, subsequent bids must exceed current bid
-  // This prevents race conditions while allowing the starting bid to be placed
-  const hasWinner = a.curWin !== null && a.curWin !== undefined;
-  if (hasWinner ? (bid <= a.curBid) : (bid < a.curBid)) {
-    const minBid = hasWinner ? a.curBid + 1 : a.curBid;
-    await msg.reply(`${EMOJI.ERROR} Must be >= ${minBid}pts (current: ${a.curBid}pts${hasWinner ? ', outbid required' : ', starting bid'})`);
-    return { ok: false, msg: "Too low" };
-  }
-
-  // Cache check
-  if (!st.cp) {
-    await msg.reply(`${EMOJI.ERROR} Cache not loaded!`);
-    return { ok: false, msg: "No cache" };
-  }
-
-  const tot = getPts(u),
-    av = avail(u, tot);
-
-  if (tot === 0) {
-    await msg.reply(`${EMOJI.ERROR} No points`);
-    return { ok: false, msg: "No pts" };
+ *
+ * RATE LIMITING:
+ * - 3-second cooldown between bids per user
+ * - Prevents spam and accidental duplicates
+ *
+ * @param {Message} msg - Discord message object
+ * @param {string} amt - Bid amount as string (will be parsed to integer)
+ * @param {Object} cfg - Bot configuration object
+ * @returns {Promise<Object>} { ok: boolean, msg?: string, needsReply?: true } -
+ *   `needsReply` marks a rejection the caller still has to reply to
+ */
+async function procBid(msg, amt, cfg) {
+  // CRITICAL FIX: Check if auctioneering is active first
+  if (auctioneering && typeof auctioneering.getAuctionState === "function") {
+    const auctState = auctioneering.getAuctionState();
+    if (auctState && auctState.active && auctState.currentItem) {
+      return await procBidAuctioneering(
+        msg,
+        amt,
+        auctState,
+        auctioneering,
+        cfg
+      );
+    }
   }
 
-  // Check if self-overbidding
-  const isSelf = a.curWin && normalizeUsername(a.curWin) === normalizeUsername(u);
-  const curLocked = st.lp[normalizeUsername(u)] || 0;
-  const needed = isSelf ? Math.max(0, bid - a.curBid) : bid;
+  const a = st.a;
+  // These three haven't told the user anything yet (`needsReply`); every other
+  // rejection below replies itself
+  if (!a) return { ok: false, msg: "No auction", needsReply: true };
+  if (a.status !== "active") return { ok: false, msg: "Not started", needsReply: true };
+  if (msg.channel.id !== a.threadId) return { ok: false, msg: "Wrong thread", needsReply: true };
 
-  if (needed > av) {
-    await msg.reply(
-      `${EMOJI.ERROR} **Insufficient!**\n${EMOJI.BID} Total: ${tot}\n${EMOJI.LOCK} Locked: ${curLocked}\n${EMOJI.CHART} Available: ${av}\n${EMOJI.WARNING} Need: ${needed}`
-    );
-    return { ok: false, msg: "Insufficient" };
-  }
+  const chk = await precheckBid(msg, amt, a, cfg);
+  if (!chk.ok) return chk;
+  const { u, uid, uKey, bid, av, needed, isSelf, prevKey, now, mono } = chk;
 
   // ==========================================
   // INSTANT BIDDING - NO CONFIRMATIONS
@@ -2269,22 +2475,24 @@ async function procBid(msg, amt, cfg) {
   // ==========================================
 
   // Update rate limit immediately to prevent rapid-fire bids
-  st.lb[uid] = now;
+  st.lb[uid] = mono;
 
   // Handle previous winner (unlock their points)
   if (a.curWin && !isSelf) {
-    unlock(a.curWin, a.curBid);
+    unlock(prevKey, a.curBid);
   }
 
   // Lock the new bid
-  lock(u, needed);
+  lock(uKey, needed);
 
-  // Store previous bid for display
+  // Store previous bid for display, and previous winner for the outbid DM
   const prevBid = a.curBid;
+  const prevWinId = a.curWinId;
 
   // Update current auction
   a.curBid = bid;
   a.curWin = u;
+  a.curWinKey = uKey;
   a.curWinId = uid;
 
   if (!a.bids) a.bids = [];
@@ -2298,43 +2506,42 @@ async function procBid(msg, amt, cfg) {
   save();
 
   // Send immediate confirmation to bidder
-  const confirmEmbed = new EmbedBuilder()
-    .setColor(getColor(COLORS.SUCCESS))
-    .setTitle(`${EMOJI.SUCCESS} Bid Placed!`)
-    .setDescription(
-      `You're now the highest bidder on **${a.item}**`
-    )
-    .addFields(
+  const confirmEmbed = new EmbedBuilder({
+    color: COLORS.SUCCESS,
+    title: `${EMOJI.SUCCESS} Bid Placed!`,
+    description: `You're now the highest bidder on **${a.item}**`,
+    fields: [
       { name: `${EMOJI.BID} Your Bid`, value: `${bid}pts`, inline: true },
       { name: `${EMOJI.CHART} Previous High`, value: `${prevBid}pts`, inline: true },
-      { name: "💳 Points Left", value: `${av - needed}pts`, inline: true }
-    )
-    .setFooter({ text: isSelf ? "Self-overbid processed" : "Points locked until outbid or win" });
+      { name: "💳 Points Left", value: `${av - needed}pts`, inline: true },
+    ],
+    footer: { text: isSelf ? "Self-overbid processed" : "Points locked until outbid or win" },
+  });
 
   await msg.reply({ embeds: [confirmEmbed] });
 
-  // Notify previous winner they were outbid (if not self-overbid)
-  if (a.curWin && !isSelf && a.curWinId) {
-    try {
-      const prevWinner = await msg.guild.members.fetch(a.curWinId).catch(() => null);
-      if (prevWinner) {
-        const outbidEmbed = new EmbedBuilder()
-          .setColor(getColor(COLORS.INFO))
-          .setTitle(`${EMOJI.WARNING} You've Been Outbid!`)
-          .setDescription(`**${a.item}** - New high bid: ${bid}pts`)
-          .addFields(
+  // Notify previous winner they were outbid (if not self-overbid).
+  // Not awaited - the member fetch and DM shouldn't hold up the bid.
+  if (prevWinId && !isSelf) {
+    const item = a.item;
+    msg.guild.members.fetch(prevWinId)
+      .then((prevWinner) => {
+        const outbidEmbed = new EmbedBuilder({
+          color: COLORS.INFO,
+          title: `${EMOJI.WARNING} You've Been Outbid!`,
+          description: `**${item}** - New high bid: ${bid}pts`,
+          fields: [
             { name: "Your Bid", value: `${prevBid}pts`, inline: true },
-            { name: "New High", value: `${bid}pts`, inline: true }
-          )
-          .setFooter({ text: `${prevBid}pts unlocked` });
-
-        await prevWinner.send({ embeds: [outbidEmbed] }).catch(() => {
-          // Silently fail if DMs are closed
+            { name: "New High", value: `${bid}pts`, inline: true },
+          ],
+          footer: { text: `${prevBid}pts unlocked` },
         });
-      }
-    } catch (err) {
-      // Silently fail - don't block auction for DM errors
-    }
+
+        return prevWinner.send({ embeds: [outbidEmbed] });
+      })
+      .catch(() => {
+        // Silently fail if the member is gone or DMs are closed
+      });
   }
 
   console.log(`[BID] ${u} bid ${bid}pts on ${a.item} (was: ${prevBid}pts, self: ${isSelf})`);
@@ -2401,7 +2608,8 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         }
       }
       const res = await procBid(msg, args[0], cfg);
-      if (!res.ok) {
+      // Rejections already replied to inside procBid get no second message
+      if (!res.ok && res.needsReply) {
         try {
           await msg.reply(`${EMOJI.ERROR} ${res.msg}`);
         } catch (err) {
@@ -2487,13 +2695,14 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
             `⚠️ **NOTE:** Use \`!resetauction\` for full auction reset including saved state.`
         );
 
+      const rstIdSfx = buttonIdSuffix(msg.author.id);
       const rstConfirmBtn = new ButtonBuilder()
-        .setCustomId(`reset_confirm_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`reset_confirm_${rstIdSfx}`)
         .setLabel('✅ Yes, Reset All')
         .setStyle(ButtonStyle.Danger);
 
       const rstCancelBtn = new ButtonBuilder()
-        .setCustomId(`reset_cancel_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`reset_cancel_${rstIdSfx}`)
         .setLabel('❌ Cancel')
         .setStyle(ButtonStyle.Secondary);
 
@@ -2528,6 +2737,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
             cp: null,
             ct: null,
             lb: {},
+            lastBidRejectionLog: {},
             pause: false,
             pauseTimer: null,
             auctionLock: false,
@@ -2557,14 +2767,15 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
     case "!forcesubmitresults": {
       if (!st.sd || st.h.length === 0)
         return await msg.reply(`${EMOJI.ERROR} No history`);
+      const idSfx = buttonIdSuffix(msg.author.id);
       const submitButton = new ButtonBuilder()
-        .setCustomId(`forcesubmit_confirm_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`forcesubmit_confirm_${idSfx}`)
         .setLabel('✅ Submit Results')
         .setStyle(ButtonStyle.Success)
         .setDisabled(false);
 
       const cancelButton = new ButtonBuilder()
-        .setCustomId(`forcesubmit_cancel_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`forcesubmit_cancel_${idSfx}`)
         .setLabel('❌ Cancel')
         .setStyle(ButtonStyle.Secondary)
         .setDisabled(false);
@@ -2605,21 +2816,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         if (isConfirm) {
           if (!st.sd) st.sd = ts();
 
-          const winners = {};
-          st.h.forEach((a) => {
-            const normalizedWinner = normalizeUsername(a.winner);
-            winners[normalizedWinner] =
-              (winners[normalizedWinner] || 0) + a.amount;
-          });
-
-          const allMembers = st.cp ? st.cp.getAllUsernames() : [];
-          const res = allMembers.map((m) => {
-            const normalizedMember = normalizeUsername(m);
-            return {
-              member: m,
-              totalSpent: winners[normalizedMember] || 0,
-            };
-          });
+          const { res } = sessionSpendResults(st.h);
           const sub = await submitRes(cfg.sheet_webhook_url, res, st.sd);
           if (sub.ok) {
             const wList = st.h
@@ -2695,11 +2892,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         if (reason === 'time' && collected.size === 0) {
           const disabledRow = createDisabledRow(submitButton, cancelButton);
 
-          const timeoutEmbed = new EmbedBuilder()
-            .setColor(getColor(COLORS.ERROR))
-            .setTitle(`${EMOJI.ERROR} Timed Out`)
-            .setDescription('Confirmation expired')
-            .setTimestamp();
+          const timeoutEmbed = new EmbedBuilder(CONFIRMATION_EXPIRED_EMBED).setTimestamp();
 
           await errorHandler.safeEdit(fsMsg, { embeds: [timeoutEmbed], components: [disabledRow] }, 'force sell confirmation timeout');
         }
@@ -2712,13 +2905,14 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
       if (msg.channel.id !== st.a.threadId)
         return await msg.reply(`${EMOJI.ERROR} Use in auction thread`);
 
+      const cancelIdSfx = buttonIdSuffix(msg.author.id);
       const cancelConfirmBtn = new ButtonBuilder()
-        .setCustomId(`cancelitem_confirm_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`cancelitem_confirm_${cancelIdSfx}`)
         .setLabel('✅ Yes, Cancel Item')
         .setStyle(ButtonStyle.Danger);
 
       const cancelCancelBtn = new ButtonBuilder()
-        .setCustomId(`cancelitem_cancel_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`cancelitem_cancel_${cancelIdSfx}`)
         .setLabel('❌ No, Keep Item')
         .setStyle(ButtonStyle.Secondary);
 
@@ -2752,7 +2946,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
 
         if (isConfirm) {
           clearAllTimers();
-          if (st.a.curWin) unlock(st.a.curWin, st.a.curBid);
+          if (st.a.curWin) unlock(lockKey(st.a), st.a.curBid);
 
           // Send messages before locking/archiving
           await msg.channel.send(
@@ -2797,11 +2991,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         if (reason === 'time' && collected.size === 0) {
           const disabledCancelRow = createDisabledRow(cancelConfirmBtn, cancelCancelBtn);
 
-          const timeoutEmbed = new EmbedBuilder()
-            .setColor(getColor(COLORS.ERROR))
-            .setTitle(`${EMOJI.ERROR} Timed Out`)
-            .setDescription('Confirmation expired')
-            .setTimestamp();
+          const timeoutEmbed = new EmbedBuilder(CONFIRMATION_EXPIRED_EMBED).setTimestamp();
 
           await errorHandler.safeEdit(canMsg, { embeds: [timeoutEmbed], components: [disabledCancelRow] }, 'cancel item confirmation timeout');
         }
@@ -2813,13 +3003,14 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
       if (msg.channel.id !== st.a.threadId)
         return await msg.reply(`${EMOJI.ERROR} Use in auction thread`);
 
+      const skipIdSfx = buttonIdSuffix(msg.author.id);
       const skipConfirmBtn = new ButtonBuilder()
-        .setCustomId(`skipitem_confirm_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`skipitem_confirm_${skipIdSfx}`)
         .setLabel('✅ Yes, Skip Item')
         .setStyle(ButtonStyle.Primary);
 
       const skipCancelBtn = new ButtonBuilder()
-        .setCustomId(`skipitem_cancel_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`skipitem_cancel_${skipIdSfx}`)
         .setLabel('❌ No, Continue')
         .setStyle(ButtonStyle.Secondary);
 
@@ -2853,7 +3044,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
 
         if (isConfirm) {
           clearAllTimers();
-          if (st.a.curWin) unlock(st.a.curWin, st.a.curBid);
+          if (st.a.curWin) unlock(lockKey(st.a), st.a.curBid);
 
           // Send messages before locking/archiving
           await msg.channel.send(
@@ -2898,11 +3089,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         if (reason === 'time' && collected.size === 0) {
           const disabledSkipRow = createDisabledRow(skipConfirmBtn, skipCancelBtn);
 
-          const timeoutEmbed = new EmbedBuilder()
-            .setColor(getColor(COLORS.ERROR))
-            .setTitle(`${EMOJI.ERROR} Timed Out`)
-            .setDescription('Confirmation expired')
-            .setTimestamp();
+          const timeoutEmbed = new EmbedBuilder(CONFIRMATION_EXPIRED_EMBED).setTimestamp();
 
           await errorHandler.safeEdit(skpMsg, { embeds: [timeoutEmbed], components: [disabledSkipRow] }, 'skip item confirmation timeout');
         }
@@ -2926,16 +3113,16 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
 
       const u = msg.member.nickname || msg.author.username;
 
-      // Fetch fresh from sheets
-      const freshPts = await fetchPts(cfg.sheet_webhook_url);
-      if (!freshPts) {
+      // Reuse points loaded within the last minute, so a burst of !mypoints
+      // after a session costs one sheet call rather than one per member
+      if (!isCacheFresh() && !(await loadCache(cfg.sheet_webhook_url))) {
         return await msg.reply(
           `${EMOJI.ERROR} Failed to fetch points from sheets.`
         );
       }
 
       // Use PointsCache for efficient O(1) lookup
-      const ptsCache = new PointsCache(freshPts);
+      const ptsCache = st.cp;
       let userPts = ptsCache.getPoints(u);
       if (userPts === 0 && !ptsCache.hasUser(u)) {
         // User not found in system
@@ -3012,13 +3199,14 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         .map((member) => `• **${member}**: ${st.lp[member]}pts locked`)
         .join("\n");
 
+      const fixIdSfx = buttonIdSuffix(msg.author.id);
       const clearBtn = new ButtonBuilder()
-        .setCustomId(`fixlocked_confirm_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`fixlocked_confirm_${fixIdSfx}`)
         .setLabel('✅ Clear All')
         .setStyle(ButtonStyle.Danger);
 
       const cancelBtn = new ButtonBuilder()
-        .setCustomId(`fixlocked_cancel_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`fixlocked_cancel_${fixIdSfx}`)
         .setLabel('❌ Cancel')
         .setStyle(ButtonStyle.Secondary);
 
@@ -3101,11 +3289,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         if (reason === 'time' && collected.size === 0) {
           const disabledFixRow = createDisabledRow(clearBtn, cancelBtn);
 
-          const timeoutEmbed = new EmbedBuilder()
-            .setColor(getColor(COLORS.ERROR))
-            .setTitle(`${EMOJI.ERROR} Timed Out`)
-            .setDescription('Confirmation expired')
-            .setTimestamp();
+          const timeoutEmbed = new EmbedBuilder(CONFIRMATION_EXPIRED_EMBED).setTimestamp();
 
           await errorHandler.safeEdit(fixMsg, { embeds: [timeoutEmbed], components: [disabledFixRow] }, 'fix points confirmation timeout');
         }
@@ -3230,14 +3414,15 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         });
 
       // Create buttons for confirmation
+      const idSfx = buttonIdSuffix(msg.author.id);
       const confirmButton = new ButtonBuilder()
-        .setCustomId(`reset_confirm_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`reset_confirm_${idSfx}`)
         .setLabel('✅ RESET EVERYTHING')
         .setStyle(ButtonStyle.Danger)
         .setDisabled(false);
 
       const cancelButton = new ButtonBuilder()
-        .setCustomId(`reset_cancel_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`reset_cancel_${idSfx}`)
         .setLabel('❌ Cancel')
         .setStyle(ButtonStyle.Secondary)
         .setDisabled(false);
@@ -3301,6 +3486,7 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
             cp: null,
             ct: null,
             lb: {},
+            lastBidRejectionLog: {},
             pause: false,
             pauseTimer: null,
             auctionLock: false,
@@ -3391,13 +3577,14 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
           displaySummary = displaySummary.substring(0, 1000) + `\n\n*... and more items*`;
         }
 
+        const idSfx = buttonIdSuffix(msg.author.id);
         const confirmButton = new ButtonBuilder()
-          .setCustomId(`sheettally_confirm_${msg.author.id}_${Date.now()}`)
+          .setCustomId(`sheettally_confirm_${idSfx}`)
           .setLabel(`✅ Submit Tally (${itemsWithWinners.length} items)`)
           .setStyle(ButtonStyle.Success);
 
         const cancelButton = new ButtonBuilder()
-          .setCustomId(`sheettally_cancel_${msg.author.id}_${Date.now()}`)
+          .setCustomId(`sheettally_cancel_${idSfx}`)
           .setLabel('❌ Cancel')
           .setStyle(ButtonStyle.Secondary);
 
@@ -3440,7 +3627,9 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
 
             // CRITICAL: Load points cache first (required for submitSessionTally)
             // After bot restart, st.cp is null and tally submission would fail
-            await loadCache(cfg.sheet_webhook_url);
+            if (!isCacheFresh()) {
+              await loadCache(cfg.sheet_webhook_url);
+            }
 
             // Submit the tally
             await submitSessionTally(cfg, sessionItems);
@@ -3530,20 +3719,21 @@ async function handleCmd(cmd, msg, args, cli, cfg) {
         .setFooter({ text: "30s timeout" });
 
       // Create buttons for recovery options
+      const idSfx = buttonIdSuffix(msg.author.id);
       const clearButton = new ButtonBuilder()
-        .setCustomId(`recovery_clear_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`recovery_clear_${idSfx}`)
         .setLabel('Clear stuck state')
         .setStyle(ButtonStyle.Primary)
         .setDisabled(false);
 
       const finalizeButton = new ButtonBuilder()
-        .setCustomId(`recovery_finalize_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`recovery_finalize_${idSfx}`)
         .setLabel('Force finalize')
         .setStyle(ButtonStyle.Danger)
         .setDisabled(false);
 
       const cancelButton = new ButtonBuilder()
-        .setCustomId(`recovery_cancel_${msg.author.id}_${Date.now()}`)
+        .setCustomId(`recovery_cancel_${idSfx}`)
         .setLabel('❌ Cancel')
         .setStyle(ButtonStyle.Secondary)
         .setDisabled(false);
@@ -3725,6 +3915,35 @@ function cleanupPendingConfirmations() {
   }
 }
 
+/**
+ * Drops bid rate-limit entries whose cooldown has already elapsed
+ *
+ * st.lb gains one entry per bidder and nothing else removes them, so a long
+ * session (or a burst of one-off bidders) would keep every ID forever. An
+ * entry older than the cooldown no longer blocks anything and is safe to drop.
+ * The 30-second admin-log debounce in st.lastBidRejectionLog is pruned the same way.
+ *
+ * @returns {number} Number of entries removed
+ */
+function pruneRateLimits() {
+  const mono = performance.now();
+  const now = Date.now();
+  let pruned = 0;
+  for (const uid of Object.keys(st.lb)) {
+    if (mono - st.lb[uid] >= RL) {
+      delete st.lb[uid];
+      pruned++;
+    }
+  }
+  for (const key of Object.keys(st.lastBidRejectionLog)) {
+    if (now - st.lastBidRejectionLog[key] >= 30000) {
+      delete st.lastBidRejectionLog[key];
+      pruned++;
+    }
+  }
+  return pruned;
+}
+
 /**
  * Prunes stuck locked points that should have been released (v6.2 optimization)
  *
@@ -3823,7 +4042,7 @@ const cleanupIntervals = {
  * Starts periodic cleanup schedule for pending confirmations and memory checks (v6.2 enhanced)
  *
  * SCHEDULE:
- * - Runs cleanupPendingConfirmations every 2 minutes
+ * - Runs cleanupPendingConfirmations and pruneRateLimits every 2 minutes
  * - Runs checkLockedPoints every 5 minutes
  * - Logs memory stats every 30 minutes
  * - Continues indefinitely until bot restart
@@ -3846,6 +4065,7 @@ function startCleanupSchedule() {
     // Main cleanup: every 2 minutes
     cleanupIntervals.pendingConfirmations = setInterval(() => {
       cleanupPendingConfirmations();
+      pruneRateLimits();
     }, 120000); // 2 minutes
 
     // Locked points check: every 5 minutes
@@ -3896,6 +4116,7 @@ function stopCleanupSchedule() {
  * INITIALIZATION:
  * - initializeBidding: Setup function (MUST be called first)
  * - startCleanupSchedule: Memory leak prevention (called by init)
+ * - shutdown: Close the Google Sheets connection pool (bot shutdown)
  *
  * STATE MANAGEMENT:
  * - loadBiddingState: Load state from file/sheets
@@ -3930,6 +4151,7 @@ module.exports = {
   // ═════════════════════════════════════════════════════════════════════════
   initializeBidding,
   startCleanupSchedule, // Used internally by initializeBidding
+  shutdown,
 
   // ═════════════════════════════════════════════════════════════════════════
   // STATE MANAGEMENT
@@ -3950,6 +4172,8 @@ module.exports = {
   // ═════════════════════════════════════════════════════════════════════════
   clearPointsCache: clearCache, // Used by auctioneering.js
   stopCacheAutoRefresh,
+  settleHighBidAnnouncements, // Used by auctioneering.js when an item ends
+  lockKey, // Used by auctioneering.js to release a cancelled/skipped item's lock
 
   // ═════════════════════════════════════════════════════════════════════════
   // SESSION MANAGEMENT
@@ -3976,463 +4200,6 @@ module.exports = {
    */
   confirmBid: async function (reaction, user, config) {
     console.warn('[DEPRECATED] confirmBid called - this function is no longer used (instant bidding enabled)');
-    return;
-    const p = st.pc[reaction.message.id];
-    if (!p) return;
-
-    const guild = reaction.message.guild,
-      member = await guild.members.fetch(user.id).catch(() => null);
-    if (!member) return;
-
-    if (p.userId !== user.id) {
-      await reaction.users.remove(user.id).catch(err => errorHandler.silentError(err, 'remove unauthorized user reaction'));
-      return;
-    }
-
-    // CRITICAL: Check if this is an auctioneering bid
-    if (p.isAuctioneering) {
-      console.log(`🎯 Processing auctioneering bid confirmation`);
-
-      const auctState = p.auctStateRef;
-      const currentItem = auctState.currentItem;
-
-      if (!currentItem || currentItem.status !== "active") {
-        await reaction.message.channel.send(
-          `❌ <@${user.id}> Auction no longer active`
-        );
-        await errorHandler.safeRemoveReactions(reaction.message, 'auctioneering inactive auction cleanup');
-        await errorHandler.safeDelete(reaction.message, 'auctioneering inactive auction cleanup');
-        delete st.pc[reaction.message.id];
-        save();
-        return;
-      }
-
-      if (p.amount < currentItem.curBid) {
-        await reaction.message.channel.send(
-          `❌ <@${user.id}> Bid invalid. Current: ${currentItem.curBid}pts`
-        );
-        await errorHandler.safeRemoveReactions(reaction.message, 'auctioneering invalid bid cleanup');
-        await errorHandler.safeDelete(reaction.message, 'auctioneering invalid bid cleanup');
-        delete st.pc[reaction.message.id];
-        save();
-        return;
-      }
-
-      // Check for higher pending bids from other users
-      const higherPendingBids = Object.entries(st.pc)
-        .filter(([msgId, pending]) => {
-          return (
-            msgId !== reaction.message.id && // Not this confirmation
-            pending.isAuctioneering && // Is auctioneering bid
-            pending.amount > p.amount && // Higher amount
-            pending.userId !== p.userId
-          ); // Different user
-        })
-        .sort((a, b) => b[1].amount - a[1].amount); // Sort by amount desc
-
-      if (higherPendingBids.length > 0) {
-        const highestPending = higherPendingBids[0][1];
-        await reaction.message.channel.send({
-          content: `<@${user.id}>`,
-          embeds: [
-            new EmbedBuilder()
-              .setColor(0xffa500)
-              .setTitle(`⚠️ Higher Bid Pending!`)
-              .setDescription(
-                `Your bid: **${p.amount}pts**\n` +
-                  `Higher pending bid: **${highestPending.amount}pts** (waiting for confirmation)\n\n` +
-                  `Someone else has a higher bid pending. If they confirm first, your bid will be rejected.\n` +
-                  `**Your confirmation has been CANCELLED.**`
-              ),
-          ],
-        });
-        await errorHandler.safeRemoveReactions(reaction.message, 'auctioneering higher bid pending cleanup');
-        await errorHandler.safeDelete(reaction.message, 'auctioneering higher bid pending cleanup');
-        delete st.pc[reaction.message.id];
-        save();
-        return;
-      }
-
-      // Handle previous winner
-      if (currentItem.curWin && !p.isSelf) {
-        unlock(currentItem.curWin, currentItem.curBid);
-        await reaction.message.channel.send({
-          content: `<@${currentItem.curWinId}>`,
-          embeds: [
-            new EmbedBuilder()
-              .setColor(getColor(COLORS.WARNING))
-              .setTitle(`${EMOJI.WARNING} Outbid!`)
-              .setDescription(
-                `Someone bid **${p.amount}pts** on **${currentItem.item}**`
-              ),
-          ],
-        });
-      }
-
-      // Lock the new bid
-      lock(p.username, p.needed);
-
-      // Update current item
-      const prevBid = currentItem.curBid;
-      currentItem.curBid = p.amount;
-      currentItem.curWin = p.username;
-      currentItem.curWinId = p.userId;
-
-      if (!currentItem.bids) currentItem.bids = [];
-      currentItem.bids.push({
-        user: p.username,
-        userId: p.userId,
-        amount: p.amount,
-        timestamp: Date.now(),
-      });
-
-      // Check if bid is in last minute - extend time by 1 minute
-      const timeLeft = currentItem.endTime - Date.now();
-      if (!currentItem.extCnt) currentItem.extCnt = 0; // Initialize if not exists
-      if (timeLeft < 60000 && timeLeft > 0 && currentItem.extCnt < ME) {
-        const extensionTime = 60000; // 1 minute
-        currentItem.endTime += extensionTime;
-        currentItem.extCnt++;
-
-        const endTimestamp = Math.floor(currentItem.endTime / 1000);
-        await reaction.message.channel.send({
-          embeds: [
-            new EmbedBuilder()
-              .setColor(0xffa500)
-              .setTitle(`⏰ Time Extended!`)
-              .setDescription(
-                `Bid placed in final minute - adding 1 more minute to the auction!`
-              )
-              .addFields({
-                name: "⏱️ Ends",
-                value: `<t:${endTimestamp}:R>`,
-                inline: true,
-              }),
-          ],
-        });
-
-        console.log(
-          `⏰ Time extended for ${currentItem.item} by 1 minute (bid in final minute, ext #${currentItem.extCnt})`
-        );
-
-        // CRITICAL: Reschedule timers to reflect new endTime
-        if (p.auctRef && typeof p.auctRef.rescheduleItemTimers === "function") {
-          p.auctRef.rescheduleItemTimers(
-            reaction.client,
-            config,
-            reaction.message.channel
-          );
-        }
-      }
-
-      // Update via auctioneering module
-      if (p.auctRef && typeof p.auctRef.updateCurrentItemState === "function") {
-        p.auctRef.updateCurrentItemState({
-          curBid: p.amount,
-          curWin: p.username,
-          curWinId: p.userId,
-          bids: currentItem.bids,
-        });
-      }
-
-      // Clear timeout
-      if (st.th[`c_${reaction.message.id}`]) {
-        clearTimeout(st.th[`c_${reaction.message.id}`]);
-        delete st.th[`c_${reaction.message.id}`];
-      }
-
-      // Send confirmation
-      await errorHandler.safeEdit(reaction.message, {
-        embeds: [
-          new EmbedBuilder()
-            .setColor(getColor(COLORS.SUCCESS))
-            .setTitle(`${EMOJI.SUCCESS} Bid Confirmed!`)
-            .setDescription(`Highest bidder on **${currentItem.item}**`)
-            .addFields(
-              {
-                name: `${EMOJI.BID} Your Bid`,
-                value: `${p.amount}pts`,
-                inline: true,
-              },
-              {
-                name: `${EMOJI.CHART} Previous`,
-                value: `${prevBid}pts`,
-                inline: true,
-              }
-            )
-            .setFooter({
-              text: p.isSelf ? `Self-overbid (+${p.needed}pts)` : "Good luck!",
-            }),
-        ],
-      }, 'message edit');
-      await errorHandler.safeRemoveReactions(reaction.message, 'auctioneering bid confirmation cleanup');
-
-      await reaction.message.channel.send({
-        embeds: [
-          new EmbedBuilder()
-            .setColor(getColor(COLORS.AUCTION))
-            .setTitle(`${EMOJI.FIRE} New High Bid!`)
-            .addFields(
-              {
-                name: `${EMOJI.BID} Amount`,
-                value: `${p.amount}pts`,
-                inline: true,
-              },
-              { name: "👤 Bidder", value: p.username, inline: true }
-            ),
-        ],
-      });
-
-      setTimeout(
-        async () => await errorHandler.safeDelete(reaction.message, 'auctioneering bid confirmation delayed delete'),
-        5000
-      );
-      if (p.origMsgId) {
-        const orig = await reaction.message.channel.messages
-          .fetch(p.origMsgId)
-          .catch(() => null);
-        if (orig) await errorHandler.safeDelete(orig, 'message deletion');
-      }
-
-      delete st.pc[reaction.message.id];
-      save();
-
-      console.log(
-        `${EMOJI.SUCCESS} Auctioneering bid: ${p.username} - ${p.amount}pts${
-          p.isSelf ? ` (self +${p.needed}pts)` : ""
-        }`
-      );
-      return;
-    }
-
-    // Original bidding.js auction logic (not auctioneering)
-    const a = st.a;
-    if (!a || a.status !== "active") {
-      await reaction.message.channel.send(
-        `❌ <@${user.id}> Auction no longer active`
-      );
-      await errorHandler.safeRemoveReactions(reaction.message, 'auction inactive cleanup');
-      await errorHandler.safeDelete(reaction.message, 'auction inactive cleanup');
-      delete st.pc[reaction.message.id];
-      save();
-
-      if (st.pause) {
-        resumeAuction(reaction.client, config);
-        await reaction.message.channel.send(
-          `▶️ **RESUMED** - Auction continues...`
-        );
-      }
-      return;
-    }
-
-    if (p.amount < a.curBid) {
-      await reaction.message.channel.send(
-        `❌ <@${user.id}> Bid invalid. Current: ${a.curBid}pts`
-      );
-      await errorHandler.safeRemoveReactions(reaction.message, 'auction invalid bid cleanup');
-      await errorHandler.safeDelete(reaction.message, 'auction invalid bid cleanup');
-      delete st.pc[reaction.message.id];
-      save();
-
-      if (st.pause) {
-        resumeAuction(reaction.client, config);
-        await reaction.message.channel.send(
-          `▶️ **RESUMED** - Auction continues...`
-        );
-      }
-      return;
-    }
-
-    // Check for higher pending bids from other users
-    const higherPendingBids = Object.entries(st.pc)
-      .filter(([msgId, pending]) => {
-        return (
-          msgId !== reaction.message.id && // Not this confirmation
-          !pending.isAuctioneering && // Regular bidding.js auction
-          pending.amount > p.amount && // Higher amount
-          pending.userId !== p.userId
-        ); // Different user
-      })
-      .sort((a, b) => b[1].amount - a[1].amount); // Sort by amount desc
-
-    if (higherPendingBids.length > 0) {
-      const highestPending = higherPendingBids[0][1];
-      await reaction.message.channel.send({
-        content: `<@${user.id}>`,
-        embeds: [
-          new EmbedBuilder()
-            .setColor(0xffa500)
-            .setTitle(`⚠️ Higher Bid Pending!`)
-            .setDescription(
-              `Your bid: **${p.amount}pts**\n` +
-                `Higher pending bid: **${highestPending.amount}pts** (waiting for confirmation)\n\n` +
-                `Someone else has a higher bid pending. If they confirm first, your bid will be rejected.\n` +
-                `**Your confirmation has been CANCELLED.**`
-            ),
-        ],
-      });
-      await errorHandler.safeRemoveReactions(reaction.message, 'auction higher bid pending cleanup');
-      await errorHandler.safeDelete(reaction.message, 'auction higher bid pending cleanup');
-      delete st.pc[reaction.message.id];
-      save();
-
-      if (st.pause) {
-        resumeAuction(reaction.client, config);
-        await reaction.message.channel.send(
-          `▶️ **RESUMED** - Auction continues...`
-        );
-      }
-      return;
-    }
-
-    // Handle previous winner
-    if (a.curWin && !p.isSelf) {
-      unlock(a.curWin, a.curBid);
-      await reaction.message.channel.send({
-        content: `<@${a.curWinId}>`,
-        embeds: [
-          new EmbedBuilder()
-            .setColor(getColor(COLORS.WARNING))
-            .setTitle(`${EMOJI.WARNING} Outbid!`)
-            .setDescription(`Someone bid **${p.amount}pts** on **${a.item}**`),
-        ],
-      });
-    }
-
-    lock(p.username, p.needed);
-
-    const prevBid = a.curBid;
-    a.curBid = p.amount;
-    a.curWin = p.username;
-    a.curWinId = p.userId;
-    a.bids.push({
-      user: p.username,
-      userId: p.userId,
-      amount: p.amount,
-      timestamp: Date.now(),
-    });
-
-    const timeLeft = st.pause ? st.a.remainingTime : a.endTime - Date.now();
-    if (timeLeft < 60000 && a.extCnt < ME) {
-      if (!st.pause) {
-        a.endTime += 60000;
-      } else {
-        st.a.remainingTime += 60000;
-      }
-      a.extCnt++;
-      a.go1 = false;
-      a.go2 = false;
-
-      const endTimestamp = Math.floor((st.pause ? (Date.now() + st.a.remainingTime) : a.endTime) / 1000);
-      await reaction.message.channel.send({
-        embeds: [
-          new EmbedBuilder()
-            .setColor(0xffa500)
-            .setTitle(`⏰ Time Extended!`)
-            .setDescription(
-              `Bid placed in final minute - adding 1 more minute to the auction!`
-            )
-            .addFields({
-              name: "⏱️ Ends",
-              value: `<t:${endTimestamp}:R>`,
-              inline: true,
-            }),
-        ],
-      });
-
-      console.log(
-        `⏰ Time extended for ${a.item} by 1 minute (bid in final minute)`
-      );
-
-      // CRITICAL: Reschedule timers to reflect new endTime
-      schedTimers(reaction.client, config);
-    }
-
-    if (st.th[`c_${reaction.message.id}`]) {
-      clearTimeout(st.th[`c_${reaction.message.id}`]);
-      delete st.th[`c_${reaction.message.id}`];
-    }
-
-    await errorHandler.safeEdit(reaction.message, {
-      embeds: [
-        new EmbedBuilder()
-          .setColor(getColor(COLORS.SUCCESS))
-          .setTitle(`${EMOJI.SUCCESS} Bid Confirmed!`)
-          .setDescription(`Highest bidder on **${a.item}**`)
-          .addFields(
-            {
-              name: `${EMOJI.BID} Your Bid`,
-              value: `${p.amount}pts`,
-              inline: true,
-            },
-            {
-              name: `${EMOJI.CHART} Previous`,
-              value: `${prevBid}pts`,
-              inline: true,
-            },
-            {
-              name: `${EMOJI.TIME} Time Left`,
-              value: fmtTime(timeLeft),
-              inline: true,
-            }
-          )
-          .setFooter({
-            text: p.isSelf
-              ? `Self-overbid (+${p.needed}pts)`
-              : timeLeft < 60000 && a.extCnt < ME
-              ? `${EMOJI.CLOCK} Extended!`
-              : "Good luck!",
-          }),
-      ],
-    }, 'message edit');
-    await errorHandler.safeRemoveReactions(reaction.message, 'bid confirmation cleanup');
-
-    await reaction.message.channel.send({
-      embeds: [
-        new EmbedBuilder()
-          .setColor(getColor(COLORS.AUCTION))
-          .setTitle(`${EMOJI.FIRE} New High Bid!`)
-          .addFields(
-            {
-              name: `${EMOJI.BID} Amount`,
-              value: `${p.amount}pts`,
-              inline: true,
-            },
-            { name: "👤 Bidder", value: p.username, inline: true }
-          ),
-      ],
-    });
-
-    setTimeout(
-      async () => await errorHandler.safeDelete(reaction.message, 'bid confirmation delayed delete'),
-      5000
-    );
-    if (p.origMsgId) {
-      const orig = await reaction.message.channel.messages
-        .fetch(p.origMsgId)
-        .catch(() => null);
-      if (orig) await errorHandler.safeDelete(orig, 'message deletion');
-    }
-
-    delete st.pc[reaction.message.id];
-    save();
-
-    if (st.pause) {
-      resumeAuction(reaction.client, config);
-      await reaction.message.channel.send(
-        `${EMOJI.PLAY} **RESUMED** - Timer continues with ${fmtTime(
-          a.endTime - Date.now()
-        )} remaining...`
-      );
-    } else if (timeLeft < 60000) {
-      schedTimers(reaction.client, config);
-    }
-
-    console.log(
-      `${EMOJI.SUCCESS} Bid: ${p.username} - ${p.amount}pts${
-        p.isSelf ? ` (self +${p.needed}pts)` : ""
-      }`
-    );
   },
 
   /**
@@ -4451,58 +4218,6 @@ module.exports = {
    */
   cancelBid: async function (reaction, user, config) {
     console.warn('[DEPRECATED] cancelBid called - this function is no longer used (instant bidding enabled)');
-    return;
-    const p = st.pc[reaction.message.id];
-    if (!p) return;
-
-    const guild = reaction.message.guild,
-      member = await guild.members.fetch(user.id).catch(() => null);
-    if (!member) return;
-
-    const isOwner = p.userId === user.id,
-      isAdm = isAdmFunc(member, config);
-
-    if (!isOwner && !isAdm) {
-      await reaction.users.remove(user.id).catch(err => errorHandler.silentError(err, 'remove unauthorized cancel reaction'));
-      return;
-    }
-
-    await errorHandler.safeEdit(reaction.message, {
-      embeds: [
-        new EmbedBuilder()
-          .setColor(getColor(COLORS.INFO))
-          .setTitle(`${EMOJI.ERROR} Bid Canceled`)
-          .setDescription("Not placed"),
-      ],
-    }, 'message edit');
-    await errorHandler.safeRemoveReactions(reaction.message, 'cancel bid cleanup');
-    setTimeout(
-      async () => await errorHandler.safeDelete(reaction.message, 'cancel bid delayed delete'),
-      3000
-    );
-
-    if (p.origMsgId) {
-      const orig = await reaction.message.channel.messages
-        .fetch(p.origMsgId)
-        .catch(() => null);
-      if (orig) await errorHandler.safeDelete(orig, 'message deletion');
-    }
-
-    if (st.th[`c_${reaction.message.id}`]) {
-      clearTimeout(st.th[`c_${reaction.message.id}`]);
-      delete st.th[`c_${reaction.message.id}`];
-    }
-
-    delete st.pc[reaction.message.id];
-    save();
-
-    // Resume if paused (only for regular bidding.js auctions, not auctioneering)
-    if (!p.isAuctioneering && st.pause) {
-      resumeAuction(reaction.client, config);
-      await reaction.message.channel.send(
-        `${EMOJI.PLAY} **RESUMED** - Bid canceled, auction continues...`
-      );
-    }
   },
 
   // ═════════════════════════════════════════════════════════════════════════
@@ -4613,6 +4328,7 @@ module.exports = {
       "auctionEnd",
       "next",
       "aStart",
+      "finalize",
     ].forEach((k) => {
       if (st.th[k]) {
         clearTimeout(st.th[k]);
@@ -20,8 +20,8 @@
  * ============================================================================
  */
 
-const fs = require('fs');
 const path = require('path');
+const { readJsonCached } = require('./utils/json-file-cache');
 
 // ============================================================================
 // CONFIGURATION
@@ -104,8 +104,7 @@ async function initialize(discordClient, botConfig, sheetAPIInstance, attendance
  */
 function loadBossSpawnConfig() {
   const configPath = path.join(__dirname, 'boss_spawn_config.json');
-  const rawData = fs.readFileSync(configPath, 'utf8');
-  bossSpawnConfig = JSON.parse(rawData);
+  bossSpawnConfig = readJsonCached(configPath);
   console.log(`📋 Loaded ${Object.keys(bossSpawnConfig.timerBasedBosses).length} timer-based and ${Object.keys(bossSpawnConfig.scheduleBasedBosses).length} schedule-based bosses`);
 }
 
@@ -82,7 +82,7 @@ const bossTimerCommands = require("./boss-timer-commands.js"); // Boss timer com
 const emergencyCommands = require("./emergency-commands.js"); // Emergency overrides
 const leaderboardSystem = require("./leaderboard-system.js"); // Leaderboards
 const errorHandler = require('./utils/error-handler');      // Centralized error handling
-const { SheetAPI } = require('./utils/sheet-api');          // Unified Google Sheets API
+const { SheetAPI, closeAllSheetConnections } = require('./utils/sheet-api'); // Unified Google Sheets API
 const { DiscordCache } = require('./utils/discord-cache');  // Channel caching system
 const { normalizeUsername, findBossMatch } = require('./utils/common');    // Username normalization and boss matching
 const { getBossImageAttachment, getBossImageAttachmentURL } = require('./utils/boss-images'); // Boss images utility
@@ -608,6 +608,67 @@ function hasElysiumRole(member) {
   return member.roles.cache.some((r) => r.name === config.elysium_role);
 }
 
+/**
+ * Attendance check-in keywords and their common misspellings.
+ * Built once at load time: the check-in path runs for every spawn-thread message.
+ */
+const ATTENDANCE_KEYWORDS = ["present", "here", "join", "checkin", "check-in", "attending"];
+const ATTENDANCE_KEYWORD_SET = new Set(ATTENDANCE_KEYWORDS);
+const ATTENDANCE_MISSPELLINGS = {
+  // "present" misspellings
+  "prsnt": "present", "presnt": "present", "presen": "present",
+  "preent": "present", "prsetn": "present", "preasent": "present",
+  "prasent": "present", "presemt": "present", "presetn": "present",
+  "prresent": "present", "pressent": "present", "prezent": "present",
+  "prsnts": "present", "prsntt": "present", "pesent": "present",
+  "prsent": "present", "prresent": "present",
+
+  // "here" misspellings
+  "hre": "here", "her": "here", "heer": "here", "herre": "here",
+  "heere": "here", "hrre": "here", "hhere": "here",
+
+  // "attending" misspellings
+  "atending": "attending", "attending": "attending", "attnding": "attending",
+  "attendng": "attending", "attening": "attending", "atending": "attending",
+  "attednign": "attending", "attneding": "attending",
+
+  // "join" misspellings
+  "jon": "join", "jion": "join", "jojn": "join", "joiin": "join",
+
+  // "checkin" misspellings
+  "chekin": "checkin", "chckin": "checkin", "checkn": "checkin",
+  "checin": "checkin", "chkin": "checkin"
+};
+
+/**
+ * Checks if a word is an attendance keyword (exact, known misspelling, or fuzzy match).
+ *
+ * @param {string} word - First word of the message, lowercased
+ * @returns {boolean} True if the word counts as a check-in
+ */
+function isAttendanceKeyword(word) {
+  // Exact matches
+  if (ATTENDANCE_KEYWORD_SET.has(word)) return true;
+
+  // Common misspellings
+  if (Object.hasOwn(ATTENDANCE_MISSPELLINGS, word)) {
+    console.log(`✏️ Auto-corrected "${word}" → "${ATTENDANCE_MISSPELLINGS[word]}"`);
+    return true;
+  }
+
+  // Levenshtein distance check for close matches (1-2 character difference)
+  if (word.length < 3) return false;
+  for (const validKeyword of ATTENDANCE_KEYWORDS) {
+    const distance = levenshtein.get(word, validKeyword);
+    if (distance <= 2) {
+      console.log(`✏️ Fuzzy matched "${word}" → "${validKeyword}" (distance: ${distance})`);
+      return true;
+    }
+  }
+
+  return false;
+}
+
 // =====================================================================
 // SECTION 6: BIDDING CHANNEL CLEANUP
 // =====================================================================
@@ -1425,6 +1486,48 @@ function createDisabledRow(btn1, btn2) {
   return new ActionRowBuilder().addComponents(disabledBtn1, disabledBtn2);
 }
 
+/**
+ * Posts the "Attendance Verified" embed to a spawn's admin confirmation thread.
+ * Independent of the user-facing reply, so callers run both concurrently.
+ *
+ * @param {Guild} guild - Discord guild
+ * @param {Object} spawnInfo - Spawn data (boss, confirmThreadId, members)
+ * @param {string} author - Verified member name
+ * @param {string} verifiedBy - Username of the admin who verified
+ * @returns {Promise<void>}
+ */
+async function sendVerifiedNotice(guild, spawnInfo, author, verifiedBy) {
+  if (!spawnInfo.confirmThreadId) return;
+
+  // Capture the count now; other verifications may land while fetching
+  const totalVerified = spawnInfo.members.length;
+  const confirmThread = await guild.channels
+    .fetch(spawnInfo.confirmThreadId)
+    .catch(() => null);
+  if (!confirmThread) return;
+
+  const embed = new EmbedBuilder()
+    .setColor(0x00ff00)
+    .setTitle("✅ Attendance Verified")
+    .setDescription(`**${author}** verified for **${spawnInfo.boss}**`)
+    .addFields(
+      { name: "Verified By", value: verifiedBy, inline: true },
+      {
+        name: "Points",
+        value: `+${attendance.getSpawnPoints(spawnInfo)}`,
+        inline: true,
+      },
+      {
+        name: "Total Verified",
+        value: `${totalVerified}`,
+        inline: true,
+      }
+    )
+    .setTimestamp();
+
+  await confirmThread.send({ embeds: [embed] });
+}
+
 /**
  * Universal confirmation dialog with reaction-based user response.
  *
@@ -2293,9 +2396,7 @@ stats: async (message, member, args) => {
                 `Processing: **${spawnInfo.boss}** (${spawnInfo.timestamp})...`
             );
 
-            const pendingInThread = Object.entries(pendingVerifications).filter(
-              ([msgId, p]) => p.threadId === threadId
-            );
+            const pendingInThread = attendance.getPendingInThread(threadId);
 
             if (pendingInThread.length > 0) {
               await message.channel.send(
@@ -2303,16 +2404,9 @@ stats: async (message, member, args) => {
               );
 
               const newMembers = pendingInThread
-                .filter(
-                  ([msgId, p]) =>
-                    !spawnInfo.members.some(
-                      (m) => normalizeUsername(m) === normalizeUsername(p.author)
-                    )
-                )
+                .filter(([msgId, p]) => attendance.addVerifiedMember(spawnInfo, p.author, p.authorKey))
                 .map(([msgId, p]) => p.author);
 
-              spawnInfo.members.push(...newMembers);
-
               const messageIds = pendingInThread.map(([msgId, p]) => msgId);
               const messagePromises = messageIds.map((msgId) =>
                 thread.messages.fetch(msgId).catch(() => null)
@@ -2328,7 +2422,7 @@ stats: async (message, member, args) => {
               await Promise.allSettled(reactionPromises);
 
               pendingInThread.forEach(
-                ([msgId]) => delete pendingVerifications[msgId]
+                ([msgId]) => attendance.removePendingVerification(msgId)
               );
 
               await message.channel.send(
@@ -2469,16 +2563,7 @@ stats: async (message, member, args) => {
                   `   ├─ 📊 Submitting ${spawnInfo.members.length} member(s) to Google Sheets...`
                 );
 
-                const payload = {
-                  action: "submitAttendance",
-                  boss: spawnInfo.boss,
-                  date: spawnInfo.date,
-                  time: spawnInfo.time,
-                  timestamp: spawnInfo.timestamp,
-                  members: spawnInfo.members,
-                };
-
-                const resp = await attendance.postToSheet(payload);
+                const resp = await attendance.submitSpawnAttendance(spawnInfo);
 
                 if (resp.ok) {
               // Auto-increment boss rotation if it's a rotating boss
@@ -2557,7 +2642,7 @@ stats: async (message, member, args) => {
                 setTimeout(resolve, TIMING.RETRY_DELAY)
               );
 
-              const retryResp = await attendance.postToSheet(payload);
+              const retryResp = await attendance.submitSpawnAttendance(spawnInfo);
 
               if (retryResp.ok) {
                 if (spawnInfo.confirmThreadId) {
@@ -2715,16 +2800,7 @@ stats: async (message, member, args) => {
           `📊 Submitting ${spawnInfo.members.length} members to Google Sheets...`
         );
 
-        const payload = {
-          action: "submitAttendance",
-          boss: spawnInfo.boss,
-          date: spawnInfo.date,
-          time: spawnInfo.time,
-          timestamp: spawnInfo.timestamp,
-          members: spawnInfo.members,
-        };
-
-        const resp = await attendance.postToSheet(payload);
+        const resp = await attendance.submitSpawnAttendance(spawnInfo);
 
         if (resp.ok) {
           // Auto-increment boss rotation if it's a rotating boss
@@ -2775,9 +2851,7 @@ stats: async (message, member, args) => {
       return;
     }
 
-    const pendingInThread = Object.values(pendingVerifications).filter(
-      (p) => p.threadId === threadId
-    );
+    const pendingInThread = attendance.getPendingInThread(threadId);
 
     const embed = new EmbedBuilder()
       .setColor(0x4a90e2)
@@ -2822,9 +2896,9 @@ stats: async (message, member, args) => {
 
   resetpending: async (message, member) => {
     const threadId = message.channel.id;
-    const pendingInThread = Object.keys(pendingVerifications).filter(
-      (msgId) => pendingVerifications[msgId].threadId === threadId
-    );
+    const pendingInThread = attendance
+      .getPendingInThread(threadId)
+      .map(([msgId]) => msgId);
 
     if (pendingInThread.length === 0) {
       await message.reply("✅ No pending verifications in this thread.");
@@ -2839,7 +2913,7 @@ stats: async (message, member, args) => {
         `Members will NOT be added to verified list.\n\n` +
         `Click ✅ Confirm or ❌ Cancel button below.`,
       async (confirmMsg) => {
-        pendingInThread.forEach((msgId) => delete pendingVerifications[msgId]);
+        pendingInThread.forEach((msgId) => attendance.removePendingVerification(msgId));
 
         await message.reply(
           `✅ **Cleared ${pendingInThread.length} pending verification(s).**\n\n` +
@@ -2952,8 +3026,6 @@ stats: async (message, member, args) => {
         const spawnInfo = activeSpawns[thread.id];
 
         if (messages) {
-          const exactKeywords = ["present", "here", "join", "checkin", "check-in", "attending"];
-
           for (const [msgId, msg] of messages) {
             // Skip bot messages
             if (msg.author.bot) continue;
@@ -2962,14 +3034,12 @@ stats: async (message, member, args) => {
             const keyword = content.split(/\s+/)[0];
 
             // Check if it's a check-in message
-            if (exactKeywords.includes(keyword)) {
+            if (ATTENDANCE_KEYWORD_SET.has(keyword)) {
               const msgMember = await guild.members.fetch(msg.author.id).catch(() => null);
               const username = msgMember ? (msgMember.nickname || msg.author.username) : msg.author.username;
 
               // Check if already verified
-              const isVerified = spawnInfo.members.some(
-                (m) => normalizeUsername(m) === normalizeUsername(username)
-              );
+              const isVerified = attendance.isMemberVerified(spawnInfo, username);
 
               if (isVerified) {
                 alreadyVerified++;
@@ -2982,13 +3052,13 @@ stats: async (message, member, args) => {
               }
 
               // Add to pending verifications (late check-ins will also be added)
-              pendingVerifications[msgId] = {
+              attendance.addPendingVerification(msgId, {
                 author: username,
                 authorId: msg.author.id,
                 threadId: thread.id,
                 timestamp: msg.createdTimestamp,
                 verificationMsgId: null, // No button message for re-queued verifications
-              };
+              });
               foundCheckIns++;
             }
           }
@@ -3037,9 +3107,7 @@ stats: async (message, member, args) => {
       return;
     }
 
-    const pendingInThread = Object.entries(pendingVerifications).filter(
-      ([msgId, p]) => p.threadId === message.channel.id
-    );
+    const pendingInThread = attendance.getPendingInThread(message.channel.id);
 
     // Check if column already exists
     const columnExists = await attendance.checkColumnExists(spawnInfo.boss, spawnInfo.timestamp);
@@ -3066,15 +3134,9 @@ stats: async (message, member, args) => {
           await message.channel.send(`📋 Auto-verifying ${pendingInThread.length} pending check-in(s)...`);
 
           for (const [msgId, pending] of pendingInThread) {
-            const isDuplicate = spawnInfo.members.some(
-              (m) => normalizeUsername(m) === normalizeUsername(pending.author)
-            );
+            attendance.addVerifiedMember(spawnInfo, pending.author, pending.authorKey);
 
-            if (!isDuplicate) {
-              spawnInfo.members.push(pending.author);
-            }
-
-            delete pendingVerifications[msgId];
+            attendance.removePendingVerification(msgId);
           }
 
           attendance.setPendingVerifications(pendingVerifications);
@@ -3122,17 +3184,8 @@ stats: async (message, member, args) => {
             (columnExists ? ` (Overwriting existing column)` : ` (Creating new column)`)
         );
 
-        // Prepare payload - use different action based on whether column exists
-        const payload = {
-          action: columnExists ? "overwriteAttendance" : "submitAttendance",
-          boss: spawnInfo.boss,
-          date: spawnInfo.date,
-          time: spawnInfo.time,
-          timestamp: spawnInfo.timestamp,
-          members: spawnInfo.members,
-        };
-
-        const resp = await attendance.postToSheet(payload);
+        // Overwrite instead of submit when the column already exists
+        const resp = await attendance.submitSpawnAttendance(spawnInfo, columnExists);
 
         if (resp.ok) {
           // Auto-increment boss rotation if it's a rotating boss
@@ -6600,77 +6653,6 @@ client.on(Events.MessageCreate, async (message) => {
       const content = message.content.trim().toLowerCase();
       const keyword = content.split(/\s+/)[0];
 
-      // Helper function: Check if keyword matches attendance keywords (with fuzzy matching)
-      const isAttendanceKeyword = (word) => {
-        // Exact matches
-        const exactKeywords = ["present", "here", "join", "checkin", "check-in", "attending"];
-        if (exactKeywords.includes(word)) return true;
-
-        // Common misspellings (comprehensive list)
-        const misspellings = {
-          // "present" misspellings
-          "prsnt": "present", "presnt": "present", "presen": "present",
-          "preent": "present", "prsetn": "present", "preasent": "present",
-          "prasent": "present", "presemt": "present", "presetn": "present",
-          "prresent": "present", "pressent": "present", "prezent": "present",
-          "prsnts": "present", "prsntt": "present", "pesent": "present",
-          "prsent": "present", "prresent": "present",
-
-          // "here" misspellings
-          "hre": "here", "her": "here", "heer": "here", "herre": "here",
-          "heere": "here", "hrre": "here", "hhere": "here",
-
-          // "attending" misspellings
-          "atending": "attending", "attending": "attending", "attnding": "attending",
-          "attendng": "attending", "attening": "attending", "atending": "attending",
-          "attednign": "attending", "attneding": "attending",
-
-          // "join" misspellings
-          "jon": "join", "jion": "join", "jojn": "join", "joiin": "join",
-
-          // "checkin" misspellings
-          "chekin": "checkin", "chckin": "checkin", "checkn": "checkin",
-          "checin": "checkin", "chkin": "checkin"
-        };
-
-        if (misspellings[word]) {
-          console.log(`✏️ Auto-corrected "${word}" → "${misspellings[word]}"`);
-          return true;
-        }
-
-        // Levenshtein distance check for close matches (1-2 character difference)
-        const calculateDistance = (a, b) => {
-          const matrix = Array(b.length + 1).fill(null).map(() => Array(a.length + 1).fill(null));
-
-          for (let i = 0; i <= a.length; i++) matrix[0][i] = i;
-          for (let j = 0; j <= b.length; j++) matrix[j][0] = j;
-
-          for (let j = 1; j <= b.length; j++) {
-            for (let i = 1; i <= a.length; i++) {
-              const indicator = a[i - 1] === b[j - 1] ? 0 : 1;
-              matrix[j][i] = Math.min(
-                matrix[j][i - 1] + 1,
-                matrix[j - 1][i] + 1,
-                matrix[j - 1][i - 1] + indicator
-              );
-            }
-          }
-
-          return matrix[b.length][a.length];
-        };
-
-        // Check distance to each keyword (allow 1-2 character difference)
-        for (const validKeyword of exactKeywords) {
-          const distance = calculateDistance(word, validKeyword);
-          if (distance <= 2 && word.length >= 3) {
-            console.log(`✏️ Fuzzy matched "${word}" → "${validKeyword}" (distance: ${distance})`);
-            return true;
-          }
-        }
-
-        return false;
-      };
-
       // Check if message is a check-in keyword (with fuzzy matching)
       if (isAttendanceKeyword(keyword)) {
         // Ignore bot check-ins (bots can't attend spawns)
@@ -6701,9 +6683,8 @@ client.on(Events.MessageCreate, async (message) => {
 
         // Check for duplicate check-in (normalized username comparison)
         const username = member.nickname || message.author.username;
-        const isDuplicate = spawnInfo.members.some(
-          (m) => normalizeUsername(m) === normalizeUsername(username)
-        );
+        const usernameKey = normalizeUsername(username);
+        const isDuplicate = attendance.isMemberVerified(spawnInfo, username, usernameKey);
 
         if (isDuplicate) {
           await message.reply(`⚠️ You already checked in for this spawn.`);
@@ -6734,29 +6715,35 @@ client.on(Events.MessageCreate, async (message) => {
 
         const row = new ActionRowBuilder().addComponents(approveButton, denyButton);
 
+        // Notify the admin thread while the check-in reply is being sent
+        const confirmNotice = spawnInfo.confirmThreadId
+          ? guild.channels
+              .fetch(spawnInfo.confirmThreadId)
+              .catch(() => null)
+              .then((confirmThread) =>
+                confirmThread &&
+                confirmThread.send(
+                  userIsAdmin
+                    ? `⏩ **${username}** (Admin) - Fast-track check-in (no screenshot)`
+                    : `⏳ **${username}** - Pending verification`
+                )
+              )
+              .catch((err) => errorHandler.silentError(err, 'check-in confirm thread notice'))
+          : null;
+
         const verificationMsg = await message.reply({ embeds: [embed], components: [row] });
 
         // Track pending verification in state
-        pendingVerifications[message.id] = {
+        attendance.addPendingVerification(message.id, {
           author: username,
+          authorKey: usernameKey,
           authorId: message.author.id,
           threadId: message.channel.id,
           timestamp: Date.now(),
           verificationMsgId: verificationMsg.id,
-        };
+        });
         attendance.setPendingVerifications(pendingVerifications);
-
-        if (spawnInfo.confirmThreadId) {
-          const confirmThread = await guild.channels
-            .fetch(spawnInfo.confirmThreadId)
-            .catch(() => null);
-          if (confirmThread) {
-            const notifText = userIsAdmin
-              ? `⏩ **${username}** (Admin) - Fast-track check-in (no screenshot)`
-              : `⏳ **${username}** - Pending verification`;
-            await confirmThread.send(notifText);
-          }
-        }
+        await confirmNotice;
 
         console.log(
           `🔍 Pending: ${username} for ${spawnInfo.boss}${
@@ -6780,9 +6767,7 @@ client.on(Events.MessageCreate, async (message) => {
           return;
         }
 
-        const pendingInThread = Object.entries(pendingVerifications).filter(
-          ([msgId, p]) => p.threadId === message.channel.id
-        );
+        const pendingInThread = attendance.getPendingInThread(message.channel.id);
 
         if (pendingInThread.length === 0) {
           await message.reply("ℹ️ No pending verifications in this thread.");
@@ -6804,12 +6789,7 @@ client.on(Events.MessageCreate, async (message) => {
             const verifiedMembers = [];
 
             for (const [msgId, pending] of pendingInThread) {
-              const isDuplicate = spawnInfo.members.some(
-                (m) => normalizeUsername(m) === normalizeUsername(pending.author)
-              );
-
-              if (!isDuplicate) {
-                spawnInfo.members.push(pending.author);
+              if (attendance.addVerifiedMember(spawnInfo, pending.author, pending.authorKey)) {
                 verifiedMembers.push(pending.author);
                 verifiedCount++;
               } else {
@@ -6832,7 +6812,7 @@ client.on(Events.MessageCreate, async (message) => {
                 }
               }
 
-              delete pendingVerifications[msgId];
+              attendance.removePendingVerification(msgId);
             }
 
             await message.reply(
@@ -6892,9 +6872,8 @@ client.on(Events.MessageCreate, async (message) => {
           ? mentionedMember.nickname || mentioned.username
           : mentioned.username;
 
-        const isDuplicate = spawnInfo.members.some(
-          (m) => normalizeUsername(m) === normalizeUsername(username)
-        );
+        const usernameKey = normalizeUsername(username);
+        const isDuplicate = !attendance.addVerifiedMember(spawnInfo, username, usernameKey);
 
         if (isDuplicate) {
           await message.reply(
@@ -6903,12 +6882,10 @@ client.on(Events.MessageCreate, async (message) => {
           return;
         }
 
-        spawnInfo.members.push(username);
-
         // Find and disable verification buttons for this user
-        const pendingInThread = Object.entries(pendingVerifications).filter(
-          ([msgId, p]) => p.threadId === message.channel.id && normalizeUsername(p.author) === normalizeUsername(username)
-        );
+        const pendingInThread = attendance
+          .getPendingInThread(message.channel.id)
+          .filter(([msgId, p]) => p.authorKey === usernameKey);
 
         for (const [msgId, pending] of pendingInThread) {
           if (pending.verificationMsgId) {
@@ -6919,7 +6896,7 @@ client.on(Events.MessageCreate, async (message) => {
               await errorHandler.safeEdit(verificationMsg, { components: [] }, 'manual verify disable buttons');
             }
           }
-          delete pendingVerifications[msgId];
+          attendance.removePendingVerification(msgId);
         }
         attendance.setPendingVerifications(pendingVerifications);
 
@@ -6952,9 +6929,7 @@ client.on(Events.MessageCreate, async (message) => {
           return;
         }
 
-        const pendingInThread = Object.entries(pendingVerifications).filter(
-          ([msgId, p]) => p.threadId === message.channel.id
-        );
+        const pendingInThread = attendance.getPendingInThread(message.channel.id);
 
         if (pendingInThread.length > 0) {
           // Limit to first 10 to avoid exceeding 2000 char Discord message limit
@@ -7034,10 +7009,10 @@ client.on(Events.MessageCreate, async (message) => {
           return;
         }
 
-        const pendingInThread = Object.keys(pendingVerifications).filter(
-          (msgId) => pendingVerifications[msgId].threadId === message.channel.id
-        );
-        pendingInThread.forEach((msgId) => delete pendingVerifications[msgId]);
+        const pendingInThread = attendance
+          .getPendingInThread(message.channel.id)
+          .map(([msgId]) => msgId);
+        pendingInThread.forEach((msgId) => attendance.removePendingVerification(msgId));
 
         spawnInfo.closed = true;
 
@@ -7088,16 +7063,7 @@ client.on(Events.MessageCreate, async (message) => {
             `Submitting ${spawnInfo.members.length} members (ignoring ${pendingInThread.length} pending verifications)`
         );
 
-        const payload = {
-          action: "submitAttendance",
-          boss: spawnInfo.boss,
-          date: spawnInfo.date,
-          time: spawnInfo.time,
-          timestamp: spawnInfo.timestamp,
-          members: spawnInfo.members,
-        };
-
-        const resp = await attendance.postToSheet(payload);
+        const resp = await attendance.submitSpawnAttendance(spawnInfo);
 
         if (resp.ok) {
           // Auto-increment boss rotation if it's a rotating boss
@@ -7564,7 +7530,7 @@ client.on(Events.InteractionCreate, async (interaction) => {
 
       if (!spawnInfo || spawnInfo.closed) {
         await interaction.update({ content: "⚠️ This spawn is closed.", components: [] });
-        delete pendingVerifications[pendingMsgId];
+        attendance.removePendingVerification(pendingMsgId);
         attendance.setPendingVerifications(pendingVerifications);
         return;
       }
@@ -7577,9 +7543,7 @@ client.on(Events.InteractionCreate, async (interaction) => {
       const disabledRow = createDisabledRow(btn1, btn2);
 
       if (isApprove) {
-        const isDuplicate = spawnInfo.members.some(
-          (m) => normalizeUsername(m) === normalizeUsername(pending.author)
-        );
+        const isDuplicate = !attendance.addVerifiedMember(spawnInfo, pending.author, pending.authorKey);
 
         if (isDuplicate) {
           await interaction.update({
@@ -7587,51 +7551,25 @@ client.on(Events.InteractionCreate, async (interaction) => {
             components: [disabledRow]
           });
           await interaction.followUp({ content: `⚠️ **${pending.author}** already verified.`, ephemeral: false });
-          delete pendingVerifications[pendingMsgId];
+          attendance.removePendingVerification(pendingMsgId);
           attendance.setPendingVerifications(pendingVerifications);
           return;
         }
 
-        spawnInfo.members.push(pending.author);
         attendance.setActiveSpawns(activeSpawns);
 
-        await interaction.update({
-          embeds: [EmbedBuilder.from(msg.embeds[0]).setColor(0x00ff00).setFooter({ text: `Verified by ${user.username}` })],
-          components: [disabledRow]
-        });
-        await interaction.followUp({ content: `✅ **${pending.author}** verified by ${user.username}!`, ephemeral: false });
-
-        if (spawnInfo.confirmThreadId) {
-          const confirmThread = await guild.channels
-            .fetch(spawnInfo.confirmThreadId)
-            .catch(() => null);
-          if (confirmThread) {
-            const embed = new EmbedBuilder()
-              .setColor(0x00ff00)
-              .setTitle("✅ Attendance Verified")
-              .setDescription(
-                `**${pending.author}** verified for **${spawnInfo.boss}**`
-              )
-              .addFields(
-                { name: "Verified By", value: user.username, inline: true },
-                {
-                  name: "Points",
-                  value: `+${bossPoints[spawnInfo.boss].points}`,
-                  inline: true,
-                },
-                {
-                  name: "Total Verified",
-                  value: `${spawnInfo.members.length}`,
-                  inline: true,
-                }
-              )
-              .setTimestamp();
-
-            await confirmThread.send({ embeds: [embed] });
-          }
-        }
+        // The follow-up must wait for the update; the admin notice is independent
+        await Promise.all([
+          interaction
+            .update({
+              embeds: [EmbedBuilder.from(msg.embeds[0]).setColor(0x00ff00).setFooter({ text: `Verified by ${user.username}` })],
+              components: [disabledRow]
+            })
+            .then(() => interaction.followUp({ content: `✅ **${pending.author}** verified by ${user.username}!`, ephemeral: false })),
+          sendVerifiedNotice(guild, spawnInfo, pending.author, user.username),
+        ]);
 
-        delete pendingVerifications[pendingMsgId];
+        attendance.removePendingVerification(pendingMsgId);
         attendance.setPendingVerifications(pendingVerifications);
       } else {
         // Deny
@@ -7646,7 +7584,7 @@ client.on(Events.InteractionCreate, async (interaction) => {
           ephemeral: false
         });
 
-        delete pendingVerifications[pendingMsgId];
+        attendance.removePendingVerification(pendingMsgId);
         attendance.setPendingVerifications(pendingVerifications);
       }
 
@@ -7746,16 +7684,7 @@ client.on(Events.InteractionCreate, async (interaction) => {
           ephemeral: false
         });
 
-        const payload = {
-          action: "submitAttendance",
-          boss: spawnInfo.boss,
-          date: spawnInfo.date,
-          time: spawnInfo.time,
-          timestamp: spawnInfo.timestamp,
-          members: spawnInfo.members,
-        };
-
-        const resp = await attendance.postToSheet(payload);
+        const resp = await attendance.submitSpawnAttendance(spawnInfo);
 
         if (resp.ok) {
           // Auto-increment boss rotation if it's a rotating boss
@@ -7856,12 +7785,12 @@ client.on(Events.InteractionCreate, async (interaction) => {
  *
  * Safety features:
  * - Ignores bot reactions
- * - Fetches partial data (uncached entities)
+ * - Works on partial (uncached) messages without fetching them
  * - Validates user permissions
  * - Error handling with detailed logging
  *
  * Flow:
- * Reaction -> Partial Fetch -> State Lookup -> Permission Check -> Action Execution
+ * Reaction -> State Lookup -> Permission Check -> Action Execution
  *
  * @event MessageReactionAdd
  * @param {MessageReaction} reaction - The reaction object
@@ -7874,9 +7803,6 @@ client.on(Events.MessageReactionAdd, async (reaction, user) => {
     if (!reaction.message.guild) return; // Skip DM reactions
     if (reaction.message.guild.id !== config.main_guild_id) return; // Skip wrong guild
 
-    if (reaction.partial) await reaction.fetch();
-    if (reaction.message.partial) await reaction.message.fetch();
-
     const msg = reaction.message;
     const guild = msg.guild;
 
@@ -7885,7 +7811,7 @@ client.on(Events.MessageReactionAdd, async (reaction, user) => {
     pendingVerifications = attendance.getPendingVerifications();
     pendingClosures = attendance.getPendingClosures();
 
-    // Guard against closed threads
+    // Guard against closed threads (message ID and channel are known even on partials)
     if (
       msg.channel.isThread() &&
       msg.channel.parentId === config.attendance_channel_id
@@ -7915,22 +7841,23 @@ client.on(Events.MessageReactionAdd, async (reaction, user) => {
     const pending = pendingVerifications[msg.id];
     const closePending = pendingClosures[msg.id];
 
+    // ⚡ PERFORMANCE: Ignore reactions on non-attendance messages before any API calls
+    if (!pending && !closePending) return;
+
+    // No reaction.fetch()/msg.fetch() for partials: the gateway event already
+    // carries the message, channel and emoji IDs, and everything below (reply,
+    // delete, reaction removal) only needs those - not the message content
     // Admin check ONLY for attendance-related reactions
-    if (pending || closePending) {
-      const adminMember = await guild.members.fetch(user.id).catch(() => null);
-      if (!adminMember || !isAdmin(adminMember)) {
-        try {
-          await reaction.users.remove(user.id);
-        } catch (e) {
-          console.error(
-            `❌ Failed to remove non-admin reaction from ${user.tag}:`,
-            e.message
-          );
-        }
-        return;
+    const adminMember = await guild.members.fetch(user.id).catch(() => null);
+    if (!adminMember || !isAdmin(adminMember)) {
+      try {
+        await reaction.users.remove(user.id);
+      } catch (e) {
+        console.error(
+          `❌ Failed to remove non-admin reaction from ${user.tag}:`,
+          e.message
+        );
       }
-    } else {
-      // Not an attendance-related message, ignore this reaction
       return;
     }
 
@@ -7939,63 +7866,32 @@ client.on(Events.MessageReactionAdd, async (reaction, user) => {
 
       if (!spawnInfo || spawnInfo.closed) {
         await msg.reply("⚠️ This spawn is closed.");
-        delete pendingVerifications[msg.id];
+        attendance.removePendingVerification(msg.id);
         attendance.setPendingVerifications(pendingVerifications); // Sync
         return;
       }
 
       if (reaction.emoji.name === "✅") {
-        const isDuplicate = spawnInfo.members.some(
-          (m) => normalizeUsername(m) === normalizeUsername(pending.author)
-        );
+        const isDuplicate = !attendance.addVerifiedMember(spawnInfo, pending.author, pending.authorKey);
 
         if (isDuplicate) {
           await msg.reply(`⚠️ **${pending.author}** already verified.`);
           await attendance.removeAllReactionsWithRetry(msg); // CHANGED
-          delete pendingVerifications[msg.id];
+          attendance.removePendingVerification(msg.id);
           attendance.setPendingVerifications(pendingVerifications); // Sync
           return;
         }
 
-        spawnInfo.members.push(pending.author);
         attendance.setActiveSpawns(activeSpawns); // Sync
 
-        await attendance.removeAllReactionsWithRetry(msg); // CHANGED
-        await msg.reply(
-          `✅ **${pending.author}** verified by ${user.username}!`
-        );
-
-        if (spawnInfo.confirmThreadId) {
-          const confirmThread = await guild.channels
-            .fetch(spawnInfo.confirmThreadId)
-            .catch(() => null);
-          if (confirmThread) {
-            const embed = new EmbedBuilder()
-              .setColor(0x00ff00)
-              .setTitle("✅ Attendance Verified")
-              .setDescription(
-                `**${pending.author}** verified for **${spawnInfo.boss}**`
-              )
-              .addFields(
-                { name: "Verified By", value: user.username, inline: true },
-                {
-                  name: "Points",
-                  value: `+${bossPoints[spawnInfo.boss].points}`,
-                  inline: true,
-                },
-                {
-                  name: "Total Verified",
-                  value: `${spawnInfo.members.length}`,
-                  inline: true,
-                }
-              )
-              .setTimestamp();
-
-            await confirmThread.send({ embeds: [embed] });
-          }
-        }
+        // Independent Discord calls: clear reactions, reply and notify admins in parallel
+        await Promise.all([
+          attendance.removeAllReactionsWithRetry(msg),
+          msg.reply(`✅ **${pending.author}** verified by ${user.username}!`),
+          sendVerifiedNotice(guild, spawnInfo, pending.author, user.username),
+        ]);
 
-        delete pendingVerifications[msg.id];
+        attendance.removePendingVerification(msg.id);
         attendance.setPendingVerifications(pendingVerifications); // Sync
       } else if (reaction.emoji.name === "❌") {
         await errorHandler.safeDelete(msg, 'message deletion');
@@ -8004,7 +7900,7 @@ client.on(Events.MessageReactionAdd, async (reaction, user) => {
             `Please repost with a proper screenshot.`
         );
 
-        delete pendingVerifications[msg.id];
+        attendance.removePendingVerification(msg.id);
         attendance.setPendingVerifications(pendingVerifications); // Sync
       }
     }
@@ -8075,16 +7971,7 @@ client.on(Events.MessageReactionAdd, async (reaction, user) => {
           `🔒 Closing spawn **${spawnInfo.boss}**... Submitting ${spawnInfo.members.length} members...`
         );
 
-        const payload = {
-          action: "submitAttendance",
-          boss: spawnInfo.boss,
-          date: spawnInfo.date,
-          time: spawnInfo.time,
-          timestamp: spawnInfo.timestamp,
-          members: spawnInfo.members,
-        };
-
-        const resp = await attendance.postToSheet(payload); // CHANGED
+        const resp = await attendance.submitSpawnAttendance(spawnInfo); // CHANGED
 
         if (resp.ok) {
           // Auto-increment boss rotation if it's a rotating boss
@@ -8205,6 +8092,10 @@ process.on("SIGTERM", () => {
   stopBiddingChannelCleanupSchedule();
   scheduler.stopScheduler(); // Stop maintenance scheduler
   timerRegistry.clearAllTimers(); // Clear all tracked timers
+  attendance.shutdown().catch(err => errorHandler.silentError(err, 'close attendance sheet connections'));
+  auctioneering.shutdown().catch(err => errorHandler.silentError(err, 'close auctioneering sheet connections'));
+  bidding.shutdown().catch(err => errorHandler.silentError(err, 'close bidding sheet connections'));
+  closeAllSheetConnections().catch(err => errorHandler.silentError(err, 'close shared sheet connections'));
   server.close(() => {
     console.log("🌐 HTTP server closed");
     client.destroy();
@@ -8217,6 +8108,10 @@ process.on("SIGINT", () => {
   stopBiddingChannelCleanupSchedule();
   scheduler.stopScheduler(); // Stop maintenance scheduler
   timerRegistry.clearAllTimers(); // Clear all tracked timers
+  attendance.shutdown().catch(err => errorHandler.silentError(err, 'close attendance sheet connections'));
+  auctioneering.shutdown().catch(err => errorHandler.silentError(err, 'close auctioneering sheet connections'));
+  bidding.shutdown().catch(err => errorHandler.silentError(err, 'close bidding sheet connections'));
+  closeAllSheetConnections().catch(err => errorHandler.silentError(err, 'close shared sheet connections'));
   server.close(() => {
     console.log("🌐 HTTP server closed");
     client.destroy();
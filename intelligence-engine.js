@@ -48,6 +48,7 @@ const { getCurrentTimestamp } = require('./utils/timestamp-cache');
 const { LearningSystem } = require('./learning-system');
 const fs = require('fs');
 const path = require('path');
+const { readJsonCached } = require('./utils/json-file-cache');
 
 // ═══════════════════════════════════════════════════════════════════════════
 // CONFIGURATION
@@ -241,8 +242,7 @@ class IntelligenceEngine {
     try {
       const configPath = path.join(__dirname, 'boss_spawn_config.json');
       if (fs.existsSync(configPath)) {
-        const configData = fs.readFileSync(configPath, 'utf8');
-        const config = JSON.parse(configData);
+        const config = readJsonCached(configPath);
         console.log('[INTELLIGENCE] Boss spawn configuration loaded successfully');
         return config;
       } else {
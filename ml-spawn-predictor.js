@@ -19,6 +19,8 @@
  * ML learns this variance and predicts: "24h with 90% chance between 23h45m-24h15m"
  */
 
+const { readJsonCached } = require('./utils/json-file-cache');
+
 class MLSpawnPredictor {
   constructor(sheetAPI, config) {
     this.sheetAPI = sheetAPI;
@@ -177,9 +179,8 @@ class MLSpawnPredictor {
     // Load boss spawn configuration for maintenance detection
     let bossSpawnConfig = null;
     try {
-      const fs = require('fs').promises;
-      const configData = await fs.readFile('boss_spawn_config.json', 'utf8');
-      bossSpawnConfig = JSON.parse(configData);
+      // Parsed once and reused across re-learns until the file changes
+      bossSpawnConfig = readJsonCached('boss_spawn_config.json');
       console.log('✅ Loaded boss spawn config for smart maintenance detection');
     } catch (error) {
       console.warn('⚠️ Could not load boss_spawn_config.json - maintenance detection disabled:', error.message);
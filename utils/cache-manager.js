@@ -56,6 +56,16 @@ const { debug } = require('./error-handler');
  */
 const fuzzyMatchCache = new Map();
 
+/**
+ * Lowercased name/alias index per boss table, built on first match.
+ * Keyed by the table object itself, so a reloaded table gets a fresh index.
+ * - exact: lowercased name or alias -> boss name (first occurrence wins)
+ * - all: [lowercased name or alias, boss name] in table order, names first
+ *
+ * @type {WeakMap<Object, {exact: Map<string, string>, all: Array<[string, string]>}>}
+ */
+const bossIndexes = new WeakMap();
+
 /**
  * General-purpose cache with TTL support (legacy).
  * Kept for backward compatibility, but new code should use L1/L2/L3 caches.
@@ -137,6 +147,28 @@ let cacheMisses = 0;
 // FUZZY BOSS NAME MATCHING
 // ============================================================================
 
+/**
+ * Get (or build) the lowercased name/alias index for a boss table.
+ *
+ * @param {Object} bossPoints - Boss points database with aliases
+ * @returns {{exact: Map<string, string>, all: Array<[string, string]>}} Index
+ */
+function getBossIndex(bossPoints) {
+  let index = bossIndexes.get(bossPoints);
+  if (index) return index;
+
+  index = { exact: new Map(), all: [] };
+  for (const name of Object.keys(bossPoints)) {
+    for (const label of [name, ...(bossPoints[name].aliases || [])]) {
+      const lower = label.toLowerCase();
+      if (!index.exact.has(lower)) index.exact.set(lower, name);
+      index.all.push([lower, name]);
+    }
+  }
+  bossIndexes.set(bossPoints, index);
+  return index;
+}
+
 /**
  * Find boss match with caching using multiple matching strategies.
  *
@@ -174,7 +206,8 @@ let cacheMisses = 0;
  */
 function findBossMatchCached(input, bossPoints) {
   // Normalize input for cache key (lowercase, trimmed)
-  const cacheKey = `${input.toLowerCase().trim()}`;
+  const q = input.toLowerCase().trim();
+  const cacheKey = q;
 
   // Check cache first for performance
   if (fuzzyMatchCache.has(cacheKey)) {
@@ -187,58 +220,26 @@ function findBossMatchCached(input, bossPoints) {
   // Cache miss - perform matching
   cacheMisses++;
 
-  const q = input.toLowerCase().trim();
+  const index = getBossIndex(bossPoints);
 
-  // STRATEGY 1: Exact match (case-insensitive)
+  // STRATEGY 1: Exact match (case-insensitive, names and aliases)
   // This is the fastest check and most reliable
-  for (const name of Object.keys(bossPoints)) {
-    if (name.toLowerCase() === q) {
-      fuzzyMatchCache.set(cacheKey, name);
-      return name;
-    }
-    // Also check aliases for exact match
-    const meta = bossPoints[name];
-    for (const alias of meta.aliases || []) {
-      if (alias.toLowerCase() === q) {
-        fuzzyMatchCache.set(cacheKey, name);
-        return name;
-      }
-    }
+  const exact = index.exact.get(q);
+  if (exact !== undefined) {
+    fuzzyMatchCache.set(cacheKey, exact);
+    return exact;
   }
 
   // STRATEGY 2: Partial match (substring matching)
-  // Checks if input is contained in boss name or vice versa
-  for (const name of Object.keys(bossPoints)) {
-    if (name.toLowerCase().includes(q) || q.includes(name.toLowerCase())) {
+  // Checks if input is contained in boss name/alias or vice versa
+  for (const [lower, name] of index.all) {
+    if (lower.includes(q) || q.includes(lower)) {
       fuzzyMatchCache.set(cacheKey, name);
       return name;
     }
-    // Also check aliases for partial match
-    const meta = bossPoints[name];
-    for (const alias of meta.aliases || []) {
-      if (alias.toLowerCase().includes(q) || q.includes(alias.toLowerCase())) {
-        fuzzyMatchCache.set(cacheKey, name);
-        return name;
-      }
-    }
   }
 
   // STRATEGY 3: Fuzzy match using Levenshtein distance
-  // Find the boss name with the smallest edit distance
-  let best = { name: null, dist: 999 };
-
-  for (const name of Object.keys(bossPoints)) {
-    // Calculate distance to boss name
-    const dist = levenshtein.get(q, name.toLowerCase());
-    if (dist < best.dist) best = { name, dist };
-
-    // Also check distances to aliases
-    for (const alias of bossPoints[name].aliases || []) {
-      const d2 = levenshtein.get(q, alias.toLowerCase());
-      if (d2 < best.dist) best = { name, dist: d2 };
-    }
-  }
-
   // Adaptive threshold: allow more errors for longer input
   // Base threshold is FUZZY_MATCH_MAX_DISTANCE (usually 2)
   // For longer strings, allow up to 25% of the length as errors
@@ -247,8 +248,18 @@ function findBossMatchCached(input, bossPoints) {
     Math.floor(q.length / 4)
   );
 
-  // Only accept match if within threshold
-  const result = best.dist <= maxAllowedDistance ? best.name : null;
+  // Find the boss name with the smallest edit distance within the threshold.
+  // The length difference is a lower bound on the distance, so candidates
+  // that can't beat the current best skip the full computation.
+  let best = { name: null, dist: maxAllowedDistance + 1 };
+
+  for (const [lower, name] of index.all) {
+    if (Math.abs(lower.length - q.length) >= best.dist) continue;
+    const dist = levenshtein.get(q, lower);
+    if (dist < best.dist) best = { name, dist };
+  }
+
+  const result = best.name;
 
   // Cache the result (even if null) to avoid repeated calculations
   fuzzyMatchCache.set(cacheKey, result);
@@ -19,6 +19,7 @@
  * @requires fast-levenshtein - For fuzzy string matching
  * @requires ./cache-manager - For cached boss matching
  * @requires ./constants - For shared constants
+ * @requires ./timestamp-cache - For cached Manila time conversion
  *
  * @author Elysium Attendance Bot Team
  * @version 2.0
@@ -32,6 +33,7 @@
 const levenshtein = require("fast-levenshtein");
 const { findBossMatchCached } = require('./cache-manager');
 const constants = require('./constants');
+const { getManilaTime } = require('./timestamp-cache');
 
 // ============================================================================
 // CONSTANTS RE-EXPORTS
@@ -66,7 +68,6 @@ const EMOJIS = constants.EMOJIS;
  */
 function getCurrentTimestamp() {
   // Use cached Manila time conversion for performance (v6.2 optimization)
-  const { getManilaTime } = require('./timestamp-cache');
   const manilaTime = getManilaTime();
 
   // Extract date components with zero-padding
@@ -76,11 +77,10 @@ function getCurrentTimestamp() {
   const hours = String(manilaTime.getHours()).padStart(2, "0");
   const mins = String(manilaTime.getMinutes()).padStart(2, "0");
 
-  return {
-    date: `${month}/${day}/${year}`,
-    time: `${hours}:${mins}`,
-    full: `${month}/${day}/${year} ${hours}:${mins}`,
-  };
+  // Format each part once and build `full` from them
+  const date = `${month}/${day}/${year}`;
+  const time = `${hours}:${mins}`;
+  return { date, time, full: `${date} ${time}` };
 }
 
 /**
@@ -100,7 +100,6 @@ function getCurrentTimestamp() {
  */
 function getSundayOfWeek() {
   // Use cached Manila time conversion for performance (v6.2 optimization)
-  const { getManilaTime } = require('./timestamp-cache');
   const manilaTime = getManilaTime();
 
   // Calculate Sunday of the current week
@@ -210,6 +209,10 @@ function normalizeTimestamp(timestamp) {
 // THREAD NAME PARSING
 // ============================================================================
 
+// Thread name patterns, compiled once at module load (hot path during state recovery)
+const BOSS_THREAD_NAME_RE = /^\[(.*?)\s+(.*?)\]\s+(.+)$/;
+const EVENT_THREAD_NAME_RE = /^(.+?)\s+(\d{2}-\d{2})\s+(\d{2}:\d{2})$/;
+
 /**
  * Parse thread name format for attendance threads.
  *
@@ -240,7 +243,7 @@ function normalizeTimestamp(timestamp) {
 function parseThreadName(name) {
   // Format 1: Boss spawn threads - [date time] boss
   // Example: "[10/29/25 09:22] Balrog"
-  const bossMatch = name.match(/^\[(.*?)\s+(.*?)\]\s+(.+)$/);
+  const bossMatch = BOSS_THREAD_NAME_RE.exec(name);
   if (bossMatch) {
     return {
       date: bossMatch[1],
@@ -252,7 +255,7 @@ function parseThreadName(name) {
 
   // Format 2: Event threads - EventType MM-DD HH:MM
   // Example: "GvG 11-22 14:30" or "Fortress Siege 11-22 14:30"
-  const eventMatch = name.match(/^(.+?)\s+(\d{2}-\d{2})\s+(\d{2}:\d{2})$/);
+  const eventMatch = EVENT_THREAD_NAME_RE.exec(name);
   if (eventMatch) {
     return {
       date: eventMatch[2],
@@ -355,14 +358,20 @@ function bossNamesMatch(boss1, boss2) {
   return boss1.toUpperCase() === boss2.toUpperCase();
 }
 
+/**
+ * Anything that is not a word character (letters, digits, underscore).
+ * Hoisted so the hot normalizeUsername path reuses one RegExp.
+ * @constant {RegExp}
+ */
+const NON_WORD_CHARS = /[^\w]/g;
+
 /**
  * Normalize username for comparison.
  *
  * Applies consistent normalization rules to usernames for reliable matching:
  * 1. Converts to lowercase
- * 2. Trims leading/trailing whitespace
- * 3. Replaces multiple consecutive spaces with single space
- * 4. Removes special characters (keeping only alphanumeric and spaces)
+ * 2. Removes whitespace and special characters (keeping only letters,
+ *    digits and underscore)
  *
  * This ensures usernames like "John Doe", "john doe", and "john  doe" are
  * all treated as the same user.
@@ -382,12 +391,12 @@ function bossNamesMatch(boss1, boss2) {
 function normalizeUsername(username) {
   if (!username) return '';
 
+  // A single pass over NON_WORD_CHARS also strips all whitespace, so no
+  // separate trim/space-collapse is needed
   return username
     .toString()
     .toLowerCase()                  // Convert to lowercase
-    .trim()                         // Remove leading/trailing whitespace
-    .replace(/\s+/g, '')            // Remove all spaces
-    .replace(/[^\w]/g, '');         // Remove special characters (keep alphanumeric only)
+    .replace(NON_WORD_CHARS, '');   // Remove spaces and special characters (keep alphanumeric only)
 }
 
 // ============================================================================
@@ -0,0 +1,75 @@
+/**
+ * ============================================================================
+ * JSON FILE CACHE
+ * ============================================================================
+ *
+ * Memoizes parsed JSON config files by modification time.
+ *
+ * boss_spawn_config.json is read by the boss timer, the intelligence engine
+ * and the spawn predictor (which re-reads it on every 6-hour re-learn). With
+ * this cache the file is parsed once and later reads cost a single stat()
+ * until the file actually changes on disk.
+ *
+ * Cached objects are shared between callers: treat them as read-only.
+ *
+ * @module utils/json-file-cache
+ * @author Elysium Attendance Bot Team
+ * @version 1.0
+ * ============================================================================
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+// Absolute path -> { mtimeMs, size, data }
+const parsedFiles = new Map();
+
+// ============================================================================
+// JSON LOADING
+// ============================================================================
+
+/**
+ * Read and parse a JSON file, reusing the previous result if the file's
+ * modification time and size are unchanged.
+ *
+ * @param {string} filePath - Path to the JSON file (relative paths resolve against cwd)
+ * @returns {*} Parsed JSON (shared; do not mutate)
+ * @throws {Error} If the file cannot be read or is not valid JSON
+ *
+ * @example
+ * const spawnConfig = readJsonCached(path.join(__dirname, 'boss_spawn_config.json'));
+ */
+function readJsonCached(filePath) {
+  const key = path.resolve(filePath);
+  const stat = fs.statSync(key);
+  const cached = parsedFiles.get(key);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    return cached.data;
+  }
+
+  const data = JSON.parse(fs.readFileSync(key, 'utf8'));
+  parsedFiles.set(key, { mtimeMs: stat.mtimeMs, size: stat.size, data });
+  return data;
+}
+
+/**
+ * Forget cached parses (all files, or just one).
+ *
+ * @param {string} [filePath] - File to forget; omit to clear everything
+ */
+function clearJsonCache(filePath) {
+  if (filePath === undefined) {
+    parsedFiles.clear();
+  } else {
+    parsedFiles.delete(path.resolve(filePath));
+  }
+}
+
+// ============================================================================
+// EXPORTS
+// ============================================================================
+
+module.exports = {
+  readJsonCached,
+  clearJsonCache,
+};
@@ -73,6 +73,12 @@ class PointsCache {
     // This allows O(1) case-insensitive lookups
     this.lowerCaseMap = new Map();
 
+    // Plain-object form, built lazily by toObject()
+    this.object = null;
+
+    // Serialized form, built lazily by toJSONString()
+    this.json = null;
+
     // Handle null/undefined input gracefully
     if (!pointsData) {
       return;
@@ -114,9 +120,10 @@ class PointsCache {
    * cache.getPoints("Unknown");  // 0 (not found)
    */
   getPoints(username) {
-    // Fast path: Try exact match first
-    if (this.data.has(username)) {
-      return this.data.get(username) || 0;
+    // Fast path: exact match with a single Map lookup (no separate has() probe)
+    const exact = this.data.get(username);
+    if (exact !== undefined) {
+      return exact || 0;
     }
 
     // Slow path: Case-insensitive lookup
@@ -232,6 +239,9 @@ class PointsCache {
    * Useful when you need to pass the data to functions that expect
    * the old object format.
    *
+   * The cache never changes after construction, so the object is built on
+   * first call and reused; treat it as read-only.
+   *
    * @method toObject
    * @returns {Object} Plain object mapping usernames to points
    *
@@ -240,11 +250,33 @@ class PointsCache {
    * const obj = cache.toObject(); // { "Player1": 100 }
    */
   toObject() {
-    const result = {};
-    for (const [name, points] of this.data) {
-      result[name] = points;
+    if (!this.object) {
+      this.object = {};
+      for (const [name, points] of this.data) {
+        this.object[name] = points;
+      }
+    }
+    return this.object;
+  }
+
+  /**
+   * Serialize the cache as a JSON object string.
+   *
+   * Built once per cache, like toObject(), so state saves can embed the
+   * points without re-stringifying tens of KB on every lock/unlock.
+   *
+   * @method toJSONString
+   * @returns {string} JSON text of toObject()
+   *
+   * @example
+   * const cache = new PointsCache({ "Player1": 100 });
+   * cache.toJSONString(); // '{"Player1":100}'
+   */
+  toJSONString() {
+    if (this.json === null) {
+      this.json = JSON.stringify(this.toObject());
     }
-    return result;
+    return this.json;
   }
 }
 
@@ -0,0 +1,103 @@
+/**
+ * ============================================================================
+ * ASYNC RATE LIMITER
+ * ============================================================================
+ *
+ * Sliding-window rate limiter for outbound Google Sheets webhook calls.
+ *
+ * Allows up to `maxRate` acquisitions in any `timePeriod` window. Callers
+ * under budget proceed immediately; once the window is full, callers wait
+ * until the oldest entry ages out. Waiters are served in FIFO order, so
+ * concurrent callers can no longer race on a shared "last call" timestamp.
+ *
+ * Intervals are measured with the monotonic performance clock, so wall-clock
+ * adjustments (NTP steps, manual clock changes) cannot stall or burst it.
+ *
+ * @module utils/rate-limiter
+ * @author Elysium Attendance Bot Team
+ * @version 1.0
+ * ============================================================================
+ */
+
+const { performance } = require('perf_hooks');
+
+// ============================================================================
+// RATE LIMITER CLASS
+// ============================================================================
+
+/**
+ * Sliding-window (leaky bucket) async rate limiter.
+ *
+ * @class RateLimiter
+ * @example
+ * const limiter = new RateLimiter(1, 3000); // 1 call per 3 seconds
+ * await limiter.acquire();
+ * await sheetAPI.call('checkColumn', data);
+ */
+class RateLimiter {
+  /**
+   * Create a new RateLimiter.
+   *
+   * @param {number} maxRate - Maximum acquisitions allowed per window
+   * @param {number} timePeriod - Window length in milliseconds
+   */
+  constructor(maxRate, timePeriod) {
+    this.maxRate = maxRate;
+    this.timePeriod = timePeriod;
+    this.timestamps = []; // Monotonic acquisition times inside the current window (oldest first)
+    this.tail = Promise.resolve(); // FIFO chain of waiting callers
+  }
+
+  /**
+   * Wait until a slot is available, then claim it.
+   *
+   * @returns {Promise<void>} Resolves once the caller may proceed
+   */
+  acquire() {
+    const slot = this.tail.then(() => this._claimSlot());
+    this.tail = slot.catch(() => {});
+    return slot;
+  }
+
+  /**
+   * Drop entries that have aged out of the window, sleeping if it is full.
+   *
+   * @private
+   * @returns {Promise<void>}
+   */
+  async _claimSlot() {
+    for (;;) {
+      const now = performance.now();
+      while (this.timestamps.length > 0 && now - this.timestamps[0] >= this.timePeriod) {
+        this.timestamps.shift();
+      }
+
+      if (this.timestamps.length < this.maxRate) {
+        this.timestamps.push(now);
+        return;
+      }
+
+      const waitTime = this.timePeriod - (now - this.timestamps[0]);
+      await new Promise((resolve) => setTimeout(resolve, waitTime));
+    }
+  }
+
+  /**
+   * Get the number of slots still free in the current window.
+   *
+   * @returns {number} Free slots (0 means the next caller will wait)
+   */
+  available() {
+    const now = performance.now();
+    const inWindow = this.timestamps.filter((t) => now - t < this.timePeriod).length;
+    return Math.max(0, this.maxRate - inWindow);
+  }
+}
+
+// ============================================================================
+// EXPORTS
+// ============================================================================
+
+module.exports = {
+  RateLimiter,
+};
@@ -13,6 +13,8 @@
  * - Request/response logging
  * - Performance metrics
  * - Circuit breaker pattern
+ * - Shared request pacing (honors Retry-After on 429)
+ * - Fails fast on non-retryable 4xx responses
  *
  * Performance Benefits:
  * - Eliminates 300+ lines of duplicate code
@@ -35,6 +37,10 @@ const DEFAULT_OPTIONS = {
   baseDelay: 3000, // 3 seconds (increased from 2)
   maxDelay: 45000, // 45 seconds (increased from 30)
   timeout: 60000,  // 60 seconds (increased from 30 for Koyeb stability)
+  connectTimeout: 10000, // 10 seconds to open a socket; a hung connect fails fast and is retried
+  headersTimeout: 60000, // 60 seconds for the response to start (covers Apps Script run time)
+  bodyTimeout: 15000,    // 15 seconds of silence while reading the body before giving up
+  maxConnections: 10,    // Cap on pooled sockets to the webhook host
   enableCircuitBreaker: true,
   // Rate limit specific settings
   rateLimitMaxRetries: 7, // More retries for rate limits (increased from 5)
@@ -71,6 +77,15 @@ const metrics = {
 // REQUEST THROTTLING
 // ============================================================================
 
+const { RateLimiter } = require('./rate-limiter');
+
+/**
+ * Process-wide pacing for webhook attempts (every SheetAPI instance and retry).
+ * The concurrency cap below bounds parallelism but not rate; Apps Script quotas
+ * are per minute, so bursts are smoothed here before they turn into HTTP 429s.
+ */
+const sheetRateLimiter = new RateLimiter(60, 60000); // 60 attempts per minute
+
 /**
  * Request queue for throttling concurrent API calls.
  * Prevents rate limiting (HTTP 429) by limiting concurrent requests.
@@ -132,6 +147,28 @@ function queueRequest(requestKey, executeRequest) {
   return promise;
 }
 
+// ============================================================================
+// HTTP TRANSPORT
+// ============================================================================
+
+/**
+ * Cached dynamic import of undici (resolved once per process).
+ * @type {Promise<Object>|null}
+ */
+let undiciModule = null;
+
+/**
+ * Load undici once and reuse the resolved module for every request.
+ *
+ * @returns {Promise<Object>} undici module exports
+ */
+function loadUndici() {
+  if (!undiciModule) {
+    undiciModule = import("undici");
+  }
+  return undiciModule;
+}
+
 // ============================================================================
 // HELPER FUNCTIONS
 // ============================================================================
@@ -223,6 +260,14 @@ function recordFailure() {
 // MAIN API CLIENT CLASS
 // ============================================================================
 
+/**
+ * Keep-alive connection pools shared across SheetAPI instances, keyed by agent
+ * settings. Each entry tracks the clients using it so close() only tears the
+ * pool down when the last one lets go.
+ * @type {Map<string, {agent: Agent, users: Set<SheetAPI>}>}
+ */
+const sharedAgents = new Map();
+
 /**
  * Unified Google Sheets API client.
  *
@@ -244,6 +289,80 @@ class SheetAPI {
   constructor(webhookUrl, options = {}) {
     this.webhookUrl = webhookUrl;
     this.options = { ...DEFAULT_OPTIONS, ...options };
+    this.agent = null; // Lazily acquired keep-alive connection pool (see _getAgent)
+    this.agentKey = null; // sharedAgents key for this.agent
+  }
+
+  /**
+   * Get the shared undici Agent for this client, creating it on first use.
+   *
+   * The agent owns the connection pool, so reusing it keeps the TCP/TLS
+   * connection to the webhook warm instead of handshaking on every call.
+   * Every module posts to the same Apps Script webhook, so instances with the
+   * same agent settings share one pool (see sharedAgents).
+   *
+   * @private
+   * @returns {Promise<Agent>} undici dispatcher
+   */
+  async _getAgent() {
+    if (this.agent && !this.agent.destroyed && !this.agent.closed) {
+      return this.agent;
+    }
+
+    const { Agent } = await loadUndici();
+    const key = [
+      this.options.connectTimeout,
+      this.options.headersTimeout,
+      this.options.bodyTimeout,
+      this.options.maxConnections,
+    ].join(':');
+
+    let entry = sharedAgents.get(key);
+    if (!entry || entry.agent.destroyed || entry.agent.closed) {
+      // Separate connect/headers/body deadlines: a stalled socket fails fast and
+      // is retried instead of holding the rate-limited queue for the full timeout,
+      // while slow Apps Script executions still get the long headers window
+      const agent = new Agent({
+        connect: {
+          timeout: this.options.connectTimeout,
+        },
+        headersTimeout: this.options.headersTimeout,
+        bodyTimeout: this.options.bodyTimeout,
+        connections: this.options.maxConnections,
+        keepAliveTimeout: 10000, // Keep connections alive for reuse
+        keepAliveMaxTimeout: 30000,
+      });
+      entry = { agent, users: new Set() };
+      sharedAgents.set(key, entry);
+    }
+
+    entry.users.add(this);
+    this.agent = entry.agent;
+    this.agentKey = key;
+    return this.agent;
+  }
+
+  /**
+   * Release this client's hold on the connection pool (call on shutdown).
+   * The shared pool is closed once no other client is using it.
+   *
+   * @returns {Promise<void>}
+   */
+  async close() {
+    const agent = this.agent;
+    this.agent = null;
+    if (!agent) return;
+
+    const entry = sharedAgents.get(this.agentKey);
+    if (entry && entry.agent === agent) {
+      entry.users.delete(this);
+      if (entry.users.size > 0) return;
+      sharedAgents.delete(this.agentKey);
+    }
+
+    if (!agent.closed && !agent.destroyed) {
+      await agent.close().catch(() => {});
+    }
   }
 
   /**
@@ -281,32 +400,21 @@ class SheetAPI {
       throw error;
     }
 
-    // Create unique key for request deduplication
-    const requestKey = `${action}:${JSON.stringify(data)}`;
+    // Serialize once: the body doubles as the deduplication key and is reused on retries
+    const body = JSON.stringify({ action, ...data });
 
     // Queue the request to limit concurrent calls
-    return queueRequest(requestKey, () => this._executeCall(action, data, options));
+    return queueRequest(body, () => this._executeCall(action, body, options));
   }
 
   /**
    * Internal method to execute the actual API call
    * @private
    */
-  async _executeCall(action, data, options) {
+  async _executeCall(action, body, options) {
     const startTime = Date.now();
-    const { fetch, Agent } = await import("undici");
-
-    // Custom agent with longer connect timeout (60s) and body/headers timeouts
-    // This prevents ConnectTimeoutError on unstable networks like Koyeb
-    const agent = new Agent({
-      connect: {
-        timeout: 60000, // 60 seconds (increased from 30s for Koyeb stability)
-      },
-      bodyTimeout: 60000,    // 60 seconds for reading response body
-      headersTimeout: 60000, // 60 seconds for receiving response headers
-      keepAliveTimeout: 10000, // Keep connections alive for reuse
-      keepAliveMaxTimeout: 30000,
-    });
+    const { fetch } = await loadUndici();
+    const agent = await this._getAgent();
 
     metrics.totalRequests++;
 
@@ -326,22 +434,38 @@ class SheetAPI {
       try {
         if (isRateLimited) rateLimitAttempts++; else normalAttempts++;
 
+        // Pace every attempt, retries included, against the shared quota
+        await sheetRateLimiter.acquire();
+
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), options.timeout);
 
         const response = await fetch(this.webhookUrl, {
           method: "POST",
           headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({ action, ...data }),
+          body,
           signal: controller.signal,
-          dispatcher: agent, // use custom agent with longer connect timeout
+          dispatcher: agent, // pooled keep-alive agent with per-phase timeouts
         });
 
         clearTimeout(timeoutId);
 
-        if (!response.ok) throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        if (!response.ok) {
+          // Include the body so webhook-side failures are visible in the logs
+          const errorBody = await response.text().catch(() => '');
+          const httpError = new Error(`HTTP ${response.status}: ${response.statusText}${errorBody ? ` - ${errorBody.slice(0, 200)}` : ''}`);
+          httpError.status = response.status;
+          // Honor the server's Retry-After (seconds) when it sends one
+          const retryAfter = Number(response.headers.get('retry-after'));
+          if (retryAfter > 0) httpError.retryAfterMs = retryAfter * 1000;
+          throw httpError;
+        }
 
-        const result = await response.json();
+        // Decode straight from the body stream; an HTML error page from Apps Script
+        // surfaces as a clear message instead of a bare SyntaxError
+        const result = await response.json().catch((parseErr) => {
+          throw new Error(`Invalid JSON response for ${action}: ${parseErr.message}`);
+        });
         if (result.status === "error") throw new Error(result.message || "Sheet operation failed");
 
         const duration = Date.now() - startTime;
@@ -357,6 +481,7 @@ class SheetAPI {
         const transientErrors = [
           "UND_ERR_CONNECT_TIMEOUT",
           "UND_ERR_HEADERS_TIMEOUT",
+          "UND_ERR_BODY_TIMEOUT",
           "UND_ERR_SOCKET",
           "ECONNRESET",
           "ECONNREFUSED",
@@ -371,7 +496,15 @@ class SheetAPI {
           code => errorCode.includes(code) || errorMessage.includes(code)
         );
         const isRateLimitError =
-          errorMessage.includes("HTTP 429") || errorMessage.includes("Too Many Requests");
+          error.status === 429 || errorMessage.includes("Too Many Requests");
+
+        // Other 4xx responses (bad URL, auth, payload) fail the same way on every
+        // attempt, so give up now instead of burning the whole backoff schedule
+        if (error.status >= 400 && error.status < 500 && error.status !== 408 && !isRateLimitError) {
+          console.error(`❌ API error on ${action}: ${errorMessage} (not retried)`);
+          recordFailure();
+          throw error;
+        }
 
         if (isRateLimitError && !isRateLimited) {
           isRateLimited = true;
@@ -388,7 +521,10 @@ class SheetAPI {
         const attemptForBackoff = isRateLimited ? rateLimitAttempts : normalAttempts;
         const baseDelay = isRateLimited ? options.rateLimitBaseDelay : options.baseDelay;
         const maxDelay = isRateLimited ? options.rateLimitMaxDelay : options.maxDelay;
-        const delay = calculateBackoff(attemptForBackoff, baseDelay, maxDelay, isRateLimited);
+        const delay = Math.min(
+          Math.max(calculateBackoff(attemptForBackoff, baseDelay, maxDelay, isRateLimited), error.retryAfterMs || 0),
+          maxDelay
+        );
 
         console.log(`⏳ Waiting ${Math.round(delay / 1000)}s before retry (${attemptForBackoff + 1}/${maxRetries})...`);
         await sleep(delay);
@@ -558,12 +694,31 @@ class SheetAPI {
   }
 }
 
+/**
+ * Close every shared connection pool, whichever clients still hold them.
+ * For process shutdown: modules that never call close() would otherwise keep
+ * the pool (and its keep-alive sockets) open until exit.
+ *
+ * @returns {Promise<void>}
+ */
+async function closeAllSheetConnections() {
+  const entries = [...sharedAgents.values()];
+  sharedAgents.clear();
+  await Promise.all(entries.map(async ({ agent, users }) => {
+    for (const user of users) user.agent = null;
+    if (!agent.closed && !agent.destroyed) {
+      await agent.close().catch(() => {});
+    }
+  }));
+}
+
 // ============================================================================
 // MODULE EXPORTS
 // ============================================================================
 
 module.exports = {
   SheetAPI,
+  closeAllSheetConnections,
   calculateBackoff, // Export for testing
   metrics, // Export for monitoring
   circuitBreaker, // Export for monitoring
@@ -28,6 +28,20 @@ let cachedManilaTime = null;
 let cacheTimestamp = 0;
 const CACHE_TTL_MS = 1000; // Cache for 1 second
 
+// Manila formatter built once; toLocaleString() with a timeZone option
+// constructs a new Intl.DateTimeFormat on every call. hourCycle h23 keeps
+// midnight as "00" so the output parses exactly like toLocaleString("en-US").
+const MANILA_FORMATTER = new Intl.DateTimeFormat("en-US", {
+  timeZone: "Asia/Manila",
+  year: "numeric",
+  month: "numeric",
+  day: "numeric",
+  hour: "numeric",
+  minute: "numeric",
+  second: "numeric",
+  hourCycle: "h23",
+});
+
 /**
  * Get Manila timezone time with 1-second caching.
  *
@@ -36,7 +50,7 @@ const CACHE_TTL_MS = 1000; // Cache for 1 second
  * second will use the cached value.
  *
  * PERFORMANCE:
- * - First call in second: ~0.5-1ms (toLocaleString conversion)
+ * - First call in second: one format() on the shared Manila formatter
  * - Subsequent calls: ~0.01ms (cache hit)
  * - 50-100x speedup for cached calls
  *
@@ -64,10 +78,8 @@ function getManilaTime(date = null) {
     return new Date(cachedManilaTime.getTime() + elapsed);
   }
 
-  // Cache miss - perform expensive timezone conversion
-  const manilaTime = new Date(
-    now.toLocaleString("en-US", { timeZone: "Asia/Manila" })
-  );
+  // Cache miss - perform timezone conversion with the shared formatter
+  const manilaTime = new Date(MANILA_FORMATTER.format(now));
 
   // Update cache
   cachedManilaTime = manilaTime;